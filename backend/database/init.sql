@@ -42,11 +42,17 @@ CREATE TABLE game_configurations (
     special_bar_max INTEGER NOT NULL DEFAULT 10,
     special_ball_damage INTEGER NOT NULL DEFAULT 3,
     
-    created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+    created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+
+    -- Un nom par configuration (l'upsert par nom en dépend) ; sert aussi d'index sur le nom
+    CONSTRAINT uq_config_name UNIQUE (name)
 );
 
--- Ajouter un index sur le nom
-CREATE INDEX idx_config_name ON game_configurations(name);
+-- Migration d'une base existante (ancien index simple, doublons possibles) :
+--   DELETE FROM game_configurations a USING game_configurations b
+--       WHERE a.name = b.name AND a.id < b.id;  -- garde la plus récente de chaque nom
+--   DROP INDEX IF EXISTS idx_config_name;
+--   ALTER TABLE game_configurations ADD CONSTRAINT uq_config_name UNIQUE (name);
 
 -- Insérer quelques configurations par défaut
 INSERT INTO game_configurations (
@@ -8,7 +8,8 @@ import java.util.Date;
  * Entité JPA représentant une configuration de jeu.
  */
 @Entity
-@Table(name = "game_configurations")
+@Table(name = "game_configurations",
+       uniqueConstraints = @UniqueConstraint(name = "uq_config_name", columnNames = "name"))
 @NamedQueries({
     @NamedQuery(
         name = "GameConfiguration.findAll",
@@ -266,6 +267,17 @@ public class GameConfiguration implements Serializable {
         this.createdAt = createdAt;
     }
     
+    /**
+     * Valeurs de tous les champs, utilisées pour calculer l'ETag des réponses REST.
+     */
+    public String contentKey() {
+        return id + "|" + name + "|" + ballSpeed + "|" + ballDamage + "|" + boardWidth + "|" + startingPlayer
+                + "|" + roiLives + "|" + reineLives + "|" + fouLives + "|" + tourLives + "|" + chevalierLives
+                + "|" + pionLives + "|" + roiPoints + "|" + reinePoints + "|" + fouPoints + "|" + tourPoints
+                + "|" + chevalierPoints + "|" + pionPoints + "|" + specialBarMax + "|" + specialBallDamage
+                + "|" + (createdAt == null ? "" : createdAt.getTime());
+    }
+    
     @Override
     public String toString() {
         return "GameConfiguration{" +
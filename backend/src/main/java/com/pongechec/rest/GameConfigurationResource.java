@@ -4,37 +4,144 @@ import com.pongechec.entity.GameConfiguration;
 import com.pongechec.service.GameConfigurationService;
 import jakarta.ejb.EJB;
 import jakarta.ws.rs.*;
+import jakarta.ws.rs.core.Context;
+import jakarta.ws.rs.core.EntityTag;
 import jakarta.ws.rs.core.MediaType;
+import jakarta.ws.rs.core.Request;
 import jakarta.ws.rs.core.Response;
+import java.nio.charset.StandardCharsets;
+import java.security.MessageDigest;
+import java.security.NoSuchAlgorithmException;
+import java.sql.SQLException;
+import java.util.ArrayList;
+import java.util.Collections;
+import java.util.LinkedHashMap;
 import java.util.List;
+import java.util.Map;
+import java.util.function.Function;
 
 /**
  * REST API pour gérer les configurations de jeu.
  * 
  * Endpoints disponibles :
  * - GET    /api/configurations       : Liste toutes les configurations
+ *          ?limit=N&cursor=ID&name=TEXTE&fields=id,name,... : page {items, nextCursor}
  * - GET    /api/configurations/{id}  : Récupère une configuration
  * - POST   /api/configurations       : Crée une nouvelle configuration
  * - PUT    /api/configurations/{id}  : Met à jour une configuration
+ * - PUT    /api/configurations/by-name/{name} : Crée ou met à jour la configuration de ce nom
  * - DELETE /api/configurations/{id}  : Supprime une configuration
+ *
+ * Les GET renvoient un ETag calculé sur le contenu : un client qui renvoie
+ * If-None-Match avec la même valeur reçoit 304 Not Modified, sans corps.
+ *
+ * Les noms sont uniques : POST (ou PUT par id) avec un nom déjà pris renvoie
+ * 409 Conflict.
  */
 @Path("/configurations")
 @Produces(MediaType.APPLICATION_JSON)
 @Consumes(MediaType.APPLICATION_JSON)
 public class GameConfigurationResource {
     
+    /** SQLSTATE d'une violation de contrainte d'unicité (PostgreSQL). */
+    private static final String UNIQUE_VIOLATION = "23505";
+    
+    /** Taille de page maximale acceptée pour le paramètre limit. */
+    private static final int MAX_PAGE_SIZE = 500;
+    
+    /** Champs sélectionnables avec le paramètre fields (noms JSON). */
+    private static final Map<String, Function<GameConfiguration, Object>> FIELDS = new LinkedHashMap<>();
+    static {
+        FIELDS.put("id", GameConfiguration::getId);
+        FIELDS.put("name", GameConfiguration::getName);
+        FIELDS.put("ballSpeed", GameConfiguration::getBallSpeed);
+        FIELDS.put("ballDamage", GameConfiguration::getBallDamage);
+        FIELDS.put("boardWidth", GameConfiguration::getBoardWidth);
+        FIELDS.put("startingPlayer", GameConfiguration::getStartingPlayer);
+        FIELDS.put("roiLives", GameConfiguration::getRoiLives);
+        FIELDS.put("reineLives", GameConfiguration::getReineLives);
+        FIELDS.put("fouLives", GameConfiguration::getFouLives);
+        FIELDS.put("tourLives", GameConfiguration::getTourLives);
+        FIELDS.put("chevalierLives", GameConfiguration::getChevalierLives);
+        FIELDS.put("pionLives", GameConfiguration::getPionLives);
+        FIELDS.put("roiPoints", GameConfiguration::getRoiPoints);
+        FIELDS.put("reinePoints", GameConfiguration::getReinePoints);
+        FIELDS.put("fouPoints", GameConfiguration::getFouPoints);
+        FIELDS.put("tourPoints", GameConfiguration::getTourPoints);
+        FIELDS.put("chevalierPoints", GameConfiguration::getChevalierPoints);
+        FIELDS.put("pionPoints", GameConfiguration::getPionPoints);
+        FIELDS.put("specialBarMax", GameConfiguration::getSpecialBarMax);
+        FIELDS.put("specialBallDamage", GameConfiguration::getSpecialBallDamage);
+        FIELDS.put("createdAt", GameConfiguration::getCreatedAt);
+    }
+    
     @EJB
     private GameConfigurationService configService;
     
     /**
      * GET /api/configurations
-     * Récupère toutes les configurations.
+     * Récupère toutes les configurations (tableau JSON, comme avant).
+     * 
+     * Avec limit, renvoie une page {"items": [...], "nextCursor": id ou null}, de la plus
+     * récente à la plus ancienne ; la page suivante s'obtient avec cursor=nextCursor.
+     * name filtre les noms contenant ce texte, fields (ex: "id,name") ne renvoie que ces champs.
      */
     @GET
-    public Response getAllConfigurations() {
+    public Response getAllConfigurations(@QueryParam("limit") Integer limit,
+                                         @QueryParam("cursor") Long cursor,
+                                         @QueryParam("name") String name,
+                                         @QueryParam("fields") String fields,
+                                         @Context Request request) {
         try {
-            List<GameConfiguration> configs = configService.getAllConfigurations();
-            return Response.ok(configs).build();
+            List<String> projection = null;
+            if (fields != null && !fields.trim().isEmpty()) {
+                projection = new ArrayList<>();
+                for (String field : fields.split(",")) {
+                    field = field.trim();
+                    if (!FIELDS.containsKey(field)) {
+                        return Response.status(Response.Status.BAD_REQUEST)
+                                .entity("{\"error\": \"Unknown field: " + field + "\"}")
+                                .build();
+                    }
+                    projection.add(field);
+                }
+            }
+            if (limit != null && (limit < 1 || limit > MAX_PAGE_SIZE)) {
+                return Response.status(Response.Status.BAD_REQUEST)
+                        .entity("{\"error\": \"limit must be between 1 and " + MAX_PAGE_SIZE + "\"}")
+                        .build();
+            }
+            
+            List<GameConfiguration> configs;
+            if (limit == null && cursor == null && name == null) {
+                configs = configService.getAllConfigurations();
+            } else {
+                // One extra row tells whether there is a next page
+                configs = configService.findPage(cursor, name, limit == null ? null : limit + 1);
+            }
+            
+            boolean hasMore = limit != null && configs.size() > limit;
+            List<GameConfiguration> items = hasMore ? configs.subList(0, limit) : configs;
+            Long nextCursor = hasMore ? items.get(items.size() - 1).getId() : null;
+            
+            // Le tag couvre la représentation envoyée : lignes de la page, forme (liste ou
+            // page et son curseur suivant) et projection
+            String variant = (limit == null ? "list" : "page;next=" + nextCursor)
+                    + ";fields=" + (projection == null ? "*" : String.join(",", projection));
+            EntityTag tag = entityTag(items, variant);
+            Response.ResponseBuilder notModified = request.evaluatePreconditions(tag);
+            if (notModified != null) {
+                return notModified.tag(tag).build();
+            }
+            
+            Object body = projection == null ? items : project(items, projection);
+            if (limit == null) {
+                return Response.ok(body).tag(tag).build();
+            }
+            Map<String, Object> page = new LinkedHashMap<>();
+            page.put("items", body);
+            page.put("nextCursor", nextCursor);
+            return Response.ok(page).tag(tag).build();
         } catch (Exception e) {
             return Response.status(Response.Status.INTERNAL_SERVER_ERROR)
                     .entity("{\"error\": \"" + e.getMessage() + "\"}")
@@ -48,7 +155,7 @@ public class GameConfigurationResource {
      */
     @GET
     @Path("/{id}")
-    public Response getConfiguration(@PathParam("id") Long id) {
+    public Response getConfiguration(@PathParam("id") Long id, @Context Request request) {
         try {
             GameConfiguration config = configService.getConfiguration(id);
             if (config == null) {
@@ -56,7 +163,12 @@ public class GameConfigurationResource {
                         .entity("{\"error\": \"Configuration not found\"}")
                         .build();
             }
-            return Response.ok(config).build();
+            EntityTag tag = entityTag(Collections.singletonList(config));
+            Response.ResponseBuilder notModified = request.evaluatePreconditions(tag);
+            if (notModified != null) {
+                return notModified.tag(tag).build();
+            }
+            return Response.ok(config).tag(tag).build();
         } catch (Exception e) {
             return Response.status(Response.Status.INTERNAL_SERVER_ERROR)
                     .entity("{\"error\": \"" + e.getMessage() + "\"}")
@@ -81,6 +193,9 @@ public class GameConfigurationResource {
             GameConfiguration created = configService.createConfiguration(config);
             return Response.status(Response.Status.CREATED).entity(created).build();
         } catch (Exception e) {
+            if (isUniqueViolation(e)) {
+                return nameTaken();
+            }
             return Response.status(Response.Status.INTERNAL_SERVER_ERROR)
                     .entity("{\"error\": \"" + e.getMessage() + "\"}")
                     .build();
@@ -106,6 +221,56 @@ public class GameConfigurationResource {
             config.setCreatedAt(existing.getCreatedAt()); // Conserver la date de création
             GameConfiguration updated = configService.updateConfiguration(config);
             return Response.ok(updated).build();
+        } catch (Exception e) {
+            if (isUniqueViolation(e)) {
+                return nameTaken();
+            }
+            return Response.status(Response.Status.INTERNAL_SERVER_ERROR)
+                    .entity("{\"error\": \"" + e.getMessage() + "\"}")
+                    .build();
+        }
+    }
+    
+    /**
+     * PUT /api/configurations/by-name/{name}
+     * Crée la configuration portant ce nom, ou la met à jour si elle existe (upsert).
+     * Si une requête concurrente crée le même nom entre la recherche et l'insertion,
+     * la contrainte d'unicité rejette l'insertion et la configuration créée par
+     * l'autre requête est mise à jour à la place.
+     */
+    @PUT
+    @Path("/by-name/{name}")
+    public Response upsertConfiguration(@PathParam("name") String name, GameConfiguration config) {
+        try {
+            if (name == null || name.trim().isEmpty()) {
+                return Response.status(Response.Status.BAD_REQUEST)
+                        .entity("{\"error\": \"Name is required\"}")
+                        .build();
+            }
+            
+            config.setName(name);
+            GameConfiguration existing = configService.findByName(name);
+            if (existing == null) {
+                config.setId(null);
+                try {
+                    GameConfiguration created = configService.createConfiguration(config);
+                    return Response.status(Response.Status.CREATED).entity(created).build();
+                } catch (Exception e) {
+                    if (!isUniqueViolation(e)) {
+                        throw e;
+                    }
+                }
+                // Perdu la course contre une autre création : mettre à jour celle-ci
+                existing = configService.findByName(name);
+                if (existing == null) {
+                    return nameTaken();
+                }
+            }
+            
+            config.setId(existing.getId());
+            config.setCreatedAt(existing.getCreatedAt()); // Conserver la date de création
+            GameConfiguration updated = configService.updateConfiguration(config);
+            return Response.ok(updated).build();
         } catch (Exception e) {
             return Response.status(Response.Status.INTERNAL_SERVER_ERROR)
                     .entity("{\"error\": \"" + e.getMessage() + "\"}")
@@ -136,4 +301,69 @@ public class GameConfigurationResource {
                     .build();
         }
     }
+    
+    /**
+     * Vrai si l'exception (ou l'une de ses causes) vient de la contrainte d'unicité sur le nom.
+     */
+    private static boolean isUniqueViolation(Throwable e) {
+        for (Throwable cause = e; cause != null; cause = cause.getCause()) {
+            if (cause instanceof SQLException
+                    && UNIQUE_VIOLATION.equals(((SQLException) cause).getSQLState())) {
+                return true;
+            }
+        }
+        return false;
+    }
+    
+    private static Response nameTaken() {
+        return Response.status(Response.Status.CONFLICT)
+                .entity("{\"error\": \"A configuration with this name already exists\"}")
+                .build();
+    }
+    
+    /**
+     * Ne garde que les champs demandés de chaque configuration.
+     */
+    private static List<Map<String, Object>> project(List<GameConfiguration> configs, List<String> fields) {
+        List<Map<String, Object>> projected = new ArrayList<>(configs.size());
+        for (GameConfiguration config : configs) {
+            Map<String, Object> values = new LinkedHashMap<>();
+            for (String field : fields) {
+                values.put(field, FIELDS.get(field).apply(config));
+            }
+            projected.add(values);
+        }
+        return projected;
+    }
+    
+    /**
+     * ETag fort : empreinte SHA-256 (tronquée) du contenu des configurations.
+     */
+    private static EntityTag entityTag(List<GameConfiguration> configs) {
+        return entityTag(configs, "");
+    }
+    
+    /**
+     * ETag fort sur le contenu et la représentation (variant : forme de la réponse,
+     * champs projetés), pour qu'un 304 ne valide jamais une autre représentation.
+     */
+    private static EntityTag entityTag(List<GameConfiguration> configs, String variant) {
+        try {
+            MessageDigest digest = MessageDigest.getInstance("SHA-256");
+            digest.update(variant.getBytes(StandardCharsets.UTF_8));
+            digest.update((byte) '\n');
+            for (GameConfiguration config : configs) {
+                digest.update(config.contentKey().getBytes(StandardCharsets.UTF_8));
+                digest.update((byte) '\n');
+            }
+            StringBuilder hex = new StringBuilder();
+            byte[] hash = digest.digest();
+            for (int i = 0; i < 16; i++) {
+                hex.append(String.format("%02x", hash[i]));
+            }
+            return new EntityTag(hex.toString());
+        } catch (NoSuchAlgorithmException e) {
+            throw new IllegalStateException(e);
+        }
+    }
 }
@@ -4,6 +4,7 @@ import com.pongechec.entity.GameConfiguration;
 import jakarta.ejb.Stateless;
 import jakarta.persistence.EntityManager;
 import jakarta.persistence.PersistenceContext;
+import jakarta.persistence.TypedQuery;
 import java.util.List;
 
 /**
@@ -39,6 +40,37 @@ public class GameConfigurationService {
                  .getResultList();
     }
     
+    /**
+     * Page de configurations, de la plus récente (id le plus grand) à la plus ancienne.
+     * 
+     * @param cursor Si non null, seulement les configurations d'id inférieur (id de la fin de la page précédente)
+     * @param name   Si non null, seulement les noms contenant ce texte (sans tenir compte de la casse)
+     * @param limit  Nombre maximum de résultats, ou null pour tous
+     */
+    public List<GameConfiguration> findPage(Long cursor, String name, Integer limit) {
+        StringBuilder jpql = new StringBuilder("SELECT c FROM GameConfiguration c WHERE 1 = 1");
+        if (cursor != null) {
+            jpql.append(" AND c.id < :cursor");
+        }
+        if (name != null) {
+            jpql.append(" AND LOWER(c.name) LIKE :name ESCAPE '\\'");
+        }
+        jpql.append(" ORDER BY c.id DESC");
+        
+        TypedQuery<GameConfiguration> query = em.createQuery(jpql.toString(), GameConfiguration.class);
+        if (cursor != null) {
+            query.setParameter("cursor", cursor);
+        }
+        if (name != null) {
+            String escaped = name.toLowerCase().replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_");
+            query.setParameter("name", "%" + escaped + "%");
+        }
+        if (limit != null) {
+            query.setMaxResults(limit);
+        }
+        return query.getResultList();
+    }
+    
     /**
      * Met à jour une configuration existante.
      */
@@ -3,6 +3,8 @@ import sys
 from typing import Dict, Any
 from paddle_chess_game import settings
 from paddle_chess_game.services.config_service import ConfigurationService
+from paddle_chess_game.utils import display
+from paddle_chess_game.utils.text import get_font, render_text
 
 
 class ConfigMenu:
@@ -17,21 +19,33 @@ class ConfigMenu:
     BUTTON_BG = (60, 160, 80)
     BUTTON_HOVER = (80, 180, 100)
     SERVER_BTN_BG = (70, 130, 180)
+    FONT_NAME = "Segoe UI"
+    # Mode Singleton: the menu saves and loads this one configuration by name
+    CONFIG_NAME = "Configuration Standard"
     
     def __init__(self, screen: pygame.Surface):
         self.screen = screen
         self.width = screen.get_width()
         self.height = screen.get_height()
         
-        self.font = pygame.font.SysFont("Segoe UI", 24)
-        self.title_font = pygame.font.SysFont("Segoe UI", 48, bold=True)
-        self.small_font = pygame.font.SysFont("Segoe UI", 18)
+        self.font = get_font(self.FONT_NAME, 24)
+        self.title_font = get_font(self.FONT_NAME, 48, bold=True)
+        self.small_font = get_font(self.FONT_NAME, 18)
+        self._start_label = None  # Scaled "JOUER" label, built on first draw
         
         # Backend Service
-        self.config_service = ConfigurationService("http://localhost:8080/pongechec/api")
+        self.config_service = ConfigurationService("http://localhost:8080/pongechec/api",
+                                                   cache_path=settings.CONFIG_CACHE_PATH,
+                                                   cache_ttl=settings.CONFIG_CACHE_TTL)
+        # Revalidate the cache now so "Charger" answers without waiting on the network
+        self.config_service.refresh_in_background()
         self.server_configs = []
         self.status_message = ""
         self.status_timer = 0
+        # Backend request in flight: (kind, future, generation). Its result is dropped
+        # if the generation changed meanwhile (a field was edited, or the menu closed)
+        self._pending = None
+        self._generation = 0
         
         # Configuration values (default from settings)
         self.config = {
@@ -168,7 +182,7 @@ class ConfigMenu:
                     self.input_text += event.unicode
                     
         if event.type == pygame.MOUSEBUTTONDOWN:
-            mouse_pos = pygame.mouse.get_pos()
+            mouse_pos = display.get_mouse_pos()
             
             # Save current field before switching
             if self.selected_field:
@@ -176,6 +190,7 @@ class ConfigMenu:
             
             # Check Buttons
             if self.start_btn_rect.collidepoint(mouse_pos):
+                self._cancel_pending()
                 return True
             if self.load_btn_rect.collidepoint(mouse_pos):
                 self._load_from_server()
@@ -194,37 +209,100 @@ class ConfigMenu:
                     
         return False
 
+    @property
+    def busy(self) -> bool:
+        """A load or save is in flight (the menu animates its loading indicator)."""
+        return self._pending is not None
+
+    def _start_request(self, kind: str, work, *args):
+        # One request at a time; clicks while busy are ignored
+        if self._pending is None:
+            self._pending = (kind, self.config_service.submit(work, *args), self._generation)
+
+    def _cancel_pending(self):
+        if self._pending is not None:
+            self._pending[1].cancel()  # Only stops it if it hasn't started; the result is dropped anyway
+            self._pending = None
+        self._generation += 1
+
+    def _poll_pending(self):
+        """Apply the result of a finished request, on the pygame thread."""
+        if self._pending is None or not self._pending[1].done():
+            return
+        kind, future, generation = self._pending
+        self._pending = None
+        try:
+            result = future.result()
+        except Exception as e:
+            print(f"Erreur de communication avec le backend: {e}")
+            self.status_message = "Erreur: Backend inaccessible!"
+            self.status_timer = pygame.time.get_ticks() + 3000
+            return
+        if kind == "load":
+            self._finish_load(result, current=generation == self._generation)
+        else:
+            self._finish_save(result, current=generation == self._generation)
+
     def _load_from_server(self):
-        if self.config_service.test_connection():
-            self.server_configs = self.config_service.get_all_configurations()
-            if self.server_configs:
-                # Mode Singleton: On charge directement la première configuration
-                config = self.server_configs[0]
-                self._apply_config(config)
-                self.status_message = f"Configuration chargée!"
+        self._start_request("load", self._fetch_configs)
+
+    def _fetch_configs(self):
+        """Executor thread: (configs, served offline from cache, backend reachable)."""
+        # Served from the cache when it is fresh, or when the backend is unreachable;
+        # offline comes with this call's result, not from state the refresh task also writes
+        configs, offline = self.config_service.fetch_all_configurations()
+        reachable = bool(configs) or (not offline and self.config_service.test_connection())
+        return configs, offline, reachable
+
+    def _finish_load(self, result, current: bool):
+        if not current:
+            return  # Fields were edited while loading: keep the player's values
+        configs, offline, reachable = result
+        self.server_configs = configs
+        # Mode Singleton: the configuration saved under CONFIG_NAME, whatever else is stored
+        config = next((c for c in configs if c.get('name') == self.CONFIG_NAME), None)
+        if config is not None:
+            self._apply_config(config)
+            if offline:
+                self.status_message = "Configuration chargée (hors ligne)"
             else:
-                self.status_message = "Aucune configuration trouvée."
-        else:
+                self.status_message = f"Configuration chargée!"
+        elif not reachable:
             self.status_message = "Erreur: Backend inaccessible!"
+        else:
+            self.status_message = "Aucune configuration trouvée."
         self.status_timer = pygame.time.get_ticks() + 3000
 
     def _save_to_server(self):
-        if self.config_service.test_connection():
-            # Mode Singleton: On garde un nom fixe
-            name = "Configuration Standard"
-            result = self.config_service.save_configuration(self.config, name)
-            if result:
-                self.status_message = "Configuration sauvegardée!"
-            else:
-                self.status_message = "Erreur lors de la sauvegarde."
-        else:
+        # Mode Singleton: On garde un nom fixe
+        self._start_request("save", self._store_config, self.config.copy(), self.CONFIG_NAME)
+
+    def _store_config(self, config, name):
+        """Executor thread: (saved config or None, backend reachable)."""
+        result = self.config_service.save_configuration(config, name)
+        return result, result is not None or self.config_service.test_connection()
+
+    def _finish_save(self, result, current: bool):
+        saved, reachable = result
+        if saved:
+            if current:
+                # Only link the menu to the server copy if it still holds the saved values
+                self._apply_config(saved)
+            self.status_message = "Configuration sauvegardée!"
+        elif not reachable:
             self.status_message = "Erreur: Backend inaccessible!"
+        else:
+            self.status_message = "Erreur lors de la sauvegarde."
         self.status_timer = pygame.time.get_ticks() + 3000
 
     def _apply_config(self, config):
         for key in self.config:
             if key in config:
                 self.config[key] = config[key]
+        # Server identity, recorded with each match in the history
+        for key in ('id', 'name'):
+            if key in config:
+                self.config[key] = config[key]
 
     def _save_current_field(self):
         if self.selected_field and self.input_text:
@@ -232,15 +310,21 @@ class ConfigMenu:
                 value = int(self.input_text)
                 meta = self.fields_meta[self.selected_field]
                 value = max(meta['min'], min(meta['max'], value))
+                if value != self.config[self.selected_field]:
+                    # No longer the configuration stored on the server
+                    self.config.pop('id', None)
+                    self.config.pop('name', None)
+                    self._generation += 1
                 self.config[self.selected_field] = value
             except ValueError:
                 pass
 
     def draw(self):
+        self._poll_pending()
         self.screen.fill(self.BG_COLOR)
         
         # Title
-        title = self.title_font.render("CONFIGURATION DU JEU", True, self.TEXT_COLOR)
+        title = render_text("CONFIGURATION DU JEU", self.TEXT_COLOR, 48, self.FONT_NAME, bold=True)
         self.screen.blit(title, title.get_rect(center=(self.width // 2, 50)))
         
         # Draw Fields
@@ -249,7 +333,7 @@ class ConfigMenu:
             rect = element['input_rect']
             
             # Label
-            label = self.font.render(self.fields_meta[key]['label'], True, self.TEXT_COLOR)
+            label = render_text(self.fields_meta[key]['label'], self.TEXT_COLOR, 24, self.FONT_NAME)
             self.screen.blit(label, label_pos)
             
             # Input Box
@@ -259,36 +343,48 @@ class ConfigMenu:
             
             # Value
             val_text = self.input_text if self.selected_field == key else str(self.config[key])
-            text_surf = self.font.render(val_text, True, self.TEXT_COLOR)
+            text_surf = render_text(val_text, self.TEXT_COLOR, 24, self.FONT_NAME)
             text_rect = text_surf.get_rect(center=rect.center)
             self.screen.blit(text_surf, text_rect)
             
         # Draw Buttons
         # Start
-        mouse_pos = pygame.mouse.get_pos()
+        mouse_pos = display.get_mouse_pos()
         start_color = self.BUTTON_HOVER if self.start_btn_rect.collidepoint(mouse_pos) else self.BUTTON_BG
         pygame.draw.rect(self.screen, start_color, self.start_btn_rect, border_radius=10)
-        start_txt = self.title_font.render("JOUER", True, settings.WHITE)
-        start_txt = pygame.transform.scale(start_txt, (int(start_txt.get_width()*0.7), int(start_txt.get_height()*0.7)))
+        if self._start_label is None:
+            start_txt = render_text("JOUER", settings.WHITE, 48, self.FONT_NAME, bold=True)
+            self._start_label = pygame.transform.scale(start_txt, (int(start_txt.get_width()*0.7), int(start_txt.get_height()*0.7)))
+        start_txt = self._start_label
         self.screen.blit(start_txt, start_txt.get_rect(center=self.start_btn_rect.center))
         
         # Server Buttons
         load_color = self.BUTTON_HOVER if self.load_btn_rect.collidepoint(mouse_pos) else self.SERVER_BTN_BG
         pygame.draw.rect(self.screen, load_color, self.load_btn_rect, border_radius=8)
-        load_txt = self.small_font.render("Charger (Serveur)", True, settings.WHITE)
+        load_txt = render_text("Charger (Serveur)", settings.WHITE, 18, self.FONT_NAME)
         self.screen.blit(load_txt, load_txt.get_rect(center=self.load_btn_rect.center))
         
         save_color = self.BUTTON_HOVER if self.save_btn_rect.collidepoint(mouse_pos) else self.SERVER_BTN_BG
         pygame.draw.rect(self.screen, save_color, self.save_btn_rect, border_radius=8)
-        save_txt = self.small_font.render("Sauver (Serveur)", True, settings.WHITE)
+        save_txt = render_text("Sauver (Serveur)", settings.WHITE, 18, self.FONT_NAME)
         self.screen.blit(save_txt, save_txt.get_rect(center=self.save_btn_rect.center))
         
-        # Status Message
-        if self.status_message and pygame.time.get_ticks() < self.status_timer:
-            status = self.font.render(self.status_message, True, (255, 100, 100))
+        # Loading indicator while a request is in flight, else the last status
+        if self._pending is not None:
+            label = "Chargement" if self._pending[0] == "load" else "Sauvegarde"
+            dots = "." * (pygame.time.get_ticks() // 250 % 4)
+            busy = render_text(label + dots, self.TEXT_COLOR, 24, self.FONT_NAME)
+            self.screen.blit(busy, busy.get_rect(midleft=(self.width // 2 - 60, self.height - 120)))
+        elif self.status_message and pygame.time.get_ticks() < self.status_timer:
+            status = render_text(self.status_message, (255, 100, 100), 24, self.FONT_NAME)
             self.screen.blit(status, status.get_rect(center=(self.width//2, self.height - 120)))
             
-        pygame.display.flip()
+        display.present()
+
+    def close(self):
+        """Drop any request in flight and release the backend connections."""
+        self._cancel_pending()
+        self.config_service.close()
 
     def get_config(self) -> Dict[str, Any]:
         return self.config.copy()
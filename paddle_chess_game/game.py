@@ -1,28 +1,40 @@
+import os
 import sys
+import time
 import pygame
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 
 from paddle_chess_game import settings
 from paddle_chess_game.objects.paddle import Paddle
 from paddle_chess_game.objects.ball import Ball
 from paddle_chess_game.objects.chess_piece import ChessPiece
-from paddle_chess_game.objects.board import Board
+from paddle_chess_game.objects.board import Board, invalidate_board_cache
 from paddle_chess_game.config_menu import ConfigMenu
+from paddle_chess_game.hud import Hud
+from paddle_chess_game.journal import MatchJournal
+from paddle_chess_game.savegame import get_save_worker
+from paddle_chess_game.services.match_history import get_match_history, match_summary
+from paddle_chess_game.simulation import SimulationThread
+from paddle_chess_game.slot_picker import SlotPicker
+from paddle_chess_game.utils import display
+from paddle_chess_game.utils.pacing import FramePacer
+from paddle_chess_game.utils.profiler import get_profiler
+from paddle_chess_game.utils.text import get_font, render_text
 
 
 class Game:
     def __init__(self, config: Dict[str, Any] = None):
         # pygame.init() and set_mode are handled in main.py
-        self.screen = pygame.display.get_surface()
+        self.screen = display.get_surface()
         if self.screen is None:
              pygame.init()
-             self.screen = pygame.display.set_mode((settings.SCREEN_WIDTH, settings.SCREEN_HEIGHT))
-             pygame.display.set_caption(settings.TITLE)
+             self.screen = display.init_display(settings.TITLE)
              
         self.clock = pygame.time.Clock()
+        self.pacer = FramePacer(self.clock)
         self.bounds = pygame.Rect(0, 0, settings.SCREEN_WIDTH, settings.SCREEN_HEIGHT)
-        self.font = pygame.font.SysFont(None, 26)
-        self.big_font = pygame.font.SysFont(None, 40)
+        self.font = get_font(None, 26)
+        self.big_font = get_font(None, 40)
 
         # Default values
         self.game_over = False
@@ -32,6 +44,7 @@ class Game:
         self.serving_player = 1
 
         # Apply configuration if provided
+        self.config = config or {}
         if config:
             self.apply_config(config)
         
@@ -79,6 +92,37 @@ class Game:
         
         self.ball = Ball(settings.SCREEN_WIDTH // 2, settings.SCREEN_HEIGHT // 2, color=settings.BLACK)
 
+        # Cached navbar, overlays and arrow geometry
+        self.hud = Hud()
+
+        # Set by the host to rewind the remote paddle for hit detection
+        self.lag_compensator = None
+
+        # Set on the view Game while a SimulationThread owns the simulated one
+        self.simulation: Optional[SimulationThread] = None
+
+        # Save file read in progress on the save worker
+        self._pending_load = None
+        # Save/load slot picker opened from the navbar (modal while open)
+        self.slot_picker: Optional[SlotPicker] = None
+        self._paused_before_picker = False
+        self._last_autosave = time.perf_counter()
+
+        # Crash-recovery journal, fed once per simulated tick (start_journal)
+        self.journal: Optional[MatchJournal] = None
+
+        # Match history: names stored with the match, ticks played (pauses excluded)
+        self.players = ("Joueur 1", "Joueur 2")
+        self.match_ticks = 0
+        self._match_recorded = False
+
+        # Dirty-rect rendering: redraw and present only what changed
+        self.dirty_rendering = settings.DIRTY_RECT_RENDERING
+        self._full_redraw = True
+        self._prev_bounds: Dict[Any, Any] = {}
+        self._dirty_rects = None
+        self._overlay_rects: List[pygame.Rect] = []
+
     def apply_config(self, config: Dict[str, Any]):
         """Apply configuration settings to the game."""
         # Apply ball speed (same for both X and Y)
@@ -91,7 +135,10 @@ class Game:
         board_width = config.get('board_width', settings.BOARD_COLS)
         # Ensure it's even
         board_width = board_width if board_width % 2 == 0 else board_width - 1
-        settings.BOARD_COLS = max(2, min(8, board_width))
+        board_width = max(2, min(8, board_width))
+        if board_width != settings.BOARD_COLS:
+            invalidate_board_cache()
+        settings.BOARD_COLS = board_width
         
         # Apply starting player
         self.starting_player = config.get('starting_player', 1)
@@ -145,8 +192,10 @@ class Game:
         self.serve_angle = 0.0
         pass
 
-    def handle_input(self):
-        keys = pygame.key.get_pressed()
+    def handle_input(self, keys=None):
+        # The simulation thread passes the key state sampled by the main thread
+        if keys is None:
+            keys = pygame.key.get_pressed()
         # Top paddle (player 1): A = left, D = right
         if keys[pygame.K_a]:
             self.top_paddle.move(left=True, bounds=self.paddle_bounds)
@@ -201,6 +250,65 @@ class Game:
         if keys[pygame.K_p] and not self.is_serving:
             self.direct_ball_to_king()
 
+    def step(self, keys=None):
+        """One simulation tick of a local game: apply input (if any), then physics."""
+        # keys is None until the main thread hands over a key state; never sample it here
+        if keys is not None:
+            self.handle_input(keys)
+        self.update()
+        self.record_tick()
+
+    def start_journal(self):
+        """Journal every tick of this match so it can be recovered after a crash."""
+        if settings.JOURNAL_ENABLED and self.journal is None:
+            # Finished matches keep a replay: record the full match beside the compacted journal
+            keeps_replay = bool(settings.REPLAY_DIR and settings.MATCH_HISTORY_PATH)
+            replay_path = settings.JOURNAL_PATH + ".replay" if keeps_replay else None
+            self.journal = MatchJournal(settings.JOURNAL_PATH, self.config, replay_path=replay_path)
+
+    def record_tick(self, state: Optional[Dict[str, Any]] = None):
+        """Hand this tick's state (get_game_state() if not given) to the journal,
+        and the final state to the match history once the match is won."""
+        if not (self.paused or self.game_over):
+            self.match_ticks += 1
+        finished = self.game_over and not self._match_recorded
+        if self.journal is None and not finished:
+            return
+        if state is None:
+            state = self.get_game_state()
+        if self.journal is not None:
+            self.journal.record(state)
+        if finished:
+            self._record_match(state)
+
+    def _record_match(self, state: Dict[str, Any]):
+        self._match_recorded = True
+        history = get_match_history()
+        if history is None:
+            return
+        replay_path = None
+        if self.journal is not None and self.journal.replay_path is not None:
+            # The stream recorded so far is this match's replay; the next match gets a fresh one
+            replay_path = os.path.join(settings.REPLAY_DIR, time.strftime('match-%Y%m%d-%H%M%S.journal'))
+            self.journal.rotate(replay_path)
+        history.record(match_summary(self.config, state, self.players,
+                                     self.match_ticks / settings.FPS, replay_path))
+
+    def end_match(self):
+        """Match closed normally: flush and remove its recovery journal."""
+        if self.journal is not None:
+            self.journal.close(discard=True)
+            self.journal = None
+
+    def quit(self):
+        if self.simulation is not None:
+            self.simulation.stop()
+            # Thread stopped: the simulated game is ours again
+            self.simulation.game.end_match()
+        self.end_match()
+        pygame.quit()
+        sys.exit(0)
+
     def process_remote_input(self, player_id: int, input_data: Dict[str, bool]):
         """Process inputs received from network for the remote player."""
         if not input_data:
@@ -284,6 +392,10 @@ class Game:
     def update(self):
         if self.game_over or self.paused:
             return
+
+        if self.lag_compensator:
+            # Ball as last sent to the client
+            self.lag_compensator.record(self.ball)
             
         if self.is_serving:
             # Manual aiming is handled in handle_input
@@ -307,7 +419,7 @@ class Game:
         # Paddles collision
         # Check for special activation on paddle hit
         prev_vy = self.ball.vy
-        self.ball.collide_with_paddle(self.top_paddle)
+        self._collide_paddle(self.top_paddle)
         if self.ball.vy != prev_vy: # Bounce occurred on Top Paddle (P1)
             if self.special_bar >= self.special_bar_max:
                 self.ball.is_special = True
@@ -316,7 +428,7 @@ class Game:
             # Else: keep current state (special or normal) - do not reset
 
         prev_vy = self.ball.vy
-        self.ball.collide_with_paddle(self.bottom_paddle)
+        self._collide_paddle(self.bottom_paddle)
         if self.ball.vy != prev_vy: # Bounce occurred on Bottom Paddle (P2)
             if self.special_bar >= self.special_bar_max:
                 self.ball.is_special = True
@@ -357,6 +469,22 @@ class Game:
                     self.winner_side = 1 if hit.owner == 2 else 2
                     self.game_over = True
 
+    def _collide_paddle(self, paddle: Paddle):
+        """Bounce off `paddle`. With lag compensation, the remote player's paddle also
+        counts as hit if it touched the ball they were seeing (about one RTT ago)."""
+        if self.ball.rect.colliderect(paddle.rect):
+            self.ball.bounce_off_paddle(paddle)
+            return
+        compensator = self.lag_compensator
+        if compensator is None or paddle.owner != compensator.player_id:
+            return
+        # Only while the ball is heading towards that paddle
+        approaching = self.ball.vy > 0 if paddle.owner == 2 else self.ball.vy < 0
+        if approaching:
+            hit_x = compensator.seen_hit_x(self.ball, paddle)
+            if hit_x is not None:
+                self.ball.bounce_off_paddle(paddle, hit_x)
+
     def get_game_state(self) -> Dict[str, Any]:
         """Get the current game state as a dictionary (for server to send to client)."""
         pieces_data = []
@@ -421,6 +549,8 @@ class Game:
         
         self.game_over = state['game_over']
         self.winner_side = state['winner_side']
+        # A loaded or recovered match that was already won is not recorded again
+        self._match_recorded = self.game_over
         self.is_serving = state['is_serving']
         self.serving_player = state['serving_player']
         self.serve_angle = state.get('serve_angle', 0.0)
@@ -436,94 +566,33 @@ class Game:
         self.ball.is_special = ball_state.get('is_special', False)
         self.ball.current_damage = ball_state.get('current_damage', settings.BALL_DAMAGE)
 
+    def _navbar_rect(self) -> pygame.Rect:
+        # Includes the 2 px separator line under the bar
+        return pygame.Rect(0, 0, settings.SCREEN_WIDTH, settings.NAVBAR_HEIGHT + 2)
+
     def draw_navbar(self):
         """Draw the top navigation bar with scores and buttons."""
-        # Background
-        navbar_rect = pygame.Rect(0, 0, settings.SCREEN_WIDTH, settings.NAVBAR_HEIGHT)
-        pygame.draw.rect(self.screen, (240, 240, 240), navbar_rect)
-        pygame.draw.line(self.screen, settings.GREY, (0, settings.NAVBAR_HEIGHT), (settings.SCREEN_WIDTH, settings.NAVBAR_HEIGHT), 2)
-        
-        font = pygame.font.SysFont(None, 24)
-        
-        # Scores
-        p1_text = font.render(f"P1: {self.score_p1}", True, settings.BLUE)
-        self.screen.blit(p1_text, (10, settings.NAVBAR_HEIGHT // 2 - p1_text.get_height() // 2))
-        
-        p2_text = font.render(f"P2: {self.score_p2}", True, settings.RED)
-        self.screen.blit(p2_text, (settings.SCREEN_WIDTH - p2_text.get_width() - 10, settings.NAVBAR_HEIGHT // 2 - p2_text.get_height() // 2))
-        
-        # Special Bar (Shared)
-        bar_width = 200
-        bar_height = 10
-        center_x = settings.SCREEN_WIDTH // 2
-        
-        # Background
-        bar_bg = pygame.Rect(center_x - bar_width // 2, settings.NAVBAR_HEIGHT - 15, bar_width, bar_height)
-        pygame.draw.rect(self.screen, settings.GREY, bar_bg)
-        pygame.draw.rect(self.screen, settings.BLACK, bar_bg, 1) # Border
-        
-        if self.special_bar > 0:
-            fill_width = int((self.special_bar / self.special_bar_max) * bar_width)
-            bar_fill = pygame.Rect(center_x - bar_width // 2, settings.NAVBAR_HEIGHT - 15, fill_width, bar_height)
-            
-            # Color changes when full
-            color = settings.YELLOW if self.special_bar >= self.special_bar_max else (100, 100, 255)
-            pygame.draw.rect(self.screen, color, bar_fill)
-            
-            # Glow effect if full
-            if self.special_bar >= self.special_bar_max:
-                pygame.draw.rect(self.screen, settings.WHITE, bar_fill, 1)
-        
-        # Buttons
-        button_width = 100
-        button_height = 30
-        center_x = settings.SCREEN_WIDTH // 2
-        
-        # Save Button
-        self.save_btn_rect = pygame.Rect(center_x - button_width - 10, settings.NAVBAR_HEIGHT // 2 - button_height // 2, button_width, button_height)
-        pygame.draw.rect(self.screen, settings.GREEN, self.save_btn_rect, border_radius=5)
-        save_text = font.render("Sauvegarder", True, settings.WHITE)
-        self.screen.blit(save_text, save_text.get_rect(center=self.save_btn_rect.center))
-        
-        # Load Button
-        self.load_btn_rect = pygame.Rect(center_x + 10, settings.NAVBAR_HEIGHT // 2 - button_height // 2, button_width, button_height)
-        pygame.draw.rect(self.screen, settings.YELLOW, self.load_btn_rect, border_radius=5)
-        load_text = font.render("Charger", True, settings.BLACK)
-        self.screen.blit(load_text, load_text.get_rect(center=self.load_btn_rect.center))
+        navbar = self.hud.navbar(settings.SCREEN_WIDTH, self.score_p1, self.score_p2,
+                                 self.special_bar, self.special_bar_max)
+        self.screen.blit(navbar, (0, 0))
+        self.save_btn_rect, self.load_btn_rect = self.hud.button_rects(settings.SCREEN_WIDTH)
 
     def draw_ui(self):
+        # Slot picker replaces the pause overlay while open
+        if self.slot_picker is not None:
+            self.slot_picker.draw(self.screen)
+            return
+
         # Pause overlay
         if self.paused:
-            overlay = pygame.Surface((settings.SCREEN_WIDTH, settings.SCREEN_HEIGHT))
-            overlay.set_alpha(128)
-            overlay.fill(settings.BLACK)
-            self.screen.blit(overlay, (0, 0))
-            
-            pause_text = self.big_font.render("PAUSE", True, settings.WHITE)
-            hint_text = self.font.render("Appuyez sur ESPACE pour reprendre", True, settings.WHITE)
-            
-            self.screen.blit(pause_text, pause_text.get_rect(center=(settings.SCREEN_WIDTH//2, settings.SCREEN_HEIGHT//2 - 30)))
-            self.screen.blit(hint_text, hint_text.get_rect(center=(settings.SCREEN_WIDTH//2, settings.SCREEN_HEIGHT//2 + 30)))
+            self.hud.draw_modal(self.screen, settings.BLACK, settings.WHITE,
+                                "PAUSE", "Appuyez sur ESPACE pour reprendre")
             return
         
         # Only draw Game Over overlay here
         if self.game_over:
-            # Draw semi-transparent overlay
-            overlay = pygame.Surface((settings.SCREEN_WIDTH, settings.SCREEN_HEIGHT))
-            overlay.set_alpha(128)
-            overlay.fill(settings.WHITE)
-            self.screen.blit(overlay, (0, 0))
-            
             msg = f"{settings.WIN_TEXT} (Gagnant: Joueur {self.winner_side})"
-            text = self.big_font.render(msg, True, settings.BLACK)
-            hint = self.font.render(settings.RESET_HINT, True, settings.BLACK)
-            
-            # Center text
-            text_rect = text.get_rect(center=(settings.SCREEN_WIDTH//2, settings.SCREEN_HEIGHT//2 - 30))
-            hint_rect = hint.get_rect(center=(settings.SCREEN_WIDTH//2, settings.SCREEN_HEIGHT//2 + 30))
-            
-            self.screen.blit(text, text_rect)
-            self.screen.blit(hint, hint_rect)
+            self.hud.draw_modal(self.screen, settings.WHITE, settings.BLACK, msg, settings.RESET_HINT)
 
     def reset_game(self):
         """Reset the game state to start a new game."""
@@ -531,6 +600,8 @@ class Game:
         self.score_p2 = 0
         self.game_over = False
         self.winner_side = None
+        self.match_ticks = 0
+        self._match_recorded = False
         self.is_serving = True
         self.serving_player = self.starting_player
         self.serve_angle = 0.0
@@ -551,6 +622,9 @@ class Game:
         # Reset paddles
         self.top_paddle.reset()
         self.bottom_paddle.reset()
+        self._full_redraw = True
+        if self.lag_compensator:
+            self.lag_compensator.reset()
 
     def direct_ball_to_king(self):
         """Direct the ball towards the opponent's king based on who last touched it."""
@@ -583,25 +657,9 @@ class Game:
         """Draw an arrow indicating the serving direction."""
         if not self.is_serving:
             return
-            
-        import math
-        
-        # Determine start position (center of ball)
-        start_pos = (self.ball.x, self.ball.y)
-        
-        # Calculate end position based on angle
-        length = 50
-        rad = math.radians(self.serve_angle)
-        
-        # Direction vector
-        dx = length * math.sin(rad)
-        dy = length * math.cos(rad)
-        
-        if self.serving_player == 1:
-            end_pos = (start_pos[0] + dx, start_pos[1] + dy) # Down
-        else:
-            end_pos = (start_pos[0] + dx, start_pos[1] - dy) # Up
-            
+
+        start_pos, end_pos = self._aiming_arrow_points()
+
         # Draw line
         pygame.draw.line(self.screen, settings.BLACK, start_pos, end_pos, 3)
         
@@ -609,20 +667,37 @@ class Game:
         # ... (simplified arrow head)
         pygame.draw.circle(self.screen, settings.RED, (int(end_pos[0]), int(end_pos[1])), 5)
 
-    def draw(self):
-        self.screen.fill(settings.WHITE)
+    def _aiming_arrow_points(self):
+        """Start (ball center) and end points of the serving arrow."""
+        start_pos = (self.ball.x, self.ball.y)
+        dx, dy = self.hud.arrow_offset(self.serve_angle, self.serving_player)
+        return start_pos, (start_pos[0] + dx, start_pos[1] + dy)
+
+    def draw(self, present: bool = True):
+        """Draw the frame; with present=False the caller adds overlays then calls present()."""
+        overlay_visible = self.paused or self.game_over or self.slot_picker is not None
+        if not self.dirty_rendering or self._full_redraw or overlay_visible:
+            self._draw_full()
+            # Leaving pause/game over needs one more full frame to clear the overlay
+            self._full_redraw = overlay_visible
+        else:
+            self._draw_dirty()
+
+        self.draw_ui()
+        if present:
+            self.present()
+
+    def _draw_full(self):
+        # Static background (white fill + checkerboard), pre-rendered once
+        self.board.draw_background(self.screen)
 
         # Draw Navbar
         self.draw_navbar()
 
-        # Board hint background (checkerboard)
-        self.board.draw_board_hint(self.screen)
         # Draw paddles, ball, pieces
         self.top_paddle.draw(self.screen)
         self.bottom_paddle.draw(self.screen)
-        for p in self.board.pieces:
-            if p.is_alive():
-                p.draw(self.screen)
+        self.board.draw_pieces(self.screen)
         
         # Draw aiming arrow if serving
         if self.is_serving:
@@ -630,68 +705,238 @@ class Game:
             
         self.ball.draw(self.screen)
 
-        self.draw_ui()
-        pygame.display.flip()
+        self._prev_bounds = self._sprite_bounds()
+        self._dirty_rects = None  # Whole screen
+        self._overlay_rects = []
+
+    def _sprite_bounds(self) -> Dict[Any, Any]:
+        """Screen area and look of everything that can change between frames."""
+        bounds = {
+            'navbar': (self._navbar_rect(), (self.score_p1, self.score_p2, self.special_bar, self.special_bar_max)),
+            'ball': (self.ball.rect.inflate(4, 4), None),
+            'top_paddle': (self.top_paddle.rect.copy(), None),
+            'bottom_paddle': (self.bottom_paddle.rect.copy(), None),
+        }
+        if self.is_serving:
+            start, end = self._aiming_arrow_points()
+            arrow = pygame.Rect(min(start[0], end[0]), min(start[1], end[1]),
+                                abs(end[0] - start[0]) + 1, abs(end[1] - start[1]) + 1)
+            bounds['arrow'] = (arrow.inflate(12, 12), None)
+        for i, p in enumerate(self.board.pieces):
+            if p.is_alive():
+                # Piece body plus the life bar drawn 8 px above it
+                bounds[('piece', i)] = (pygame.Rect(p.rect.x, p.rect.y - 8, p.rect.width, p.rect.height + 8), p.life)
+        return bounds
+
+    def _draw_dirty(self):
+        """Redraw only the areas whose content changed since the previous frame."""
+        current = self._sprite_bounds()
+        dirty = list(self._overlay_rects)  # Overlays drawn over the last frame
+        for key in set(self._prev_bounds) | set(current):
+            old, new = self._prev_bounds.get(key), current.get(key)
+            if old == new:
+                continue
+            for entry in (old, new):
+                if entry is not None:
+                    dirty.append(entry[0])
+        self._prev_bounds = current
+        self._overlay_rects = []
+
+        navbar_rect = current['navbar'][0]
+        for rect in dirty:
+            self.screen.set_clip(rect)
+            self.board.draw_background(self.screen)
+            if rect.colliderect(navbar_rect):
+                self.draw_navbar()
+            for paddle in (self.top_paddle, self.bottom_paddle):
+                if rect.colliderect(paddle.rect):
+                    paddle.draw(self.screen)
+            for key, (bounds, _) in current.items():
+                if isinstance(key, tuple) and rect.colliderect(bounds):
+                    self.board.pieces[key[1]].draw(self.screen)
+            if 'arrow' in current and rect.colliderect(current['arrow'][0]):
+                self._draw_aiming_arrow()
+            if rect.colliderect(current['ball'][0]):
+                self.ball.draw(self.screen)
+        self.screen.set_clip(None)
+        self._dirty_rects = dirty
+
+    def mark_dirty(self, rect: pygame.Rect):
+        """Register an overlay drawn on top of this frame (restored on the next one)."""
+        if rect is not None and self._dirty_rects is not None:
+            self._overlay_rects.append(rect)
+
+    def present(self):
+        """Show the frame: only the dirty regions in dirty-rect mode, else the whole screen."""
+        if self._dirty_rects is None:
+            display.present()
+        else:
+            display.present(self._dirty_rects + self._overlay_rects)
 
-    def save_game(self):
-        """Save current game state to a JSON file."""
-        state = self.get_game_state()
-        try:
-            import json
-            with open("savegame.json", "w") as f:
-                json.dump(state, f, indent=4)
-            print("Game saved to savegame.json!")
-        except Exception as e:
-            print(f"Error saving game: {e}")
-
-    def load_game(self):
-        """Load game state from a JSON file."""
-        try:
-            import json
-            import os
-            if not os.path.exists("savegame.json"):
-                print("No save file found.")
-                return
-                
-            with open("savegame.json", "r") as f:
-                state = json.load(f)
-            self.set_game_state(state)
-            print("Game loaded from savegame.json!")
-        except Exception as e:
-            print(f"Error loading game: {e}")
+    def save_game(self, slot: Optional[str] = None):
+        """Snapshot the game state and write it to a slot (new one if None) on the save worker."""
+        if slot is None:
+            slot = f"Partie {time.strftime('%d/%m %H:%M:%S')}"
+        get_save_worker().save_slot(slot, self.get_game_state())
+
+    def load_game(self, slot: Optional[str] = None):
+        """Start reading a slot (newest if None) on the save worker; applied by handle_events once read."""
+        if self._pending_load is not None:
+            return
+        worker = get_save_worker()
+        if slot is None:
+            slots = worker.list_slots()
+            # Empty archive: fall back to the single-file save of older versions
+            self._pending_load = worker.load_slot(slots[0]['name']) if slots else worker.load()
+        else:
+            self._pending_load = worker.load_slot(slot)
+
+    def autosave(self):
+        get_save_worker().save_slot(None, self.get_game_state(), autosave=True)
+
+    def _maybe_autosave(self):
+        if settings.AUTOSAVE_INTERVAL <= 0:
+            return
+        now = time.perf_counter()
+        if self.paused or self.game_over or self.slot_picker is not None:
+            self._last_autosave = now  # Count only time actually played
+            return
+        if now - self._last_autosave >= settings.AUTOSAVE_INTERVAL:
+            self._last_autosave = now
+            self.autosave()
+
+    def open_slot_picker(self, mode: str):
+        """Show the slot list for "save" or "load"; the game is paused while it is open."""
+        slots = get_save_worker().list_slots()
+        if mode == "load" and not slots:
+            self.load_game()  # Nothing in the archive: try the older single-file save
+            return
+        self.slot_picker = SlotPicker(mode, slots)
+        self._paused_before_picker = self.paused
+        self._command(lambda game: setattr(game, 'paused', True))
+
+    def _close_slot_picker(self, action: str, slot: Optional[str]):
+        self.slot_picker = None
+        paused = self._paused_before_picker
+        self._command(lambda game: setattr(game, 'paused', paused))
+        if action == "save":
+            self.save_game(slot)
+        elif action == "load":
+            self.load_game(slot)
+
+    def _apply_finished_load(self):
+        if self._pending_load is None or not self._pending_load.done():
+            return
+        state = self._pending_load.result()
+        self._pending_load = None
+        if state is not None:
+            self._command(lambda game: game.set_game_state(state))
 
     def handle_events(self):
+        self._apply_finished_load()
+        self._maybe_autosave()
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
-                pygame.quit()
-                sys.exit(0)
+                self.quit()
+            get_profiler().handle_event(event)
+            # The slot picker is modal: it gets every event while open
+            if self.slot_picker is not None:
+                result = self.slot_picker.handle_event(event)
+                if result is not None:
+                    self._close_slot_picker(*result)
+                continue
             if event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_ESCAPE:
-                    pygame.quit()
-                    sys.exit(0)
+                    self.quit()
                     
                 # Reset game (R key - works anytime)
                 if event.key == pygame.K_r:
-                    self.reset_game()
-                    self.paused = False  # Unpause if paused
+                    self._command(Game.restart)
                 
                 # Toggle pause (SPACE key - only if not serving or game over)
                 if event.key == pygame.K_SPACE:
-                    if not self.is_serving and not self.game_over:
-                        self.paused = not self.paused
+                    self._command(Game.toggle_pause)
             
             # Handle Navbar clicks
             if event.type == pygame.MOUSEBUTTONDOWN:
-                mouse_pos = pygame.mouse.get_pos()
+                mouse_pos = display.get_mouse_pos()
                 if hasattr(self, 'save_btn_rect') and self.save_btn_rect.collidepoint(mouse_pos):
-                    self.save_game()
+                    self.open_slot_picker("save")
                 elif hasattr(self, 'load_btn_rect') and self.load_btn_rect.collidepoint(mouse_pos):
-                    self.load_game()
+                    self.open_slot_picker("load")
+
+    def _command(self, action):
+        """Apply a state change here, or on the simulation thread when one owns the game."""
+        if self.simulation is not None:
+            self.simulation.command(action)
+        else:
+            action(self)
+
+    def restart(self):
+        self.reset_game()
+        self.paused = False  # Unpause if paused
+
+    def toggle_pause(self):
+        if not self.is_serving and not self.game_over:
+            self.paused = not self.paused
+
+    def apply_snapshot(self, state: Dict[str, Any]):
+        """View side of THREADED_SIMULATION: show a snapshot published by the simulation."""
+        self.set_game_state(state)
+        self.paused = state.get('paused', self.paused)
 
     def run(self):
+        if settings.THREADED_SIMULATION:
+            self.run_threaded()
+            return
+        profiler = get_profiler()
         while True:
-            self.clock.tick(settings.FPS)
+            # Nothing moves while paused or over: throttle until input arrives
+            self.pacer.tick(idle=self.paused or self.game_over or self.slot_picker is not None)
+            profiler.lap("tick")
             self.handle_events()
-            self.handle_input()
+            profiler.lap("events")
+            if self.slot_picker is None:
+                self.handle_input()
+            profiler.lap("input")
             self.update()
-            self.draw()
+            self.record_tick()
+            profiler.lap("update")
+            # Behind schedule: keep simulating, skip drawing this frame
+            if self.pacer.render_due:
+                self.draw(present=False)
+                self.mark_dirty(profiler.draw_overlay(self.screen))
+                profiler.lap("draw")
+                self.present()
+                profiler.lap("present")
+            profiler.end_frame()
+
+    def run_threaded(self):
+        """Render loop with physics on a SimulationThread (see simulation.py for the contract)."""
+        sim_game = Game(self.config)
+        sim_game.set_game_state(self.get_game_state())  # Picks up a recovered match
+        if self.journal is not None:
+            # The simulated game owns the journal from now on
+            sim_game.journal, self.journal = self.journal, None
+        self.simulation = SimulationThread(sim_game, Game.step)
+        self.simulation.start()
+        profiler = get_profiler()
+        try:
+            while True:
+                self.pacer.tick(idle=self.paused or self.game_over or self.slot_picker is not None)
+                profiler.lap("tick")
+                self.handle_events()
+                self.simulation.set_keys(None if self.slot_picker is not None else pygame.key.get_pressed())
+                profiler.lap("events")
+                state = self.simulation.latest_snapshot()
+                if state is not None:
+                    self.apply_snapshot(state)
+                profiler.lap("snapshot")
+                self.draw(present=False)
+                self.mark_dirty(profiler.draw_overlay(self.screen))
+                profiler.lap("draw")
+                self.present()
+                profiler.lap("present")
+                profiler.end_frame()
+        finally:
+            self.simulation.stop()
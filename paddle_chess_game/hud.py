@@ -0,0 +1,131 @@
+import math
+from typing import Dict, List, Tuple
+
+import pygame
+
+from paddle_chess_game import settings
+from paddle_chess_game.utils.text import render_text
+
+BUTTON_WIDTH = 100
+BUTTON_HEIGHT = 30
+SPECIAL_BAR_WIDTH = 200
+SPECIAL_BAR_HEIGHT = 10
+ARROW_LENGTH = 50
+
+
+class Hud:
+    """Persistent HUD surfaces for Game: navbar, pause/game over overlays, serve arrow.
+
+    Everything is built once and rebuilt only when its inputs change (screen
+    size, scores, special bar, message), so idle frames are plain blits.
+    Every cache is keyed by those inputs, so nothing needs invalidating.
+    """
+
+    def __init__(self):
+        self._overlays: Dict[Tuple, pygame.Surface] = {}
+        self._modals: Dict[Tuple, List[Tuple[pygame.Surface, pygame.Rect]]] = {}
+        self._navbar: pygame.Surface | None = None
+        self._navbar_key = None
+        self._arrow_key = None
+        self._arrow_offset = (0.0, 0.0)
+
+    # Navbar
+
+    @staticmethod
+    def button_rects(width: int) -> Tuple[pygame.Rect, pygame.Rect]:
+        """Save and load button rects for a screen `width`."""
+        center_x = width // 2
+        top = settings.NAVBAR_HEIGHT // 2 - BUTTON_HEIGHT // 2
+        save_rect = pygame.Rect(center_x - BUTTON_WIDTH - 10, top, BUTTON_WIDTH, BUTTON_HEIGHT)
+        load_rect = pygame.Rect(center_x + 10, top, BUTTON_WIDTH, BUTTON_HEIGHT)
+        return save_rect, load_rect
+
+    def navbar(self, width: int, score_p1: int, score_p2: int,
+               special_bar: int, special_bar_max: int) -> pygame.Surface:
+        """Navbar surface (separator line included), re-rendered only when its content changes."""
+        key = (width, score_p1, score_p2, special_bar, special_bar_max)
+        if key != self._navbar_key:
+            self._navbar = self._render_navbar(*key)
+            self._navbar_key = key
+        return self._navbar
+
+    def _render_navbar(self, width, score_p1, score_p2, special_bar, special_bar_max) -> pygame.Surface:
+        height = settings.NAVBAR_HEIGHT
+        surface = pygame.Surface((width, height + 2))
+        surface.fill(settings.WHITE)
+        pygame.draw.rect(surface, (240, 240, 240), (0, 0, width, height))
+        pygame.draw.line(surface, settings.GREY, (0, height), (width, height), 2)
+
+        # Scores
+        p1_text = render_text(f"P1: {score_p1}", settings.BLUE, 24)
+        surface.blit(p1_text, (10, height // 2 - p1_text.get_height() // 2))
+        p2_text = render_text(f"P2: {score_p2}", settings.RED, 24)
+        surface.blit(p2_text, (width - p2_text.get_width() - 10, height // 2 - p2_text.get_height() // 2))
+
+        # Special Bar (Shared)
+        center_x = width // 2
+        bar_bg = pygame.Rect(center_x - SPECIAL_BAR_WIDTH // 2, height - 15, SPECIAL_BAR_WIDTH, SPECIAL_BAR_HEIGHT)
+        pygame.draw.rect(surface, settings.GREY, bar_bg)
+        pygame.draw.rect(surface, settings.BLACK, bar_bg, 1)  # Border
+        if special_bar > 0:
+            fill_width = int((special_bar / special_bar_max) * SPECIAL_BAR_WIDTH)
+            bar_fill = pygame.Rect(bar_bg.x, bar_bg.y, fill_width, SPECIAL_BAR_HEIGHT)
+            # Color changes when full, with a glow border
+            full = special_bar >= special_bar_max
+            pygame.draw.rect(surface, settings.YELLOW if full else (100, 100, 255), bar_fill)
+            if full:
+                pygame.draw.rect(surface, settings.WHITE, bar_fill, 1)
+
+        # Buttons
+        save_rect, load_rect = self.button_rects(width)
+        pygame.draw.rect(surface, settings.GREEN, save_rect, border_radius=5)
+        save_text = render_text("Sauvegarder", settings.WHITE, 24)
+        surface.blit(save_text, save_text.get_rect(center=save_rect.center))
+        pygame.draw.rect(surface, settings.YELLOW, load_rect, border_radius=5)
+        load_text = render_text("Charger", settings.BLACK, 24)
+        surface.blit(load_text, load_text.get_rect(center=load_rect.center))
+        return surface
+
+    # Overlays
+
+    def overlay(self, size: Tuple[int, int], color, alpha: int = 128) -> pygame.Surface:
+        """Full-screen translucent surface, allocated once per (size, color, alpha)."""
+        key = (size, tuple(color), alpha)
+        surface = self._overlays.get(key)
+        if surface is None:
+            surface = pygame.Surface(size)
+            surface.fill(color)
+            surface.set_alpha(alpha)
+            self._overlays[key] = surface
+        return surface
+
+    def draw_modal(self, surface: pygame.Surface, background, text_color, title: str, hint: str):
+        """Dim the screen and show a centered title and hint (layout cached per message)."""
+        size = surface.get_size()
+        key = (size, tuple(text_color), title, hint)
+        blits = self._modals.get(key)
+        if blits is None:
+            center_x, center_y = size[0] // 2, size[1] // 2
+            title_text = render_text(title, text_color, 40)
+            hint_text = render_text(hint, text_color, 26)
+            blits = [
+                (title_text, title_text.get_rect(center=(center_x, center_y - 30))),
+                (hint_text, hint_text.get_rect(center=(center_x, center_y + 30))),
+            ]
+            self._modals[key] = blits
+        surface.blit(self.overlay(size, background), (0, 0))
+        surface.blits(blits, doreturn=False)
+
+    # Serve arrow
+
+    def arrow_offset(self, angle: float, serving_player: int) -> Tuple[float, float]:
+        """Arrow vector for a serve angle; trigonometry only reruns when the angle moves."""
+        key = (angle, serving_player)
+        if key != self._arrow_key:
+            rad = math.radians(angle)
+            dx = ARROW_LENGTH * math.sin(rad)
+            dy = ARROW_LENGTH * math.cos(rad)
+            # Player 1 serves down, player 2 up
+            self._arrow_offset = (dx, dy) if serving_player == 1 else (dx, -dy)
+            self._arrow_key = key
+        return self._arrow_offset
@@ -0,0 +1,238 @@
+"""
+Append-only crash-recovery journal for a running match.
+
+Every tick the game hands record() its get_game_state() dict. The journal
+keeps only what changed since the previous tick (ball, paddles, scores,
+piece lives...) and writes a full checkpoint every `checkpoint_every`
+ticks. A background thread writes the records in batches and fsyncs each
+batch, so the game loop never waits on the disk.
+
+Frame layout: length u32 | crc32 u32 | kind u8 | marshal payload. Recovery
+replays from the last complete checkpoint and stops at the first torn or
+corrupt frame. Once the file grows past `max_bytes`, the writer compacts it
+at the next checkpoint. The new file holds just that checkpoint and replaces
+the old one atomically.
+
+With a replay_path, every frame is also appended to a second file that is
+never compacted (nor fsynced: it is not needed to recover). rotate() ends
+a finished match: the writer moves that stream to the match's replay file
+and carries on with a fresh journal and a fresh stream.
+"""
+import atexit
+import marshal
+import os
+import struct
+import threading
+import zlib
+from typing import Any, Dict, List, Optional, Tuple
+
+from paddle_chess_game import settings
+from paddle_chess_game.savegame import write_atomic
+
+FRAME = struct.Struct('!IIB')
+CHECKPOINT = 1
+DELTA = 2
+ROTATE = 3  # Writer-side marker in the pending list, never written to disk
+MARSHAL_VERSION = 4
+
+
+def _frame(kind: int, payload: Dict[str, Any]) -> bytes:
+    data = marshal.dumps(payload, MARSHAL_VERSION)
+    return FRAME.pack(len(data), zlib.crc32(data), kind) + data
+
+
+def state_delta(previous: Dict[str, Any], state: Dict[str, Any]) -> Dict[str, Any]:
+    """Keys of `state` that differ from `previous`; pieces as {index: lives}."""
+    delta = {}
+    for key, value in state.items():
+        if key == 'pieces':
+            old_pieces = previous.get('pieces', [])
+            changed = {i: piece['lives'] for i, piece in enumerate(value)
+                       if i >= len(old_pieces) or old_pieces[i]['lives'] != piece['lives']}
+            if changed:
+                delta['pieces'] = changed
+        elif previous.get(key) != value:
+            delta[key] = value
+    return delta
+
+
+def apply_delta(state: Dict[str, Any], delta: Dict[str, Any]):
+    for key, value in delta.items():
+        if key == 'pieces':
+            for i, lives in value.items():
+                state['pieces'][i]['lives'] = lives
+                state['pieces'][i]['is_alive'] = lives > 0
+        else:
+            state[key] = value
+
+
+class MatchJournal:
+    """Writer side: record() from the simulation, one daemon thread for the disk."""
+
+    def __init__(self, path: str, config: Dict[str, Any],
+                 checkpoint_every: int = settings.JOURNAL_CHECKPOINT_TICKS,
+                 max_bytes: int = settings.JOURNAL_MAX_BYTES,
+                 flush_interval: float = settings.JOURNAL_FLUSH_INTERVAL,
+                 replay_path: Optional[str] = None):
+        self.path = path
+        self.config = config
+        self.checkpoint_every = checkpoint_every
+        self.max_bytes = max_bytes
+        self.replay_path = replay_path  # Full, uncompacted stream of the current match
+        self.flush_interval = flush_interval
+        self.previous: Optional[Dict[str, Any]] = None
+        self.ticks = 0
+        self.pending: List[Tuple[int, Any]] = []  # (kind, frame) waiting for the writer; (ROTATE, path)
+        self.cond = threading.Condition()
+        self.running = True
+        self.file = open(path, 'wb')
+        self.size = 0
+        self.replay = open(replay_path, 'wb') if replay_path else None
+        self.thread = threading.Thread(target=self._run, name="journal", daemon=True)
+        self.thread.start()
+        atexit.register(self.close)
+
+    def record(self, state: Dict[str, Any]):
+        """Journal one tick; `state` must not be mutated afterwards."""
+        if self.previous is None or self.ticks % self.checkpoint_every == 0:
+            kind, frame = CHECKPOINT, _frame(CHECKPOINT, {'config': self.config, 'state': state})
+        else:
+            delta = state_delta(self.previous, state)
+            kind, frame = DELTA, _frame(DELTA, delta) if delta else None
+        self.previous = state
+        self.ticks += 1
+        if frame is None:
+            return  # Nothing moved this tick
+        with self.cond:
+            self.pending.append((kind, frame))
+
+    def rotate(self, path: str):
+        """Keep the match recorded so far as the replay `path`, then start a fresh journal.
+        Needs a replay_path."""
+        self.previous = None  # The fresh file starts with a checkpoint
+        with self.cond:
+            self.pending.append((ROTATE, path))
+
+    def _run(self):
+        while True:
+            with self.cond:
+                if self.running:
+                    self.cond.wait(self.flush_interval)
+                batch, self.pending = self.pending, []
+                running = self.running
+            if batch:
+                try:
+                    self._write(batch)
+                except OSError as e:
+                    print(f"Journal write failed: {e}")
+            if not running:
+                return
+
+    def _write(self, batch: List[Tuple[int, Any]]):
+        for i, (kind, item) in enumerate(batch):
+            if kind == ROTATE:
+                self._write_frames(batch[:i])
+                self._rotate(item)
+                self._write(batch[i + 1:])
+                return
+        self._write_frames(batch)
+
+    def _rotate(self, path: str):
+        if self.replay is not None:
+            self.replay.close()
+            try:
+                os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+                os.replace(self.replay_path, path)
+            except OSError as e:
+                print(f"Could not keep the replay as {path}: {e}")
+            self.replay = open(self.replay_path, 'wb')
+        # The finished match needs no recovery
+        self.file.close()
+        self.file = open(self.path, 'wb')
+        self.size = 0
+
+    def _write_frames(self, batch: List[Tuple[int, bytes]]):
+        if not batch:
+            return
+        if self.replay is not None:
+            self.replay.write(b''.join(frame for _, frame in batch))
+            self.replay.flush()
+        # Compact at the newest checkpoint of the batch once the file is too big
+        start = 0
+        if self.size > self.max_bytes:
+            for i in range(len(batch) - 1, -1, -1):
+                if batch[i][0] == CHECKPOINT:
+                    start = i
+                    break
+            if batch[start][0] == CHECKPOINT:
+                self.file.close()
+                head = b''.join(frame for _, frame in batch[start:])
+                write_atomic(self.path, head)
+                self.file = open(self.path, 'ab')
+                self.size = len(head)
+                return
+        data = b''.join(frame for _, frame in batch)
+        self.file.write(data)
+        self.file.flush()
+        os.fsync(self.file.fileno())
+        self.size += len(data)
+
+    def close(self, discard: bool = False):
+        """Flush and stop. discard=True (match ended normally) removes the journal."""
+        if self.thread is None:
+            return
+        with self.cond:
+            self.running = False
+            self.cond.notify()
+        self.thread.join(timeout=2.0)
+        self.thread = None
+        self.file.close()
+        if self.replay is not None:
+            # An unfinished match has no replay
+            self.replay.close()
+            try:
+                os.remove(self.replay_path)
+            except OSError:
+                pass
+        if discard:
+            try:
+                os.remove(self.path)
+            except OSError:
+                pass
+
+
+def recover(path: str = settings.JOURNAL_PATH) -> Optional[Tuple[Dict[str, Any], Dict[str, Any]]]:
+    """Rebuild (config, state) from a journal left by a crashed match, or None."""
+    try:
+        with open(path, 'rb') as f:
+            data = f.read()
+    except FileNotFoundError:
+        return None
+
+    config = state = None
+    offset = 0
+    while offset + FRAME.size <= len(data):
+        length, crc, kind = FRAME.unpack_from(data, offset)
+        start = offset + FRAME.size
+        payload = data[start:start + length]
+        if len(payload) != length or zlib.crc32(payload) != crc:
+            break  # Torn write at the crash point
+        try:
+            record = marshal.loads(payload)
+        except (EOFError, ValueError, TypeError):
+            break
+        if kind == CHECKPOINT:
+            config, state = record['config'], record['state']
+        elif kind == DELTA and state is not None:
+            apply_delta(state, record)
+        offset = start + length
+    if state is None:
+        return None
+    return config, state
+
+
+def discard(path: str = settings.JOURNAL_PATH):
+    try:
+        os.remove(path)
+    except OSError:
+        pass
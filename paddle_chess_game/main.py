@@ -1,60 +1,132 @@
 import pygame
 import sys
 import threading
-from paddle_chess_game import settings
+from paddle_chess_game import journal, settings
 from paddle_chess_game.game import Game
 from paddle_chess_game.config_menu import ConfigMenu
 from paddle_chess_game.network_menu import NetworkMenu
 from paddle_chess_game.network.server import GameServer
 from paddle_chess_game.network.client import GameClient
+from paddle_chess_game.network.lag_compensation import LagCompensator
+from paddle_chess_game.network.shm_transport import SharedMemoryServer, SharedMemoryClient
+from paddle_chess_game.simulation import SimulationThread
+from paddle_chess_game.utils import display
+from paddle_chess_game.utils.pacing import FramePacer
+from paddle_chess_game.utils.profiler import get_profiler
+from paddle_chess_game.utils.text import get_font, render_text
 
-def run_local_game(screen, clock):
-    # Config Menu
-    config_menu = ConfigMenu(screen)
-    running = True
-    config = None
+def create_server(port):
+    """Build the host transport selected by settings.NETWORK_TRANSPORT."""
+    if settings.NETWORK_TRANSPORT == "shm":
+        return SharedMemoryServer(port=port)
+    return GameServer(port=port)
+
+def create_client(ip, port):
+    """Build the client transport selected by settings.NETWORK_TRANSPORT."""
+    if settings.NETWORK_TRANSPORT == "shm":
+        return SharedMemoryClient(ip, port=port)
+    return GameClient(ip, port=port)
+
+def apply_host_input(game, keys):
+    """Host controls Player 1 (Top) with the arrow keys (more intuitive than A/D)."""
+    if keys[pygame.K_LEFT]:
+        game.top_paddle.move(left=True, bounds=game.paddle_bounds)
+    if keys[pygame.K_RIGHT]:
+        game.top_paddle.move(left=False, bounds=game.paddle_bounds)
+        
+    # Aiming for Host (P1)
+    if game.is_serving and game.serving_player == 1:
+        aim_speed = 2.0
+        if keys[pygame.K_UP] or keys[pygame.K_w] or keys[pygame.K_z]:
+             game.serve_angle = max(-45, game.serve_angle - aim_speed)
+        if keys[pygame.K_DOWN] or keys[pygame.K_s]:
+             game.serve_angle = min(45, game.serve_angle + aim_speed)
+
+    if keys[pygame.K_SPACE] and game.is_serving and game.serving_player == 1:
+        game._serve_ball()
     
-    while running:
-        clock.tick(settings.FPS)
+    # Power Shot for Host
+    if keys[pygame.K_p] and not game.is_serving:
+        game.direct_ball_to_king()
+
+def run_config_menu(screen, pacer):
+    """Show the config menu until the player starts; return the chosen config."""
+    config_menu = ConfigMenu(screen)
+    try:
+        while True:
+            # Full rate while a backend request is in flight, to animate the indicator
+            pacer.tick(idle=not config_menu.busy)
+            for event in pygame.event.get():
+                if config_menu.handle_event(event):
+                    return config_menu.get_config()
+            config_menu.draw()
+    finally:
+        config_menu.close()
+
+def offer_recovery(screen, pacer):
+    """If a crashed match left a journal, offer to resume it: return (config, state) or None."""
+    recovered = journal.recover(settings.JOURNAL_PATH)
+    if recovered is None:
+        return None
+    _, state = recovered
+    lines = [
+        ("Partie interrompue detectee", settings.RED),
+        (f"Score P1 {state.get('score_p1', 0)} - P2 {state.get('score_p2', 0)}", settings.BLACK),
+        ("ENTREE : reprendre    N : nouvelle partie", settings.BLACK),
+    ]
+    while True:
+        pacer.tick(idle=True)
         for event in pygame.event.get():
-            if config_menu.handle_event(event):
-                config = config_menu.get_config()
-                running = False
-                break
-        config_menu.draw()
-    
+            if event.type == pygame.QUIT:
+                pygame.quit()
+                sys.exit()
+            if event.type == pygame.KEYDOWN:
+                if event.key in (pygame.K_RETURN, pygame.K_o):
+                    return recovered
+                if event.key in (pygame.K_n, pygame.K_ESCAPE):
+                    journal.discard(settings.JOURNAL_PATH)
+                    return None
+        screen.fill(settings.WHITE)
+        for i, (line, color) in enumerate(lines):
+            text = render_text(line, color, 32)
+            screen.blit(text, (settings.SCREEN_WIDTH//2 - text.get_width()//2, settings.SCREEN_HEIGHT//2 - 50 + i*45))
+        display.present()
+
+def run_local_game(screen, clock):
+    pacer = FramePacer(clock)
+    recovered = offer_recovery(screen, pacer)
+    # Config Menu (skipped when resuming: the journal holds the match config)
+    config = recovered[0] if recovered else run_config_menu(screen, pacer)
     if not config:
         return
 
     # Game Loop
     game = Game(config)
+    if recovered:
+        game.set_game_state(recovered[1])
+    game.start_journal()
     game.run()
 
+def host_players(server):
+    """Player names for the match history: the host, then the client's address."""
+    address = server.client_address[0] if server.client_address else "?"
+    return ("Hote", f"Client {address}")
+
 def run_host_game(screen, clock, port):
-    # Config Menu first
-    config_menu = ConfigMenu(screen)
-    running = True
-    config = None
-    
-    while running:
-        clock.tick(settings.FPS)
-        for event in pygame.event.get():
-            if config_menu.handle_event(event):
-                config = config_menu.get_config()
-                running = False
-                break
-        config_menu.draw()
-        
+    pacer = FramePacer(clock)
+    recovered = offer_recovery(screen, pacer)
+    # Config Menu first (skipped when resuming a crashed match)
+    config = recovered[0] if recovered else run_config_menu(screen, pacer)
     if not config:
         return
+    recovered_state = recovered[1] if recovered else None
 
     # Start Server
-    server = GameServer(port=port)
+    server = create_server(port)
     server.start()
     
     # Wait for client
     waiting = True
-    font = pygame.font.SysFont(None, 36)
     
     # Start thread to accept client so we can keep UI responsive
     client_connected = False
@@ -67,11 +139,11 @@ def run_host_game(screen, clock, port):
     threading.Thread(target=wait_connection, daemon=True).start()
     
     while waiting:
-        clock.tick(settings.FPS)
+        pacer.tick(idle=True)
         screen.fill(settings.WHITE)
-        text = font.render(f"Waiting for player on port {server.port}...", True, settings.BLACK)
+        text = render_text(f"Waiting for player on port {server.port}...", settings.BLACK, 36)
         screen.blit(text, (settings.SCREEN_WIDTH//2 - text.get_width()//2, settings.SCREEN_HEIGHT//2))
-        pygame.display.flip()
+        display.present()
         
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
@@ -84,76 +156,171 @@ def run_host_game(screen, clock, port):
     # Send configuration to client immediately
     server.send_config(config)
 
+    if settings.THREADED_SIMULATION:
+        run_host_game_threaded(screen, pacer, server, config, recovered_state)
+        server.close()
+        return
+
     # Game Loop (Host)
     game = Game(config)
-    # Host is Player 1 (Top)
+    # Host is Player 1 (Top); the client's paddle is rewound by its latency for hits
+    game.lag_compensator = LagCompensator(player_id=2, stats=server.stats)
+    game.players = host_players(server)
+    if recovered_state:
+        game.set_game_state(recovered_state)
+    game.start_journal()
     
     running = True
+    show_net_stats = False
+    stats_font = get_font(None, 20)
+    profiler = get_profiler()
     while running:
-        clock.tick(settings.FPS)
+        pacer.tick(idle=game.paused or game.game_over)
+        profiler.lap("tick")
         
         # Events
         for event in pygame.event.get():
+            profiler.handle_event(event)
             if event.type == pygame.QUIT:
                 running = False
             if event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_F3:
+                    show_net_stats = not show_net_stats
                 if event.key == pygame.K_r:
                     game.reset_game()
                     game.paused = False
                 if event.key == pygame.K_SPACE:
                     if not game.is_serving and not game.game_over:
                         game.paused = not game.paused
+        profiler.lap("events")
         
+        # Client dropped: hold the match while its session can be resumed
+        if not server.is_client_connected():
+            if not server.is_awaiting_resume():
+                print("Client did not come back, ending match")
+                break
+            game.draw(present=False)
+            text = render_text("Joueur 2 deconnecte, attente de reconnexion...", settings.RED, 20)
+            game.mark_dirty(screen.blit(text, (settings.SCREEN_WIDTH//2 - text.get_width()//2, settings.NAVBAR_HEIGHT + 10)))
+            game.present()
+            profiler.end_frame()
+            continue
+
         # Host Logic:
         # 1. Get Remote Input (Player 2)
         remote_input = server.get_client_input()
         if remote_input:
             game.process_remote_input(2, remote_input)
+        profiler.lap("net_recv")
             
         # 2. Handle Local Input (Player 1)
-        # We assume Host controls Player 1 (Top)
-        # Use ARROW KEYS for Host too (more intuitive than A/D)
-        keys = pygame.key.get_pressed()
-        if keys[pygame.K_LEFT]:
-            game.top_paddle.move(left=True, bounds=game.paddle_bounds)
-        if keys[pygame.K_RIGHT]:
-            game.top_paddle.move(left=False, bounds=game.paddle_bounds)
-            
-        # Aiming for Host (P1)
-        if game.is_serving and game.serving_player == 1:
-            aim_speed = 2.0
-            if keys[pygame.K_UP] or keys[pygame.K_w] or keys[pygame.K_z]:
-                 game.serve_angle = max(-45, game.serve_angle - aim_speed)
-            if keys[pygame.K_DOWN] or keys[pygame.K_s]:
-                 game.serve_angle = min(45, game.serve_angle + aim_speed)
-
-        if keys[pygame.K_SPACE] and game.is_serving and game.serving_player == 1:
-            game._serve_ball()
-        
-        # Power Shot for Host
-        if keys[pygame.K_p] and not game.is_serving:
-            game.direct_ball_to_king()
+        apply_host_input(game, pygame.key.get_pressed())
+        profiler.lap("input")
             
         # 3. Update Game
         game.update()
+        profiler.lap("update")
         
         # 4. Send State
         state = game.get_game_state()
         server.send_state(state)
+        game.record_tick(state)
+        profiler.lap("net_send")
         
-        # 5. Draw
-        game.draw()
-        game.draw_ui()
-        pygame.display.flip()
+        # 5. Draw (Game.draw already includes the UI overlay); shed under load
+        if pacer.render_due:
+            game.draw(present=False)
+            if show_net_stats:
+                game.mark_dirty(server.stats.draw_overlay(screen, stats_font))
+            game.mark_dirty(profiler.draw_overlay(screen))
+            profiler.lap("draw")
+            game.present()
+            profiler.lap("present")
+        profiler.end_frame()
         
+    game.end_match()
     server.close()
 
+def run_host_game_threaded(screen, pacer, server, config, recovered_state=None):
+    """Host loop for THREADED_SIMULATION: remote input, physics and sends run on the
+    simulation thread at a fixed rate, so a slow present never delays a state send."""
+    sim_game = Game(config)
+    sim_game.lag_compensator = LagCompensator(player_id=2, stats=server.stats)
+    sim_game.players = host_players(server)
+    if recovered_state:
+        sim_game.set_game_state(recovered_state)
+    sim_game.start_journal()
+
+    def host_step(game, keys):
+        # Hold the match while the client is away (resume handled by the server)
+        if not server.is_client_connected():
+            return
+        remote_input = server.get_client_input()
+        if remote_input:
+            game.process_remote_input(2, remote_input)
+        if keys is not None:
+            apply_host_input(game, keys)
+        game.update()
+        state = game.get_game_state()
+        server.send_state(state)
+        game.record_tick(state)
+
+    game = Game(config)  # View: only draws snapshots
+    game.simulation = SimulationThread(sim_game, host_step)
+    game.simulation.start()
+
+    show_net_stats = False
+    stats_font = get_font(None, 20)
+    profiler = get_profiler()
+    running = True
+    while running:
+        pacer.tick(idle=game.paused or game.game_over)
+        profiler.lap("tick")
+
+        for event in pygame.event.get():
+            profiler.handle_event(event)
+            if event.type == pygame.QUIT:
+                running = False
+            if event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_F3:
+                    show_net_stats = not show_net_stats
+                if event.key == pygame.K_r:
+                    game.simulation.command(Game.restart)
+                if event.key == pygame.K_SPACE:
+                    game.simulation.command(Game.toggle_pause)
+        game.simulation.set_keys(pygame.key.get_pressed())
+        profiler.lap("events")
+
+        if not server.is_client_connected() and not server.is_awaiting_resume():
+            print("Client did not come back, ending match")
+            break
+
+        state = game.simulation.latest_snapshot()
+        if state is not None:
+            game.apply_snapshot(state)
+        profiler.lap("snapshot")
+
+        game.draw(present=False)
+        if not server.is_client_connected():
+            text = render_text("Joueur 2 deconnecte, attente de reconnexion...", settings.RED, 20)
+            game.mark_dirty(screen.blit(text, (settings.SCREEN_WIDTH//2 - text.get_width()//2, settings.NAVBAR_HEIGHT + 10)))
+        if show_net_stats:
+            game.mark_dirty(server.stats.draw_overlay(screen, stats_font))
+        game.mark_dirty(profiler.draw_overlay(screen))
+        profiler.lap("draw")
+        game.present()
+        profiler.lap("present")
+        profiler.end_frame()
+
+    game.simulation.stop()
+    sim_game.end_match()
+
 def run_client_game(screen, clock, ip, port):
-    client = GameClient(ip, port=port)
+    client = create_client(ip, port)
+    pacer = FramePacer(clock)
     if not client.connect():
         print("Failed to connect")
         # Show error on screen
-        font = pygame.font.SysFont(None, 32)
         screen.fill(settings.WHITE)
         
         lines = [
@@ -166,10 +333,10 @@ def run_client_game(screen, clock, ip, port):
         
         for i, line in enumerate(lines):
             color = settings.RED if i == 0 else settings.BLACK
-            text = font.render(line, True, color)
+            text = render_text(line, color, 32)
             screen.blit(text, (settings.SCREEN_WIDTH//2 - text.get_width()//2, settings.SCREEN_HEIGHT//2 - 50 + i*40))
             
-        pygame.display.flip()
+        display.present()
         pygame.time.wait(4000)
         return
 
@@ -178,7 +345,7 @@ def run_client_game(screen, clock, ip, port):
     config = None
     waiting_config = True
     while waiting_config:
-        clock.tick(settings.FPS)
+        pacer.tick(idle=True)
         config = client.get_config()
         if config:
             waiting_config = False
@@ -195,12 +362,20 @@ def run_client_game(screen, clock, ip, port):
     # Init Game with received config
     game = Game(config) 
     
+    show_net_stats = False
+    stats_font = get_font(None, 20)
+    profiler = get_profiler()
     while running:
-        clock.tick(settings.FPS)
+        pacer.tick(idle=game.game_over)
+        profiler.lap("tick")
         
         for event in pygame.event.get():
+            profiler.handle_event(event)
             if event.type == pygame.QUIT:
                 running = False
+            if event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                show_net_stats = not show_net_stats
+        profiler.lap("events")
         
         # 1. Capture Local Input (Player 2 - Bottom)
         keys = pygame.key.get_pressed()
@@ -213,23 +388,31 @@ def run_client_game(screen, clock, ip, port):
             'p': keys[pygame.K_p]
         }
         client.send_input(inputs)
+        profiler.lap("net_send")
         
-        # 2. Receive State
-        state = client.get_game_state()
+        # 2. Receive State (only when a new one arrived)
+        state = client.get_new_game_state()
         if state:
             game.set_game_state(state)
+        profiler.lap("net_recv")
             
-        # 3. Draw
-        game.draw()
-        game.draw_ui()
-        pygame.display.flip()
+        # 3. Draw (Game.draw already includes the UI overlay); shed under load
+        if pacer.render_due:
+            game.draw(present=False)
+            if show_net_stats:
+                game.mark_dirty(client.stats.draw_overlay(screen, stats_font))
+            game.mark_dirty(profiler.draw_overlay(screen))
+            profiler.lap("draw")
+            game.present()
+            profiler.lap("present")
+        profiler.end_frame()
         
     client.close()
 
 def main():
     pygame.init()
-    screen = pygame.display.set_mode((settings.SCREEN_WIDTH, settings.SCREEN_HEIGHT), pygame.RESIZABLE)
-    pygame.display.set_caption(settings.TITLE)
+    # Fixed logical resolution, scaled to whatever size the window is resized to
+    screen = display.init_display(settings.TITLE)
     clock = pygame.time.Clock()
     
     # Network Menu
@@ -1,54 +1,154 @@
 import socket
 import threading
+import time
 from typing import Any, Dict, Optional
-from paddle_chess_game.network.utils import send_data, receive_data
+from paddle_chess_game import settings
+from paddle_chess_game.network.codecs import PROTOCOL_VERSION, CODECS, CODEC_PREFERENCE, DEFAULT_CODEC
+from paddle_chess_game.network.handoff import StateHandoff
+from paddle_chess_game.network.sender import SendPipeline
+from paddle_chess_game.network.stats import NetworkStats
+from paddle_chess_game.network.utils import (
+    PING_INTERVAL, HELLO_TIMEOUT, RESUME_GRACE_PERIOD, RECONNECT_DELAY, HandshakeError,
+    send_data, receive_data, make_ping, make_pong, rtt_from_pong
+)
 
 class GameClient:
     def __init__(self, host: str, port: int = 5555):
         self.host = host
         self.port = port
-        self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.socket: Optional[socket.socket] = None
         self.connected = False
-        self.latest_game_state = None
         self.game_config = None
+        # Guards game_config only; states go through the lock-free handoff
         self.state_lock = threading.Lock()
+        # All writes go through the pipeline's thread; the game loop never blocks on send
+        self.sender: Optional[SendPipeline] = None
+        self.stats = NetworkStats()
+        self.state_handoff = StateHandoff(self.stats)
+        self.last_ping = 0.0
+        # Wire format and server rates agreed during the handshake
+        self.codec = DEFAULT_CODEC
+        self.server_tick_rate: Optional[int] = None
+        self.server_snapshot_rate: Optional[int] = None
+
+        # Session token handed out by the server, used to resume after a drop
+        self.session_token: Optional[str] = None
+        self.reconnecting = False
+        self.closing = False
 
     def connect(self) -> bool:
         """Connect to the server."""
         try:
             print(f"Connecting to {self.host}:{self.port}...")
-            self.socket.settimeout(5.0)  # 5 seconds timeout for connection
-            self.socket.connect((self.host, self.port))
-            self.socket.settimeout(None)  # Remove timeout for blocking operations
+            self._open()
             self.connected = True
             print("Connected!")
-            
+
             # Start state receiving thread
             state_thread = threading.Thread(target=self._receive_loop)
             state_thread.daemon = True
             state_thread.start()
-            
+
             return True
         except Exception as e:
             print(f"Connection failed: {e}")
             return False
 
+    def _open(self, token: Optional[str] = None):
+        """Open a new socket and run the handshake (new session, or resume with token)."""
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        sock.settimeout(5.0)  # 5 seconds timeout for connection
+        sock.connect((self.host, self.port))
+
+        hello = {
+            'type': 'hello',
+            'version': PROTOCOL_VERSION,
+            'codecs': CODEC_PREFERENCE,
+            'tick_rate': settings.FPS,
+            'snapshot_rate': settings.FPS,
+        }
+        if token:
+            hello['token'] = token
+        send_data(sock, hello, self.stats)
+        sock.settimeout(HELLO_TIMEOUT)
+        welcome = receive_data(sock, self.stats)
+        sock.settimeout(None)  # Remove timeout for blocking operations
+
+        if not isinstance(welcome, dict):
+            # Timed out or dropped before answering: transient, like a refused connect
+            sock.close()
+            raise ConnectionError("No answer to handshake")
+        if welcome.get('type') != 'welcome':
+            sock.close()
+            raise HandshakeError(f"Server refused handshake: {welcome.get('reason')}")
+
+        self.codec = CODECS.get(welcome.get('codec'), DEFAULT_CODEC)
+        self.session_token = welcome.get('token')
+        self.server_tick_rate = welcome.get('tick_rate')
+        self.server_snapshot_rate = welcome.get('snapshot_rate')
+        print(f"Using {self.codec.name} codec (server protocol v{welcome.get('version')})")
+
+        self.socket = sock
+        self.sender = SendPipeline(sock, self.stats, codec=self.codec)
+
+    def _reconnect(self) -> bool:
+        """Try to resume the session until the server's grace period runs out."""
+        print("Connection lost, trying to resume session...")
+        self.reconnecting = True
+        deadline = time.monotonic() + RESUME_GRACE_PERIOD
+        try:
+            while not self.closing and time.monotonic() < deadline:
+                try:
+                    self._open(self.session_token)
+                    return True
+                except HandshakeError as e:
+                    print(e)
+                    return False
+                except OSError:  # Includes a handshake that got no answer
+                    time.sleep(RECONNECT_DELAY)
+            return False
+        finally:
+            self.reconnecting = False
+
     def _receive_loop(self):
         """Background thread to receive game state from server."""
         while self.connected:
-            data = receive_data(self.socket)
+            data = receive_data(self.socket, self.stats, self.codec)
             if data is None:
+                if self.sender:
+                    self.sender.close()
+                if self.session_token and not self.closing and self._reconnect():
+                    continue
                 print("Disconnected from server")
                 self.connected = False
                 break
-            
+
             # Check if it's a config message or raw state (backward compatibility or direct state)
-            if isinstance(data, dict) and 'type' in data and data['type'] == 'config':
+            msg_type = data.get('type') if isinstance(data, dict) else None
+            if msg_type == 'config':
                 with self.state_lock:
                     self.game_config = data['data']
+            elif msg_type == 'resync':
+                if data.get('config') is not None:
+                    with self.state_lock:
+                        self.game_config = data['config']
+                if data.get('state') is not None:
+                    self.state_handoff.publish(data['state'])
+                self.stats.mark_state()
+                print("Session resumed")
+            elif msg_type == 'ping':
+                self._send(make_pong(data))
+            elif msg_type == 'pong':
+                rtt = rtt_from_pong(data)
+                if rtt is not None:
+                    self.stats.record_rtt(rtt)
             else:
-                with self.state_lock:
-                    self.latest_game_state = data
+                self.state_handoff.publish(data)
+                self.stats.mark_state()
+
+    def _send(self, data: Any):
+        if self.sender:
+            self.sender.send(data)
 
     def get_config(self) -> Optional[Dict[str, Any]]:
         """Get the received game configuration."""
@@ -57,16 +157,26 @@ class GameClient:
 
     def get_game_state(self) -> Optional[Dict[str, Any]]:
         """Get the latest game state received from server."""
-        with self.state_lock:
-            return self.latest_game_state
+        return self.state_handoff.latest()
+
+    def get_new_game_state(self) -> Optional[Dict[str, Any]]:
+        """Get the latest game state only if it arrived since the previous call."""
+        return self.state_handoff.take_new()
 
     def send_input(self, inputs: Dict[str, bool]):
-        """Send local input state to server."""
-        if self.connected:
-            send_data(self.socket, inputs)
+        """Queue local input state for the server (non-blocking, newest wins)."""
+        if self.connected and self.sender:
+            now = time.perf_counter()
+            if now - self.last_ping >= PING_INTERVAL:
+                self.last_ping = now
+                self.sender.send(make_ping())
+            self.sender.send_state(inputs)
 
     def close(self):
         """Close connection."""
+        self.closing = True
         self.connected = False
+        if self.sender:
+            self.sender.close()
         if self.socket:
             self.socket.close()
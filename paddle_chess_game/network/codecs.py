@@ -0,0 +1,49 @@
+import marshal
+import pickle
+import zlib
+from typing import Any, Callable, Dict, List, NamedTuple
+
+# Bump whenever the handshake or the game state dict shape changes
+PROTOCOL_VERSION = 2
+
+
+class Codec(NamedTuple):
+    name: str
+    encode: Callable[[Any], bytes]
+    decode: Callable[[bytes], Any]
+
+
+def _pickle_encode(data: Any) -> bytes:
+    return pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def _zlib_encode(data: Any) -> bytes:
+    return zlib.compress(_pickle_encode(data), 1)
+
+
+def _zlib_decode(payload: bytes) -> Any:
+    return pickle.loads(zlib.decompress(payload))
+
+
+CODECS: Dict[str, Codec] = {
+    # Binary: plain dict/list/number/str frames, fastest to encode and decode
+    'marshal': Codec('marshal', lambda data: marshal.dumps(data, 4), marshal.loads),
+    # Pickle-compatible: handles any Python object
+    'pickle': Codec('pickle', _pickle_encode, pickle.loads),
+    # Compressed pickle: smallest frames, for slow links
+    'zlib': Codec('zlib', _zlib_encode, _zlib_decode),
+}
+
+# Fastest first; new codecs go at the front once both sides ship them
+CODEC_PREFERENCE: List[str] = ['marshal', 'pickle', 'zlib']
+
+# Codec used before negotiation (hello/welcome) and by peers that predate it
+DEFAULT_CODEC = CODECS['pickle']
+
+
+def negotiate(offered: List[str]) -> Codec:
+    """Pick the first codec of our preference order that the peer offered."""
+    for name in CODEC_PREFERENCE:
+        if name in offered:
+            return CODECS[name]
+    return DEFAULT_CODEC
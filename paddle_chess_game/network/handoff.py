@@ -0,0 +1,51 @@
+import time
+from typing import Any, Optional
+
+
+class StateHandoff:
+    """Lock-free handoff of the newest value from one writer to one reader.
+
+    The network thread publishes a complete (seq, value, time) tuple with a
+    single reference assignment, which is atomic under the GIL, so the
+    render loop never waits on a lock and values are passed without copying.
+    Published values must not be mutated afterwards.
+    """
+
+    def __init__(self, stats=None):
+        self._slot = (0, None, None)  # (sequence, value, publish time)
+        self._read_seq = 0
+        self.stats = stats
+        self.published = 0
+        # Values replaced before the reader saw them (approximate: racy by at most one)
+        self.overwritten = 0
+
+    def publish(self, value: Any):
+        """Writer side: make value the newest one."""
+        seq = self._slot[0]
+        if seq != self._read_seq:
+            self.overwritten += 1
+            if self.stats is not None:
+                self.stats.states_overwritten += 1
+        self._slot = (seq + 1, value, time.perf_counter())
+        self.published += 1
+
+    def latest(self) -> Optional[Any]:
+        """Reader side: newest value, whether or not it was already read."""
+        seq, value, _ = self._slot
+        self._read_seq = seq
+        return value
+
+    def take_new(self) -> Optional[Any]:
+        """Reader side: newest value if it arrived since the last read, else None."""
+        seq, value, _ = self._slot
+        if seq == self._read_seq:
+            return None
+        self._read_seq = seq
+        return value
+
+    def age(self) -> Optional[float]:
+        """Seconds since the newest value was published."""
+        published_at = self._slot[2]
+        if published_at is None:
+            return None
+        return time.perf_counter() - published_at
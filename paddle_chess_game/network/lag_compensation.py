@@ -0,0 +1,52 @@
+from collections import deque
+from typing import Optional
+
+import pygame
+
+from paddle_chess_game import settings
+from paddle_chess_game.objects.paddle import Paddle
+
+
+class LagCompensator:
+    """Server-side hit check for the remote player, against the ball they saw.
+
+    The remote player reacts to a state that left the host half an RTT ago,
+    and that reaction reaches the host half an RTT later: the paddle the host
+    holds now answers the ball from about one RTT back. The host keeps the
+    ball (position and velocity) for every tick, bounded by max_rewind
+    seconds, and also tests the current remote paddle against the ball of
+    that same moment. Only the ball is rewound; the paddle stays authoritative.
+    """
+
+    def __init__(self, player_id: int, stats=None, max_rewind: float = 0.2, tick_rate: int = settings.FPS):
+        self.player_id = player_id
+        self.stats = stats  # NetworkStats providing the smoothed RTT
+        self.tick_rate = tick_rate
+        self.max_ticks = int(max_rewind * tick_rate)
+        self.history = deque(maxlen=self.max_ticks + 1)  # Ball (x, y, vx, vy), newest last
+
+    def record(self, ball):
+        """Store the ball as sent to the client this tick (call once per update)."""
+        self.history.append((ball.x, ball.y, ball.vx, ball.vy))
+
+    def rewind_ticks(self) -> int:
+        """Ticks to rewind: estimated round-trip time, clamped to the window."""
+        rtt = self.stats.rtt if self.stats is not None else None
+        if not rtt:
+            return 0
+        ticks = int(round(rtt * self.tick_rate))
+        return max(0, min(ticks, self.max_ticks, len(self.history) - 1))
+
+    def seen_hit_x(self, ball, paddle: Paddle) -> Optional[float]:
+        """x of the ball as the remote player saw it, if that ball touched `paddle`."""
+        ticks = self.rewind_ticks()
+        if ticks == 0:
+            return None
+        x, y, _, vy = self.history[-1 - ticks]
+        if (vy > 0) != (ball.vy > 0):
+            return None  # The ball has bounced since: that approach is over
+        seen = pygame.Rect(int(x - ball.radius), int(y - ball.radius), ball.radius * 2, ball.radius * 2)
+        return x if seen.colliderect(paddle.rect) else None
+
+    def reset(self):
+        self.history.clear()
@@ -0,0 +1,116 @@
+import socket
+import threading
+from collections import deque
+from typing import Any
+
+from paddle_chess_game.network.codecs import Codec, DEFAULT_CODEC
+from paddle_chess_game.network.utils import send_data
+
+
+class SendPipeline:
+    """Writer thread that owns all sends on one socket.
+
+    The game loop only enqueues and never waits on the network:
+    - send_state() keeps a single slot; a newer frame replaces the unsent one.
+    - send() queues control messages, at most `max_queue` of them. Once the
+      queue is full, a ping/pong replaces the queued one of the same type (or
+      is dropped); any other message means the peer has stopped reading: the
+      socket is shut down at once (the receive loop then handles it as a
+      disconnect) and send() returns False without waiting.
+    """
+
+    PROBES = ('ping', 'pong')
+
+    def __init__(self, sock: socket.socket, stats=None, max_queue: int = 64, codec: Codec = DEFAULT_CODEC):
+        self.sock = sock
+        self.stats = stats
+        self.codec = codec
+        self.max_queue = max_queue
+        self.control = deque()
+        self.pending_state = None
+        self.cond = threading.Condition()
+        self.running = True
+        self.saturated = False
+
+        # Small frames every tick: disable Nagle so they leave immediately
+        try:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        except OSError as e:
+            print(f"Could not set TCP_NODELAY: {e}")
+
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.thread.start()
+
+    def send(self, data: Any) -> bool:
+        """Queue a control message (delivered in order). False if it was not queued."""
+        probe = data.get('type') if isinstance(data, dict) and data.get('type') in self.PROBES else None
+        with self.cond:
+            if not self.running:
+                return False
+            if len(self.control) >= self.max_queue:
+                if not self.saturated:
+                    self.saturated = True
+                    print(f"Send queue saturated ({len(self.control)} control messages pending)")
+                if probe is not None:
+                    # Only the newest probe matters for RTT: coalesce instead of growing
+                    for i in range(len(self.control) - 1, -1, -1):
+                        queued = self.control[i]
+                        if isinstance(queued, dict) and queued.get('type') == probe:
+                            self.control[i] = data
+                            return True
+                    return False
+                # Never wait on the caller's thread (the host tick): give up on the peer
+                print("Peer is not reading: closing the connection")
+                self.running = False
+                self.cond.notify_all()
+                self._shutdown()
+                return False
+            self.control.append(data)
+            self._update_depth()
+            self.cond.notify_all()
+            return True
+
+    def _shutdown(self):
+        try:
+            self.sock.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+
+    def send_state(self, state: Any):
+        """Queue a state frame, replacing any frame not yet written."""
+        with self.cond:
+            if self.pending_state is not None and self.stats is not None:
+                self.stats.record_coalesced()
+            self.pending_state = state
+            self._update_depth()
+            self.cond.notify_all()
+
+    def _update_depth(self):
+        if self.stats is not None:
+            self.stats.send_queue_depth = len(self.control) + (self.pending_state is not None)
+
+    def _run(self):
+        while True:
+            with self.cond:
+                while self.running and not self.control and self.pending_state is None:
+                    self.cond.wait()
+                if not self.running:
+                    return
+                # Control first so a config is never stuck behind state frames
+                if self.control:
+                    data = self.control.popleft()
+                    if len(self.control) < self.max_queue // 2:
+                        self.saturated = False
+                else:
+                    data = self.pending_state
+                    self.pending_state = None
+                self._update_depth()
+            if not send_data(self.sock, data, self.stats, self.codec):
+                with self.cond:
+                    self.running = False
+                return
+
+    def close(self):
+        with self.cond:
+            self.running = False
+            self.cond.notify_all()
@@ -1,10 +1,20 @@
+import secrets
 import socket
 import threading
+import time
 from typing import Any, Dict, Optional
-from paddle_chess_game.network.utils import send_data, receive_data
+from paddle_chess_game import settings
+from paddle_chess_game.network.codecs import PROTOCOL_VERSION, DEFAULT_CODEC, negotiate
+from paddle_chess_game.network.handoff import StateHandoff
+from paddle_chess_game.network.sender import SendPipeline
+from paddle_chess_game.network.stats import NetworkStats
+from paddle_chess_game.network.utils import (
+    PING_INTERVAL, HELLO_TIMEOUT, RESUME_GRACE_PERIOD,
+    send_data, receive_data, make_ping, make_pong, rtt_from_pong
+)
 
 class GameServer:
-    def __init__(self, host='0.0.0.0', port=5555):
+    def __init__(self, host='0.0.0.0', port=5555, grace_period: float = RESUME_GRACE_PERIOD):
         self.host = host
         self.port = port
         self.server_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
@@ -13,8 +23,24 @@ class GameServer:
         self.client_socket = None
         self.client_address = None
         self.running = False
-        self.latest_client_input = None
-        self.input_lock = threading.Lock()
+        # All writes go through the pipeline's thread; the game loop never blocks on send
+        self.sender: Optional[SendPipeline] = None
+        self.stats = NetworkStats()
+        # Inputs are handed to the game loop without a lock
+        self.input_handoff = StateHandoff(self.stats)
+        self.last_ping = 0.0
+        # Wire format and peer rates agreed during the handshake
+        self.codec = DEFAULT_CODEC
+        self.peer_tick_rate: Optional[int] = None
+        self.peer_snapshot_rate: Optional[int] = None
+
+        # Session kept alive across disconnects for grace_period seconds
+        self.session_token: Optional[str] = None
+        self.grace_period = grace_period
+        self.disconnected_at: Optional[float] = None
+        # Latest config/state, replayed to a resuming client in one message
+        self.game_config: Optional[Dict[str, Any]] = None
+        self.latest_state: Optional[Dict[str, Any]] = None
 
     def start(self):
         """Start listening for connections."""
@@ -31,53 +57,180 @@ class GameServer:
         """Wait for a client to connect (blocking)."""
         if not self.running:
             return False
-        
+
         print("Waiting for client...")
-        try:
-            self.client_socket, self.client_address = self.server_socket.accept()
-            print(f"Client connected from {self.client_address}")
-            
-            # Start input receiving thread
-            input_thread = threading.Thread(target=self._receive_loop)
-            input_thread.daemon = True
-            input_thread.start()
-            
-            return True
-        except Exception as e:
-            print(f"Error accepting connection: {e}")
+        while self.running:
+            try:
+                sock, address = self.server_socket.accept()
+            except Exception as e:
+                print(f"Error accepting connection: {e}")
+                return False
+            if self._attach(sock, address):
+                return True
+        return False
+
+    def _attach(self, sock: socket.socket, address) -> bool:
+        """Handshake with a new connection and bind it to the session.
+
+        The client's hello carries its protocol version, supported codecs,
+        tick/snapshot rates and, when resuming, its session token. The
+        welcome reply names the codec used for everything that follows.
+        """
+        sock.settimeout(HELLO_TIMEOUT)
+        hello = receive_data(sock, self.stats)
+        sock.settimeout(None)
+        msg_type = hello.get('type') if isinstance(hello, dict) else None
+
+        if msg_type != 'hello':
+            return self._reject(sock, address, "handshake required")
+        if hello.get('version') != PROTOCOL_VERSION:
+            return self._reject(sock, address, f"protocol version {hello.get('version')} not supported "
+                                               f"(server: {PROTOCOL_VERSION})")
+
+        resync = None
+        token = hello.get('token')
+        if token is None and self.session_token is None:
+            self.session_token = secrets.token_hex(16)
+            print(f"Client connected from {address}")
+        elif token is not None and self._can_resume(token):
+            # Full snapshot + config right behind the welcome: resume costs a single round trip
+            resync = {'type': 'resync', 'config': self.game_config, 'state': self.latest_state}
+            print(f"Client resumed session from {address}")
+        else:
+            return self._reject(sock, address, "no open session")
+
+        codec = negotiate(hello.get('codecs', []))
+        welcome = {
+            'type': 'welcome',
+            'version': PROTOCOL_VERSION,
+            'codec': codec.name,
+            'token': self.session_token,
+            'tick_rate': settings.FPS,
+            'snapshot_rate': settings.FPS,
+        }
+        if not send_data(sock, welcome, self.stats):
+            sock.close()
             return False
+        print(f"Using {codec.name} codec")
+
+        self.codec = codec
+        self.peer_tick_rate = hello.get('tick_rate')
+        self.peer_snapshot_rate = hello.get('snapshot_rate')
+        self.client_socket, self.client_address = sock, address
+        self.disconnected_at = None
+        self.sender = SendPipeline(sock, self.stats, codec=codec)
+        if resync:
+            self.sender.send(resync)
+
+        # Start input receiving thread
+        input_thread = threading.Thread(target=self._receive_loop)
+        input_thread.daemon = True
+        input_thread.start()
+        return True
+
+    def _reject(self, sock: socket.socket, address, reason: str) -> bool:
+        print(f"Rejected connection from {address}: {reason}")
+        send_data(sock, {'type': 'reject', 'reason': reason}, self.stats)
+        sock.close()
+        return False
+
+    def _can_resume(self, token: Optional[str]) -> bool:
+        if self.session_token is None or token != self.session_token:
+            return False
+        if self.disconnected_at is None:
+            return False  # Session still has a live connection
+        return time.monotonic() - self.disconnected_at <= self.grace_period
+
+    def _await_resume(self):
+        """Background thread: re-accept the same client until the grace period ends."""
+        print(f"Keeping session open for {self.grace_period:.0f}s")
+        while self.running and self.client_socket is None:
+            remaining = self.grace_period - (time.monotonic() - self.disconnected_at)
+            if remaining <= 0:
+                print("Session expired")
+                self.session_token = None
+                return
+            try:
+                self.server_socket.settimeout(remaining)
+                sock, address = self.server_socket.accept()
+            except socket.timeout:
+                continue
+            except OSError:
+                return
+            finally:
+                self.server_socket.settimeout(None)
+            self._attach(sock, address)
 
     def _receive_loop(self):
         """Background thread to receive inputs from client."""
-        while self.running and self.client_socket:
-            data = receive_data(self.client_socket)
+        sock = self.client_socket
+        codec = self.codec
+        while self.running and sock is self.client_socket:
+            data = receive_data(sock, self.stats, codec)
             if data is None:
                 print("Client disconnected")
-                self.client_socket.close()
-                self.client_socket = None
+                if self.sender:
+                    self.sender.close()
+                    self.sender = None
+                sock.close()
+                if self.running and self.session_token:
+                    # disconnected_at first: the host loop must never see "not connected"
+                    # without also seeing "awaiting resume", or it ends the match
+                    self.disconnected_at = time.monotonic()
+                    self.client_socket = None
+                    threading.Thread(target=self._await_resume, daemon=True).start()
+                else:
+                    self.client_socket = None
                 break
-            
-            with self.input_lock:
-                self.latest_client_input = data
+
+            msg_type = data.get('type') if isinstance(data, dict) else None
+            if msg_type == 'ping':
+                self._send(make_pong(data))
+            elif msg_type == 'pong':
+                rtt = rtt_from_pong(data)
+                if rtt is not None:
+                    self.stats.record_rtt(rtt)
+            else:
+                self.input_handoff.publish(data)
+                self.stats.mark_state()
+
+    def _send(self, data: Any):
+        sender = self.sender
+        if sender:
+            sender.send(data)
+
+    def is_client_connected(self) -> bool:
+        return self.client_socket is not None
+
+    def is_awaiting_resume(self) -> bool:
+        """True while the client is gone but its session can still be resumed."""
+        return self.client_socket is None and self.disconnected_at is not None and self.session_token is not None
 
     def get_client_input(self) -> Optional[Dict[str, bool]]:
         """Get the latest input received from client."""
-        with self.input_lock:
-            return self.latest_client_input
+        return self.input_handoff.latest()
 
     def send_state(self, state: Dict[str, Any]):
-        """Send game state to client."""
-        if self.client_socket:
-            send_data(self.client_socket, state)
+        """Queue game state for the client (non-blocking, newest frame wins)."""
+        self.latest_state = state
+        sender = self.sender
+        if sender:
+            now = time.perf_counter()
+            if now - self.last_ping >= PING_INTERVAL:
+                self.last_ping = now
+                sender.send(make_ping())
+            sender.send_state(state)
 
     def send_config(self, config: Dict[str, Any]):
         """Send game configuration to client."""
-        if self.client_socket:
-            send_data(self.client_socket, {'type': 'config', 'data': config})
+        self.game_config = config
+        self._send({'type': 'config', 'data': config})
 
     def close(self):
         """Stop server and close connections."""
         self.running = False
+        if self.sender:
+            self.sender.close()
         if self.client_socket:
             self.client_socket.close()
         if self.server_socket:
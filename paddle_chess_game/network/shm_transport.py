@@ -0,0 +1,353 @@
+"""
+Shared-memory transport for a host and client on the same machine.
+
+Drop-in replacement for GameServer/GameClient (same send_state /
+get_game_state / send_input / get_client_input interface) that exchanges
+frames through two ring buffers in one multiprocessing.shared_memory
+block instead of a TCP socket: no syscalls and no kernel network stack,
+each frame is one copy into and one copy out of shared memory.
+
+The game config is not a ring frame: states would overwrite it before a
+slow client polls. It has its own region after the control header,
+written once per send_config() under a sequence counter (odd while the
+host is writing) and read by the client whenever the counter changes.
+"""
+import os
+import pickle
+import struct
+import time
+from multiprocessing import shared_memory
+from typing import Any, Dict, List, Optional
+
+from paddle_chess_game.network.handoff import StateHandoff
+from paddle_chess_game.network.stats import NetworkStats
+
+MAGIC = 0x50434D53  # "PCMS"
+# magic, client attached, server closed, host pid, config sequence, config length
+CONTROL = struct.Struct('!IIIIII')
+FIELD = struct.Struct('!I')
+ATTACHED_AT, CLOSED_AT, CONFIG_SEQ_AT, CONFIG_LENGTH_AT = 4, 8, 16, 20
+CONTROL_SIZE = 64
+RING_SLOTS = 16
+SLOT_SIZE = 16 * 1024  # Largest frame that fits in one slot (header included)
+CONFIG_SIZE = SLOT_SIZE  # Config region, right after the control header
+RINGS_AT = CONTROL_SIZE + CONFIG_SIZE
+
+
+def segment_name(port: int) -> str:
+    return f"pongechec_{port}"
+
+
+def _pid_alive(pid: int) -> bool:
+    if os.name == 'nt':
+        return True  # Windows frees a segment with its last handle: a leftover has a live owner
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass  # Exists, owned by another user
+    return True
+
+
+class ShmRing:
+    """Single-producer / single-consumer ring of fixed-size slots.
+
+    Layout: head sequence (u64), then `slots` slots of
+    [sequence u64 | length u32 | payload]. A slot's sequence is cleared while
+    it is being written and set last, so a reader that sees the same
+    sequence before and after copying has a complete frame (seqlock).
+    """
+
+    HEAD = struct.Struct('!Q')
+    SLOT_HEADER = struct.Struct('!QI')
+
+    def __init__(self, buf: memoryview, slots: int = RING_SLOTS, slot_size: int = SLOT_SIZE):
+        self.buf = buf
+        self.slots = slots
+        self.slot_size = slot_size
+        self.read_seq = 0
+        self.dropped = 0  # Frames overwritten before the reader got to them
+
+    @classmethod
+    def size(cls, slots: int = RING_SLOTS, slot_size: int = SLOT_SIZE) -> int:
+        return cls.HEAD.size + slots * slot_size
+
+    def _offset(self, seq: int) -> int:
+        return self.HEAD.size + (seq % self.slots) * self.slot_size
+
+    def write(self, payload: bytes) -> bool:
+        """Append one frame. Return False if it does not fit in a slot."""
+        length = len(payload)
+        if length > self.slot_size - self.SLOT_HEADER.size:
+            return False
+        seq = self.HEAD.unpack_from(self.buf, 0)[0] + 1
+        offset = self._offset(seq)
+        start = offset + self.SLOT_HEADER.size
+        self.SLOT_HEADER.pack_into(self.buf, offset, 0, length)
+        self.buf[start:start + length] = payload
+        self.SLOT_HEADER.pack_into(self.buf, offset, seq, length)
+        self.HEAD.pack_into(self.buf, 0, seq)
+        return True
+
+    def read_new(self) -> List[bytes]:
+        """Return every frame written since the last call, oldest first."""
+        head = self.HEAD.unpack_from(self.buf, 0)[0]
+        first = max(self.read_seq + 1, head - self.slots + 1)
+        self.dropped += first - (self.read_seq + 1)
+        frames = []
+        for seq in range(first, head + 1):
+            offset = self._offset(seq)
+            start = offset + self.SLOT_HEADER.size
+            before, length = self.SLOT_HEADER.unpack_from(self.buf, offset)
+            data = bytes(self.buf[start:start + length])
+            after = self.SLOT_HEADER.unpack_from(self.buf, offset)[0]
+            if before != seq or after != seq:
+                self.dropped += 1  # Lapped by the writer mid-copy
+                continue
+            frames.append(data)
+        self.read_seq = head
+        return frames
+
+
+class _ShmEndpoint:
+    """Shared plumbing: one control header and two rings in a single block."""
+
+    def __init__(self):
+        self.shm: Optional[shared_memory.SharedMemory] = None
+        self.outgoing: Optional[ShmRing] = None
+        self.incoming: Optional[ShmRing] = None
+        self.stats = NetworkStats()
+
+    @staticmethod
+    def total_size() -> int:
+        return RINGS_AT + 2 * ShmRing.size()
+
+    def _bind_rings(self, server_side: bool):
+        buf = self.shm.buf
+        ring_size = ShmRing.size()
+        to_client = ShmRing(buf[RINGS_AT:RINGS_AT + ring_size])
+        to_server = ShmRing(buf[RINGS_AT + ring_size:RINGS_AT + 2 * ring_size])
+        self.outgoing, self.incoming = (to_client, to_server) if server_side else (to_server, to_client)
+
+    def _control(self):
+        return CONTROL.unpack_from(self.shm.buf, 0)
+
+    def _set(self, offset: int, value: int):
+        FIELD.pack_into(self.shm.buf, offset, value)
+
+    def _send(self, data: Any):
+        if self.outgoing is None:
+            return
+        start = time.perf_counter()
+        payload = pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL)
+        encode_time = time.perf_counter() - start
+        if self.outgoing.write(payload):
+            self.stats.record_sent(len(payload), encode_time)
+        else:
+            print(f"Frame too large for shared memory slot ({len(payload)} bytes)")
+
+    def _receive_all(self) -> List[Any]:
+        if self.incoming is None:
+            return []
+        messages = []
+        for frame in self.incoming.read_new():
+            start = time.perf_counter()
+            messages.append(pickle.loads(frame))
+            self.stats.record_received(len(frame), time.perf_counter() - start)
+        return messages
+
+    def _release(self):
+        # Drop ring views before closing, otherwise the mmap stays exported
+        if self.outgoing is not None:
+            self.outgoing.buf.release()
+            self.incoming.buf.release()
+            self.outgoing = self.incoming = None
+        if self.shm is not None:
+            self.shm.close()
+
+
+class SharedMemoryServer(_ShmEndpoint):
+    """Host side: creates the segment for `port` and waits for a local client."""
+
+    def __init__(self, host='0.0.0.0', port=5555):
+        super().__init__()
+        self.host = host
+        self.port = port
+        self.running = False
+        self.input_handoff = StateHandoff(self.stats)
+        self.game_config: Optional[Dict[str, Any]] = None
+
+    def start(self):
+        """Create the shared memory segment."""
+        name = segment_name(self.port)
+        try:
+            try:
+                self.shm = shared_memory.SharedMemory(name=name, create=True, size=self.total_size())
+            except FileExistsError:
+                if not self._unlink_stale(name):
+                    print(f"Shared memory segment {name} is in use by another host")
+                    self.running = False
+                    return
+                self.shm = shared_memory.SharedMemory(name=name, create=True, size=self.total_size())
+        except Exception as e:
+            print(f"Failed to create shared memory: {e}")
+            self.running = False
+            return
+        self.shm.buf[:self.total_size()] = bytes(self.total_size())
+        CONTROL.pack_into(self.shm.buf, 0, MAGIC, 0, 0, os.getpid(), 0, 0)
+        self._bind_rings(server_side=True)
+        self.running = True
+        print(f"Shared memory server started ({segment_name(self.port)})")
+
+    def _unlink_stale(self, name: str) -> bool:
+        """Unlink a leftover segment unless a running host still owns it."""
+        existing = shared_memory.SharedMemory(name=name)
+        try:
+            live = False
+            if existing.size >= CONTROL.size:
+                magic, _, closed, owner, _, _ = CONTROL.unpack_from(existing.buf, 0)
+                # A crashed host leaves closed == 0 too: its pid is what tells them apart
+                live = magic == MAGIC and not closed and _pid_alive(owner)
+            if not live:
+                existing.unlink()
+            return not live
+        finally:
+            existing.close()
+
+    def wait_for_client(self) -> bool:
+        """Wait for a local client to attach (blocking)."""
+        print("Waiting for client...")
+        while self.running:
+            if self._control()[1]:
+                print("Client attached to shared memory")
+                return True
+            time.sleep(0.05)
+        return False
+
+    def is_client_connected(self) -> bool:
+        return self.running and bool(self._control()[1])
+
+    def is_awaiting_resume(self) -> bool:
+        return False
+
+    def _poll(self):
+        for data in self._receive_all():
+            self.input_handoff.publish(data)
+            self.stats.mark_state()
+
+    def get_client_input(self) -> Optional[Dict[str, bool]]:
+        """Get the latest input written by the client."""
+        self._poll()
+        return self.input_handoff.latest()
+
+    def send_state(self, state: Dict[str, Any]):
+        self._send(state)
+
+    def send_config(self, config: Dict[str, Any]):
+        self.game_config = config
+        payload = pickle.dumps(config, protocol=pickle.HIGHEST_PROTOCOL)
+        if len(payload) > CONFIG_SIZE:
+            print(f"Config too large for shared memory ({len(payload)} bytes)")
+            return
+        seq = self._control()[4]
+        self._set(CONFIG_SEQ_AT, seq + 1)  # Odd: being written
+        self.shm.buf[CONTROL_SIZE:CONTROL_SIZE + len(payload)] = payload
+        self._set(CONFIG_LENGTH_AT, len(payload))
+        self._set(CONFIG_SEQ_AT, seq + 2)
+
+    def close(self):
+        """Flag the client, then release and unlink the segment."""
+        if self.shm is None:
+            return
+        self.running = False
+        self._set(CLOSED_AT, 1)
+        self._release()
+        try:
+            self.shm.unlink()
+        except FileNotFoundError:
+            pass
+        self.shm = None
+
+
+class SharedMemoryClient(_ShmEndpoint):
+    """Client side: attaches to the host's segment for `port`."""
+
+    def __init__(self, host: str = None, port: int = 5555):
+        super().__init__()
+        self.host = host  # Unused: shared memory is local only
+        self.port = port
+        self.connected = False
+        self.game_config = None
+        self.config_seq = 0  # Last config sequence read
+        self.state_handoff = StateHandoff(self.stats)
+
+    def connect(self) -> bool:
+        """Attach to the host's segment."""
+        try:
+            self.shm = shared_memory.SharedMemory(name=segment_name(self.port))
+        except FileNotFoundError:
+            print(f"No shared memory server on port {self.port}")
+            return False
+        try:
+            # The host owns the segment; keep this process from unlinking it at exit
+            from multiprocessing import resource_tracker
+            resource_tracker.unregister(self.shm._name, 'shared_memory')
+        except Exception:
+            pass
+        magic, _, closed = self._control()[:3]
+        if magic != MAGIC or closed:
+            print("Shared memory segment is not an open game")
+            self.shm.close()
+            self.shm = None
+            return False
+        self._bind_rings(server_side=False)
+        self._set(ATTACHED_AT, 1)
+        self.connected = True
+        print("Connected through shared memory!")
+        return True
+
+    def _poll(self):
+        if not self.connected:
+            return
+        control = self._control()
+        if control[2]:
+            print("Disconnected from server")
+            self.connected = False
+            return
+        if control[4] != self.config_seq and control[4] % 2 == 0:
+            self._read_config(control[4], control[5])
+        for data in self._receive_all():
+            self.state_handoff.publish(data)
+            self.stats.mark_state()
+
+    def _read_config(self, seq: int, length: int):
+        payload = bytes(self.shm.buf[CONTROL_SIZE:CONTROL_SIZE + length])
+        if self._control()[4] != seq:
+            return  # Rewritten mid-copy: read it on the next poll
+        self.config_seq = seq
+        self.game_config = pickle.loads(payload)
+
+    def get_config(self) -> Optional[Dict[str, Any]]:
+        self._poll()
+        return self.game_config
+
+    def get_game_state(self) -> Optional[Dict[str, Any]]:
+        self._poll()
+        return self.state_handoff.latest()
+
+    def get_new_game_state(self) -> Optional[Dict[str, Any]]:
+        self._poll()
+        return self.state_handoff.take_new()
+
+    def send_input(self, inputs: Dict[str, bool]):
+        if self.connected:
+            self._send(inputs)
+
+    def close(self):
+        self.connected = False
+        if self.shm is not None:
+            # Detach first so the host stops treating us as connected
+            self._set(ATTACHED_AT, 0)
+            self._release()
+            self.shm = None
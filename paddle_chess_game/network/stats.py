@@ -0,0 +1,206 @@
+import threading
+import time
+from collections import deque
+from typing import Any, Dict, List, Optional, Tuple
+
+import pygame
+
+from paddle_chess_game import settings
+
+
+class RollingRate:
+    """Count events and bytes over a sliding time window."""
+
+    def __init__(self, window: float = 1.0):
+        self.window = window
+        self.samples = deque()  # (timestamp, amount)
+        self.total = 0
+
+    def add(self, amount: int, now: float):
+        self.samples.append((now, amount))
+        self.total += amount
+        self._expire(now)
+
+    def _expire(self, now: float):
+        limit = now - self.window
+        while self.samples and self.samples[0][0] < limit:
+            _, amount = self.samples.popleft()
+            self.total -= amount
+
+    def per_second(self, now: float) -> Tuple[float, float]:
+        """Return (amount/sec, events/sec) over the window."""
+        self._expire(now)
+        return self.total / self.window, len(self.samples) / self.window
+
+
+class Histogram:
+    """Fixed-bucket histogram (upper bounds are inclusive)."""
+
+    def __init__(self, bounds: List[float]):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, value: float):
+        index = len(self.bounds)
+        for i, bound in enumerate(self.bounds):
+            if value <= bound:
+                index = i
+                break
+        self.counts[index] += 1
+        self.count += 1
+        self.total += value
+        if value > self.max:
+            self.max = value
+
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def percentile(self, p: float) -> float:
+        """Approximate percentile: upper bound of the bucket holding it."""
+        if not self.count:
+            return 0.0
+        target = self.count * p / 100.0
+        seen = 0
+        for i, c in enumerate(self.counts):
+            seen += c
+            if seen >= target:
+                return self.bounds[i] if i < len(self.bounds) else self.max
+        return self.max
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            'count': self.count,
+            'mean': self.mean(),
+            'p50': self.percentile(50),
+            'p95': self.percentile(95),
+            'max': self.max,
+            'buckets': list(zip(self.bounds + [float('inf')], self.counts)),
+        }
+
+
+# Bucket bounds: frame sizes in bytes, codec times in microseconds
+SIZE_BUCKETS = [64, 128, 256, 512, 1024, 2048, 4096, 8192, 16384, 65536]
+TIME_BUCKETS_US = [5, 10, 25, 50, 100, 250, 500, 1000, 2500, 10000]
+
+
+class NetworkStats:
+    """Thread-safe network counters shared by GameServer and GameClient.
+
+    Written by the network threads and the game loop, read through
+    snapshot() or drawn with draw_overlay().
+    """
+
+    def __init__(self, window: float = 1.0):
+        self.lock = threading.Lock()
+        self.sent = RollingRate(window)
+        self.received = RollingRate(window)
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.messages_sent = 0
+        self.messages_received = 0
+        self.frame_sizes = Histogram(SIZE_BUCKETS)
+        self.encode_times = Histogram(TIME_BUCKETS_US)
+        self.decode_times = Histogram(TIME_BUCKETS_US)
+        self.rtt: Optional[float] = None  # Smoothed, seconds
+        self.last_rtt: Optional[float] = None
+        self.send_queue_depth = 0
+        self.states_coalesced = 0  # State frames replaced before being written
+        self.states_overwritten = 0  # Received frames replaced before being read
+        self.last_state_time: Optional[float] = None
+
+    def record_sent(self, nbytes: int, encode_seconds: float):
+        now = time.perf_counter()
+        with self.lock:
+            self.sent.add(nbytes, now)
+            self.bytes_sent += nbytes
+            self.messages_sent += 1
+            self.frame_sizes.add(nbytes)
+            self.encode_times.add(encode_seconds * 1e6)
+
+    def record_received(self, nbytes: int, decode_seconds: float):
+        now = time.perf_counter()
+        with self.lock:
+            self.received.add(nbytes, now)
+            self.bytes_received += nbytes
+            self.messages_received += 1
+            self.frame_sizes.add(nbytes)
+            self.decode_times.add(decode_seconds * 1e6)
+
+    def record_rtt(self, rtt: float):
+        with self.lock:
+            self.last_rtt = rtt
+            # Exponential smoothing, same weight as TCP's SRTT
+            self.rtt = rtt if self.rtt is None else self.rtt * 0.875 + rtt * 0.125
+
+    def record_coalesced(self):
+        with self.lock:
+            self.states_coalesced += 1
+
+    def mark_state(self):
+        """Note that a fresh state (or input) has just arrived."""
+        self.last_state_time = time.perf_counter()
+
+    def state_age(self) -> Optional[float]:
+        """Seconds since the latest state arrived, or None."""
+        if self.last_state_time is None:
+            return None
+        return time.perf_counter() - self.last_state_time
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return a plain dict copy of all counters."""
+        now = time.perf_counter()
+        with self.lock:
+            out_bps, out_mps = self.sent.per_second(now)
+            in_bps, in_mps = self.received.per_second(now)
+            return {
+                'rtt_ms': self.rtt * 1000 if self.rtt is not None else None,
+                'last_rtt_ms': self.last_rtt * 1000 if self.last_rtt is not None else None,
+                'out_bytes_per_sec': out_bps,
+                'out_msgs_per_sec': out_mps,
+                'in_bytes_per_sec': in_bps,
+                'in_msgs_per_sec': in_mps,
+                'bytes_sent': self.bytes_sent,
+                'bytes_received': self.bytes_received,
+                'messages_sent': self.messages_sent,
+                'messages_received': self.messages_received,
+                'frame_size': self.frame_sizes.as_dict(),
+                'encode_us': self.encode_times.as_dict(),
+                'decode_us': self.decode_times.as_dict(),
+                'send_queue_depth': self.send_queue_depth,
+                'states_coalesced': self.states_coalesced,
+                'states_overwritten': self.states_overwritten,
+                'state_age_ms': self.state_age() * 1000 if self.last_state_time is not None else None,
+            }
+
+    def overlay_lines(self) -> List[str]:
+        s = self.snapshot()
+
+        def ms(value):
+            return f"{value:.1f} ms" if value is not None else "-"
+
+        return [
+            f"RTT: {ms(s['rtt_ms'])} (last {ms(s['last_rtt_ms'])})",
+            f"Out: {s['out_bytes_per_sec'] / 1024:.1f} KB/s  {s['out_msgs_per_sec']:.0f} msg/s",
+            f"In:  {s['in_bytes_per_sec'] / 1024:.1f} KB/s  {s['in_msgs_per_sec']:.0f} msg/s",
+            f"Frame: avg {s['frame_size']['mean']:.0f} B  p95 {s['frame_size']['p95']:.0f} B",
+            f"Encode p95: {s['encode_us']['p95']:.0f} us  Decode p95: {s['decode_us']['p95']:.0f} us",
+            f"Send queue: {s['send_queue_depth']}  Coalesced: {s['states_coalesced']}",
+            f"State age: {ms(s['state_age_ms'])}  Overwritten: {s['states_overwritten']}",
+        ]
+
+    def draw_overlay(self, surface: pygame.Surface, font: pygame.font.Font,
+                     pos: Tuple[int, int] = (10, 70)) -> pygame.Rect:
+        """Draw the stats as a small translucent panel and return its area."""
+        lines = [font.render(line, True, settings.WHITE) for line in self.overlay_lines()]
+        width = max(line.get_width() for line in lines) + 12
+        height = sum(line.get_height() for line in lines) + 12
+        panel = pygame.Surface((width, height), pygame.SRCALPHA)
+        panel.fill((0, 0, 0, 170))
+        y = 6
+        for line in lines:
+            panel.blit(line, (6, y))
+            y += line.get_height()
+        return surface.blit(panel, pos)
@@ -1,38 +1,72 @@
 import socket
 import struct
-import pickle
+import time
 from typing import Any, Optional
 
-def send_data(sock: socket.socket, data: Any):
-    """Send data with length prefix."""
+from paddle_chess_game.network.codecs import Codec, DEFAULT_CODEC
+
+PING_INTERVAL = 1.0  # Seconds between RTT probes
+HELLO_TIMEOUT = 5.0  # Seconds the server waits for a join/resume message
+RESUME_GRACE_PERIOD = 30.0  # Seconds a dropped session stays resumable
+RECONNECT_DELAY = 0.5  # Seconds between client resume attempts
+
+
+def send_data(sock: socket.socket, data: Any, stats=None, codec: Codec = DEFAULT_CODEC) -> bool:
+    """Send data with length prefix. Return False if the send failed."""
     try:
-        serialized = pickle.dumps(data)
+        start = time.perf_counter()
+        serialized = codec.encode(data)
+        encode_time = time.perf_counter() - start
         # Prefix with length (4 bytes network byte order)
         message = struct.pack('!I', len(serialized)) + serialized
         sock.sendall(message)
+        if stats is not None:
+            stats.record_sent(len(message), encode_time)
+        return True
     except Exception as e:
         print(f"Error sending data: {e}")
+        return False
 
-def receive_data(sock: socket.socket) -> Optional[Any]:
+def receive_data(sock: socket.socket, stats=None, codec: Codec = DEFAULT_CODEC) -> Optional[Any]:
     """Receive data with length prefix."""
     try:
         # Read length prefix
         length_data = recv_all(sock, 4)
         if not length_data:
             return None
-        
+
         length = struct.unpack('!I', length_data)[0]
-        
+
         # Read data
         data = recv_all(sock, length)
         if not data:
             return None
-            
-        return pickle.loads(data)
+
+        start = time.perf_counter()
+        obj = codec.decode(data)
+        if stats is not None:
+            stats.record_received(length + 4, time.perf_counter() - start)
+        return obj
     except Exception as e:
         print(f"Error receiving data: {e}")
         return None
 
+class HandshakeError(Exception):
+    """The peer refused the hello (version mismatch, unknown session...)."""
+
+def make_ping() -> dict:
+    """Build an RTT probe; the peer echoes 't' back in a pong."""
+    return {'type': 'ping', 't': time.perf_counter()}
+
+def make_pong(ping: dict) -> dict:
+    return {'type': 'pong', 't': ping.get('t')}
+
+def rtt_from_pong(pong: dict) -> Optional[float]:
+    sent_at = pong.get('t')
+    if sent_at is None:
+        return None
+    return time.perf_counter() - sent_at
+
 def recv_all(sock: socket.socket, n: int) -> Optional[bytes]:
     """Helper to receive exactly n bytes."""
     data = b''
@@ -1,13 +1,16 @@
 import pygame
 import sys
 from paddle_chess_game import settings
+from paddle_chess_game.utils import display
+from paddle_chess_game.utils.pacing import FramePacer
+from paddle_chess_game.utils.text import get_font, render_text
 
 class NetworkMenu:
     def __init__(self, screen):
         self.screen = screen
-        self.font = pygame.font.SysFont(None, 36)
-        self.title_font = pygame.font.SysFont(None, 48)
-        self.input_font = pygame.font.SysFont(None, 32)
+        self.font = get_font(None, 36)
+        self.title_font = get_font(None, 48)
+        self.input_font = get_font(None, 32)
         
         self.options = ["Local Game", "Host Game (Server)", "Join Game (Client)"]
         self.selected_index = 0
@@ -16,30 +19,33 @@ class NetworkMenu:
         self.port_input = "5555"
         self.is_typing_ip = False
         self.is_typing_port = False
+        # Input driven: sleep until an event (or the idle timeout) instead of spinning
+        self.pacer = FramePacer(pygame.time.Clock())
         
     def run(self):
         """Run the menu loop and return the selected mode, IP, and Port."""
         while True:
+            self.pacer.tick(idle=True)
             self.screen.fill(settings.WHITE)
             
             # Draw title
-            title = self.title_font.render("Select Game Mode", True, settings.BLACK)
+            title = render_text("Select Game Mode", settings.BLACK, 48)
             self.screen.blit(title, (settings.SCREEN_WIDTH // 2 - title.get_width() // 2, 100))
             
             # Draw options
             for i, option in enumerate(self.options):
                 color = settings.BLUE if i == self.selected_index else settings.BLACK
-                text = self.font.render(option, True, color)
+                text = render_text(option, color, 36)
                 rect = text.get_rect(center=(settings.SCREEN_WIDTH // 2, 250 + i * 60))
                 self.screen.blit(text, rect)
                 
                 # If "Host Game" is selected, show Port input
                 if i == 1 and self.selected_index == 1:
-                    port_label = self.font.render("Port:", True, settings.GREY)
+                    port_label = render_text("Port:", settings.GREY, 36)
                     self.screen.blit(port_label, (settings.SCREEN_WIDTH // 2 - 100, 450))
                     
                     port_color = settings.BLUE if self.is_typing_port else settings.BLACK
-                    port_text = self.input_font.render(self.port_input, True, port_color)
+                    port_text = render_text(self.port_input, port_color, 32)
                     port_rect = pygame.Rect(settings.SCREEN_WIDTH // 2 + 10, 445, 100, 35)
                     pygame.draw.rect(self.screen, settings.GREY, port_rect, 1)
                     self.screen.blit(port_text, (port_rect.x + 5, port_rect.y + 5))
@@ -47,26 +53,26 @@ class NetworkMenu:
                 # If "Join Game" is selected, show IP and Port input
                 if i == 2 and self.selected_index == 2:
                     # IP
-                    ip_label = self.font.render("IP:", True, settings.GREY)
+                    ip_label = render_text("IP:", settings.GREY, 36)
                     self.screen.blit(ip_label, (settings.SCREEN_WIDTH // 2 - 150, 450))
                     
                     ip_color = settings.BLUE if self.is_typing_ip else settings.BLACK
-                    ip_text = self.input_font.render(self.ip_input, True, ip_color)
+                    ip_text = render_text(self.ip_input, ip_color, 32)
                     ip_rect = pygame.Rect(settings.SCREEN_WIDTH // 2 - 100, 445, 200, 35)
                     pygame.draw.rect(self.screen, settings.GREY, ip_rect, 1)
                     self.screen.blit(ip_text, (ip_rect.x + 5, ip_rect.y + 5))
                     
                     # Port
-                    port_label = self.font.render("Port:", True, settings.GREY)
+                    port_label = render_text("Port:", settings.GREY, 36)
                     self.screen.blit(port_label, (settings.SCREEN_WIDTH // 2 + 120, 450))
                     
                     port_color = settings.BLUE if self.is_typing_port else settings.BLACK
-                    port_text = self.input_font.render(self.port_input, True, port_color)
+                    port_text = render_text(self.port_input, port_color, 32)
                     port_rect = pygame.Rect(settings.SCREEN_WIDTH // 2 + 180, 445, 80, 35)
                     pygame.draw.rect(self.screen, settings.GREY, port_rect, 1)
                     self.screen.blit(port_text, (port_rect.x + 5, port_rect.y + 5))
 
-            pygame.display.flip()
+            display.present()
             
             # Event handling
             for event in pygame.event.get():
@@ -114,7 +120,7 @@ class NetworkMenu:
                                 self.is_typing_ip = not self.is_typing_ip
                                 
                 if event.type == pygame.MOUSEBUTTONDOWN:
-                    mouse_pos = pygame.mouse.get_pos()
+                    mouse_pos = display.get_mouse_pos()
                     # Hit testing logic (simplified)
                     # ... (omitted for brevity, keyboard is safer for now)
                     pass
@@ -66,21 +66,25 @@ class Ball:
 
     def collide_with_paddle(self, paddle: Paddle):
         if self.rect.colliderect(paddle.rect):
-            # Record which player touched the ball
-            self.last_touched_by = paddle.owner
-            
-            # Vertical bounce (for horizontal paddles)
-            if self.vy > 0:
-                # Ball going down, hit bottom paddle - place ball above paddle
-                self.y = paddle.rect.top - self.radius
-            else:
-                # Ball going up, hit top paddle - place ball below paddle
-                self.y = paddle.rect.bottom + self.radius
-            self.vy *= -1
-            
-            # Add horizontal angle based on hit position (adds spin effect)
-            offset = (self.x - paddle.rect.centerx) / (paddle.rect.width / 2)
-            self.vx += offset * 1.5  # Reduced spin effect
+            self.bounce_off_paddle(paddle)
+
+    def bounce_off_paddle(self, paddle: Paddle, hit_x: Optional[float] = None):
+        """Bounce off `paddle`; hit_x (default: the ball's x) sets the spin."""
+        # Record which player touched the ball
+        self.last_touched_by = paddle.owner
+        
+        # Vertical bounce (for horizontal paddles)
+        if self.vy > 0:
+            # Ball going down, hit bottom paddle - place ball above paddle
+            self.y = paddle.rect.top - self.radius
+        else:
+            # Ball going up, hit top paddle - place ball below paddle
+            self.y = paddle.rect.bottom + self.radius
+        self.vy *= -1
+        
+        # Add horizontal angle based on hit position (adds spin effect)
+        offset = ((self.x if hit_x is None else hit_x) - paddle.rect.centerx) / (paddle.rect.width / 2)
+        self.vx += offset * 1.5  # Reduced spin effect
 
     def collide_with_pieces(self, pieces: List[ChessPiece]) -> Optional[ChessPiece]:
         hit_piece: Optional[ChessPiece] = None
@@ -1,4 +1,4 @@
-from typing import List
+from typing import Dict, List, Tuple
 import pygame
 
 from paddle_chess_game import settings
@@ -8,6 +8,14 @@ from paddle_chess_game.objects.chess_piece import ChessPiece
 BACK_RANK = ["tour", "chevalier", "fou", "reine", "roi", "fou", "chevalier", "tour"]
 PAWN_RANK = ["pion"] * 8
 
+# Pre-rendered static layers (background + checkerboard), keyed by geometry
+_static_layers: Dict[Tuple[int, ...], pygame.Surface] = {}
+
+
+def invalidate_board_cache():
+    """Drop cached board layers (board width changed or window resized)."""
+    _static_layers.clear()
+
 
 class Board:
     """Manage a more chess-like distribution of pieces for both sides.
@@ -82,11 +90,43 @@ class Board:
             y = self.board_top + (rows - 1) * cell_size + (cell_size - settings.PIECE_HEIGHT) // 2
             self.pieces.append(ChessPiece(x, y, active_back_rank[c], owner=2))
 
+    def draw_pieces(self, surface: pygame.Surface):
+        """Draw all live pieces: images in one batched blits call, then life bars."""
+        alive = [p for p in self.pieces if p.is_alive()]
+        surface.blits([(p.atlas.surface, p.rect, p.atlas_area) for p in alive if p.atlas_area is not None],
+                      doreturn=False)
+        for p in alive:
+            if p.atlas_area is None:
+                pygame.draw.rect(surface, p.color, p.rect, border_radius=6)
+            p.draw_life_bar(surface)
+
+    def get_static_layer(self, size: Tuple[int, int]) -> pygame.Surface:
+        """Return the cached background layer (white fill + checkerboard) for a target size."""
+        key = (settings.BOARD_COLS, settings.BOARD_ROWS, self.cell_size, self.board_left, self.board_top, *size)
+        layer = _static_layers.get(key)
+        if layer is None:
+            layer = pygame.Surface(size)
+            if pygame.display.get_surface() is not None:
+                layer = layer.convert()  # Match the display format for fast blits
+            layer.fill(settings.WHITE)
+            self._draw_checkerboard(layer)
+            _static_layers[key] = layer
+        return layer
+
+    def draw_background(self, surface: pygame.Surface):
+        """Draw the whole static background (white fill + checkerboard) in one blit."""
+        surface.blit(self.get_static_layer(surface.get_size()), (0, 0))
+
     def draw_board_hint(self, surface: pygame.Surface):
         """Draw a proper checkerboard pattern with alternating beige and brown squares."""
         if not hasattr(self, 'cell_size'):
             return
-        
+
+        area = pygame.Rect(self.board_left, self.board_top,
+                           settings.BOARD_COLS * self.cell_size, settings.BOARD_ROWS * self.cell_size)
+        surface.blit(self.get_static_layer(surface.get_size()), area.topleft, area)
+
+    def _draw_checkerboard(self, surface: pygame.Surface):
         cols = settings.BOARD_COLS
         rows = settings.BOARD_ROWS
         
@@ -2,7 +2,7 @@ import pygame
 from typing import Tuple
 
 from paddle_chess_game import settings
-from paddle_chess_game.utils.assets import load_image
+from paddle_chess_game.utils.assets import get_piece_atlas
 
 
 TYPE_COLORS = {
@@ -26,18 +26,10 @@ class ChessPiece:
         self.life = self.max_life
         self.rect = pygame.Rect(x, y, settings.PIECE_WIDTH, settings.PIECE_HEIGHT)
         self.color = TYPE_COLORS.get(piece_type, settings.WHITE)
-        # Try load image: priority type_owner.png then type.png
-        self.image: pygame.Surface | None = None
-        # Preference: assets/blanc|noir/<type>.png depending on owner
-        owner_dir = "blanc" if self.owner == 1 else "noir"
-        img = (
-            load_image(f"{owner_dir}/{self.type}.png")
-            or load_image(f"pieces/{self.type}_{self.owner}.png")
-            or load_image(f"pieces/{self.type}.png")
-        )
-        if img is not None:
-            # Scale to rect size
-            self.image = pygame.transform.smoothscale(img, (self.rect.width, self.rect.height))
+        # Image comes from the shared atlas (loaded and scaled once per size):
+        # the piece only keeps a reference to the atlas and its area in it
+        self.atlas = get_piece_atlas(self.rect.size)
+        self.atlas_area: pygame.Rect | None = self.atlas.area(self.owner, self.type)
 
     def is_alive(self) -> bool:
         return self.life > 0
@@ -45,12 +37,19 @@ class ChessPiece:
     def take_damage(self, amount: int = 1):
         self.life = max(0, self.life - amount)
 
+    @property
+    def image(self) -> pygame.Surface | None:
+        return self.atlas.image(self.owner, self.type)
+
     def draw(self, surface: pygame.Surface):
         # Piece body or image
-        if self.image is not None:
-            surface.blit(self.image, self.rect)
+        if self.atlas_area is not None:
+            surface.blit(self.atlas.surface, self.rect, self.atlas_area)
         else:
             pygame.draw.rect(surface, self.color, self.rect, border_radius=6)
+        self.draw_life_bar(surface)
+
+    def draw_life_bar(self, surface: pygame.Surface):
         # Life bar background
         bar_margin = 2
         bg_rect = pygame.Rect(self.rect.x, self.rect.y - 8, self.rect.width, 6)
@@ -0,0 +1,368 @@
+"""
+Save files: atomic writes on a background worker, JSON or compact binary.
+
+Binary saves are MAGIC + version + marshal(state). get_game_state() only
+holds dicts, lists, numbers, strings and None, which marshal encodes and
+decodes several times faster than json, at about half the size.
+Legacy savegame.json files (and JSON saves) are still read.
+
+Slots live in one archive file (SaveArchive): a header, the encoded
+states back to back, then an index of slot offsets/timestamps/metadata.
+Reads go through mmap, so listing touches only the index and loading a
+slot only that slot's bytes; a save appends only its state and the index.
+"""
+import json
+import marshal
+import mmap
+import os
+import struct
+import tempfile
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
+
+from paddle_chess_game import settings
+
+MAGIC = b'PCSV'
+FORMAT_VERSION = 1
+HEADER = struct.Struct('!4sB')
+MARSHAL_VERSION = 4
+
+LEGACY_SAVE_PATH = "savegame.json"
+
+ARCHIVE_MAGIC = b'PCSA'
+ARCHIVE_VERSION = 2
+# magic, version, index offset, index length (slot data follows the header, the index comes last)
+ARCHIVE_HEADER = struct.Struct('!4sBQI')
+# Version 1: magic, version, index length (the index follows the header, slot data follows the index)
+LEGACY_ARCHIVE_HEADER = struct.Struct('!4sBI')
+AUTOSAVE_PREFIX = "auto-"
+
+
+def default_save_path() -> str:
+    return "savegame.sav" if settings.SAVE_BINARY else "savegame.json"
+
+
+def encode_state(state: Dict[str, Any], binary: bool = True) -> bytes:
+    if binary:
+        return HEADER.pack(MAGIC, FORMAT_VERSION) + marshal.dumps(state, MARSHAL_VERSION)
+    return json.dumps(state, separators=(',', ':')).encode('utf-8')
+
+
+def decode_state(data: bytes) -> Dict[str, Any]:
+    """Decode a binary or JSON save, whichever `data` is."""
+    if data[:len(MAGIC)] == MAGIC:
+        _, version = HEADER.unpack_from(data)
+        if version != FORMAT_VERSION:
+            raise ValueError(f"unsupported save format version {version}")
+        return marshal.loads(data[HEADER.size:])
+    return json.loads(data.decode('utf-8'))
+
+
+def write_atomic(path: str, data: bytes):
+    """Write `data` to `path` so a crash leaves either the old file or the new one."""
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(prefix=os.path.basename(path) + '.', suffix='.tmp', dir=directory)
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def slot_meta(state: Dict[str, Any]) -> Dict[str, Any]:
+    """Summary kept in the archive index, shown by the slot picker without loading the slot."""
+    return {
+        'score_p1': state.get('score_p1', 0),
+        'score_p2': state.get('score_p2', 0),
+        'game_over': state.get('game_over', False),
+        'winner_side': state.get('winner_side'),
+    }
+
+
+class SaveArchive:
+    """Named save slots and rotating autosaves in a single file.
+
+    Layout (version 2): header (magic, version, index offset, index length),
+    the encoded states back to back, then the index. Index entries are
+    dicts: name, offset (from the start of the slot data), length,
+    timestamp, autosave and meta.
+
+    A save appends only the new state and a new index after the current
+    end of the file, fsyncs, then points the header at the new index: a
+    crash before the header write leaves the previous index in charge.
+    Replaced slots and old indexes stay behind as dead bytes until they
+    outweigh the live data; the file is then rebuilt with write_atomic
+    (as is a version 1 archive, read as is until its first write).
+    Only the save worker writes, readers may use any thread.
+    """
+
+    # Rebuild once the file is larger than COMPACT_RATIO * live bytes + COMPACT_SLACK
+    COMPACT_RATIO = 2
+    COMPACT_SLACK = 64 * 1024
+
+    def __init__(self, path: str, max_autosaves: int = 3):
+        self.path = path
+        self.max_autosaves = max_autosaves
+
+    def _open(self):
+        """Return (mmap, index, data start, version), or None if there is no readable archive.
+
+        An archive whose header or index does not decode is moved aside to
+        <path>.corrupt, so the next write starts a new one instead of failing
+        on it forever.
+        """
+        try:
+            with open(self.path, 'rb') as f:
+                if os.fstat(f.fileno()).st_size < LEGACY_ARCHIVE_HEADER.size:
+                    return None
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except FileNotFoundError:
+            return None
+        try:
+            magic, version = mm[:4], mm[4]
+            if magic != ARCHIVE_MAGIC:
+                raise ValueError("not a save archive")
+            if version == 1:
+                _, _, index_length = LEGACY_ARCHIVE_HEADER.unpack_from(mm)
+                index_start = LEGACY_ARCHIVE_HEADER.size
+                data_start = index_start + index_length
+            elif version == ARCHIVE_VERSION:
+                _, _, index_start, index_length = ARCHIVE_HEADER.unpack_from(mm)
+                data_start = ARCHIVE_HEADER.size
+            else:
+                raise ValueError(f"unsupported save archive version {version}")
+            if index_start + index_length > len(mm):
+                raise ValueError("index runs past the end of the file")
+            index = marshal.loads(mm[index_start:index_start + index_length])
+            for entry in index:
+                if data_start + entry['offset'] + entry['length'] > len(mm):
+                    raise ValueError(f"slot '{entry['name']}' runs past the end of the file")
+        except (ValueError, EOFError, TypeError, KeyError, struct.error) as e:
+            mm.close()
+            self._set_aside(e)
+            return None
+        return mm, index, data_start, version
+
+    def _set_aside(self, error: Exception):
+        corrupt_path = self.path + '.corrupt'
+        print(f"Save archive {self.path} is corrupt ({error}), moved to {corrupt_path}")
+        try:
+            os.replace(self.path, corrupt_path)
+        except FileNotFoundError:
+            pass  # Already moved by another reader
+
+    def list_slots(self) -> List[Dict[str, Any]]:
+        """Index entries, newest first (reads only the header and index)."""
+        opened = self._open()
+        if opened is None:
+            return []
+        mm, index, _, _ = opened
+        mm.close()
+        return sorted(index, key=lambda entry: entry['timestamp'], reverse=True)
+
+    def read_slot(self, name: str) -> Optional[Dict[str, Any]]:
+        opened = self._open()
+        if opened is None:
+            return None
+        mm, index, data_start, _ = opened
+        try:
+            for entry in index:
+                if entry['name'] == name:
+                    start = data_start + entry['offset']
+                    return decode_state(mm[start:start + entry['length']])
+            return None
+        finally:
+            mm.close()
+
+    def write_slot(self, name: Optional[str], state: Dict[str, Any], binary: bool = True,
+                   autosave: bool = False) -> str:
+        """Store `state` under `name` (replacing it), or as the next autosave. Return the slot name."""
+        opened = self._open()
+        index = opened[1] if opened is not None else []
+        now = time.time()
+        if autosave:
+            name = self._autosave_name(now, {entry['name'] for entry in index})
+        entry = {'name': name, 'timestamp': now, 'autosave': autosave, 'meta': slot_meta(state)}
+        kept = [e for e in index if e['name'] != name] + [entry]
+
+        # Rotate autosaves: keep the newest max_autosaves
+        autosaves = sorted((e['timestamp'], e['name']) for e in kept if e['autosave'])
+        expired = {slot_name for _, slot_name in autosaves[:max(0, len(autosaves) - self.max_autosaves)]}
+        kept = [e for e in kept if e['name'] not in expired]
+        self._update(opened, kept, entry, encode_state(state, binary))
+        return name
+
+    def delete_slot(self, name: str):
+        opened = self._open()
+        if opened is None:
+            return
+        self._update(opened, [e for e in opened[1] if e['name'] != name])
+
+    @staticmethod
+    def _autosave_name(now: float, taken) -> str:
+        """Millisecond timestamp, plus a counter if two autosaves still collide."""
+        stamp = time.strftime('%Y%m%d-%H%M%S', time.localtime(now))
+        name = f"{AUTOSAVE_PREFIX}{stamp}-{int(now * 1000) % 1000:03d}"
+        counter = 1
+        while name in taken:
+            counter += 1
+            name = f"{AUTOSAVE_PREFIX}{stamp}-{int(now * 1000) % 1000:03d}-{counter}"
+        return name
+
+    def _update(self, opened, entries: List[Dict[str, Any]], new_entry: Optional[Dict[str, Any]] = None,
+                payload: bytes = b''):
+        """Make `entries` the archive's slots; `new_entry` (already in `entries`) gets `payload`.
+
+        Appends when the archive is current and mostly live, rebuilds it otherwise.
+        """
+        if opened is None:
+            self._write([(new_entry, payload)] if new_entry is not None else [])
+            return
+        mm, _, data_start, version = opened
+        try:
+            live = sum(e['length'] for e in entries if e is not new_entry) + len(payload)
+            if version == ARCHIVE_VERSION and len(mm) <= self.COMPACT_RATIO * live + self.COMPACT_SLACK:
+                end = len(mm)
+                mm.close()
+                if new_entry is not None:
+                    new_entry.update(offset=end - data_start, length=len(payload))
+                self._append(end, entries, payload)
+                return
+            slots = [(e, payload if e is new_entry else
+                      mm[data_start + e['offset']:data_start + e['offset'] + e['length']])
+                     for e in entries]
+        finally:
+            mm.close()
+        self._write(slots)
+
+    def _append(self, end: int, entries: List[Dict[str, Any]], payload: bytes):
+        index_bytes = marshal.dumps(entries, MARSHAL_VERSION)
+        with open(self.path, 'r+b') as f:
+            f.seek(end)
+            f.write(payload)
+            f.write(index_bytes)
+            f.flush()
+            os.fsync(f.fileno())  # Data and index on disk before the header points at them
+            f.seek(0)
+            f.write(ARCHIVE_HEADER.pack(ARCHIVE_MAGIC, ARCHIVE_VERSION, end + len(payload), len(index_bytes)))
+            f.flush()
+            os.fsync(f.fileno())
+
+    def _write(self, slots):
+        """Rebuild the whole file with only `slots` ((entry, payload) pairs)."""
+        offset = 0
+        index = []
+        for entry, payload in slots:
+            index.append(dict(entry, offset=offset, length=len(payload)))
+            offset += len(payload)
+        index_bytes = marshal.dumps(index, MARSHAL_VERSION)
+        header = ARCHIVE_HEADER.pack(ARCHIVE_MAGIC, ARCHIVE_VERSION, ARCHIVE_HEADER.size + offset, len(index_bytes))
+        write_atomic(self.path, b''.join([header] + [payload for _, payload in slots] + [index_bytes]))
+
+
+class SaveWorker:
+    """Single background thread for save file I/O.
+
+    One worker keeps writes in submission order, so a later save never
+    lands before an earlier one. Results come back as futures; the game
+    loop polls them with done() and applies loaded states itself.
+    """
+
+    def __init__(self, archive_path: str = settings.SAVE_ARCHIVE_PATH):
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="savegame")
+        self.archive = SaveArchive(archive_path, settings.MAX_AUTOSAVES)
+
+    def save(self, state: Dict[str, Any], path: Optional[str] = None) -> Future:
+        """Write a state snapshot (not mutated afterwards by the caller)."""
+        return self.executor.submit(self._save, state, path or default_save_path())
+
+    def load(self, path: Optional[str] = None) -> Future:
+        """Read a save; the future resolves to the state, or None."""
+        return self.executor.submit(self._load, path)
+
+    def save_slot(self, name: Optional[str], state: Dict[str, Any], autosave: bool = False) -> Future:
+        """Write a state snapshot to an archive slot; resolves to the slot name, or None."""
+        return self.executor.submit(self._save_slot, name, state, autosave)
+
+    def load_slot(self, name: str) -> Future:
+        """Read an archive slot; the future resolves to the state, or None."""
+        return self.executor.submit(self._load_slot, name)
+
+    def list_slots(self) -> List[Dict[str, Any]]:
+        """Archive index, newest first. Index-only read, cheap enough for the UI thread."""
+        try:
+            return self.archive.list_slots()
+        except Exception as e:
+            print(f"Error reading save archive: {e}")
+            return []
+
+    def _save_slot(self, name: Optional[str], state: Dict[str, Any], autosave: bool) -> Optional[str]:
+        try:
+            name = self.archive.write_slot(name, state, binary=settings.SAVE_BINARY, autosave=autosave)
+            print(f"Game saved to slot '{name}'")
+            return name
+        except Exception as e:
+            print(f"Error saving game: {e}")
+            return None
+
+    def _load_slot(self, name: str) -> Optional[Dict[str, Any]]:
+        try:
+            state = self.archive.read_slot(name)
+        except Exception as e:
+            print(f"Error loading game: {e}")
+            return None
+        if state is None:
+            print(f"No save slot named '{name}'")
+        else:
+            print(f"Game loaded from slot '{name}'")
+        return state
+
+    @staticmethod
+    def _save(state: Dict[str, Any], path: str) -> bool:
+        try:
+            write_atomic(path, encode_state(state, binary=not path.endswith('.json')))
+            print(f"Game saved to {path}!")
+            return True
+        except Exception as e:
+            print(f"Error saving game: {e}")
+            return False
+
+    @staticmethod
+    def _load(path: Optional[str]) -> Optional[Dict[str, Any]]:
+        # Default: the configured save, then the legacy JSON one
+        candidates = [path] if path else [default_save_path(), LEGACY_SAVE_PATH]
+        found = False
+        for candidate in candidates:
+            if not os.path.exists(candidate):
+                continue
+            found = True
+            try:
+                with open(candidate, 'rb') as f:
+                    state = decode_state(f.read())
+                print(f"Game loaded from {candidate}!")
+                return state
+            except Exception as e:
+                # Unreadable: fall back to the next candidate (e.g. the legacy JSON save)
+                print(f"Error loading game from {candidate}: {e}")
+        if not found:
+            print("No save file found.")
+        return None
+
+
+_worker: Optional[SaveWorker] = None
+
+
+def get_save_worker() -> SaveWorker:
+    """Process-wide worker, started on first use."""
+    global _worker
+    if _worker is None:
+        _worker = SaveWorker()
+    return _worker
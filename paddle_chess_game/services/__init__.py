@@ -2,5 +2,6 @@
 Package pour les services de l'application.
 """
 from .config_service import ConfigurationService
+from .match_history import MatchHistory, get_match_history
 
-__all__ = ['ConfigurationService']
+__all__ = ['ConfigurationService', 'MatchHistory', 'get_match_history']
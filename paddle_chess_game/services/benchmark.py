@@ -0,0 +1,103 @@
+"""
+Benchmark ConfigurationService against a local stand-in for the Java backend.
+
+    python -m paddle_chess_game.services.benchmark [calls]
+
+Serves GET /pongechec/api/configurations from an in-process HTTP/1.1
+server and times the config menu's load pattern (test_connection then
+get_all_configurations): once with a new connection per request like
+plain requests.get, once through the service's pooled session, and once
+from several threads sharing one service. Prints the time per call and
+how many TCP connections the server accepted.
+"""
+import json
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+
+from paddle_chess_game.services.config_service import ConfigurationService
+
+SAMPLE_CONFIG = {
+    'id': 1, 'name': "Configuration Standard", 'ballSpeed': 5, 'ballDamage': 1, 'boardWidth': 8,
+    'startingPlayer': 1, 'roiLives': 3, 'reineLives': 2, 'fouLives': 2, 'tourLives': 2,
+    'chevalierLives': 2, 'pionLives': 1, 'roiPoints': 100, 'reinePoints': 50, 'fouPoints': 30,
+    'tourPoints': 30, 'chevalierPoints': 30, 'pionPoints': 10, 'specialBarMax': 10,
+    'specialBallDamage': 3, 'createdAt': "2025-12-08T10:00:00",
+}
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'  # Keep-alive, like WildFly
+    # Headers and body go out in separate writes; without TCP_NODELAY a
+    # kept-alive connection would wait on delayed ACKs (WildFly sets it too)
+    disable_nagle_algorithm = True
+    body = json.dumps([SAMPLE_CONFIG]).encode('utf-8')
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(self.body)))
+        self.end_headers()
+        self.wfile.write(self.body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class _StandInServer(ThreadingHTTPServer):
+    daemon_threads = True
+    connections = 0
+
+    def process_request(self, request, client_address):
+        self.connections += 1
+        super().process_request(request, client_address)
+
+
+def _menu_load(service: ConfigurationService):
+    if service.test_connection():
+        service.get_all_configurations()
+
+
+def _run(label: str, server: _StandInServer, calls: int, work):
+    server.connections = 0
+    start = time.perf_counter()
+    work()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<28} {elapsed / calls * 1000:7.3f} ms/load   {server.connections:5d} connections")
+
+
+def main(calls: int = 500):
+    server = _StandInServer(('127.0.0.1', 0), _Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}/pongechec/api"
+    endpoint = f"{base_url}/configurations"
+    print(f"{calls} menu loads (test_connection + get_all_configurations) against {base_url}")
+
+    def unpooled():
+        for _ in range(calls):
+            if requests.get(endpoint, timeout=2).status_code == 200:
+                requests.get(endpoint, timeout=5).json()
+
+    service = ConfigurationService(base_url)
+
+    def pooled():
+        for _ in range(calls):
+            _menu_load(service)
+
+    def threaded(workers: int = 4):
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            list(executor.map(lambda _: _menu_load(service), range(calls)))
+
+    _run("new connection per request", server, calls, unpooled)
+    _run("pooled session", server, calls, pooled)
+    _run("pooled session, 4 threads", server, calls, threaded)
+    service.close()
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 500)
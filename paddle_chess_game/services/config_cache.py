@@ -0,0 +1,72 @@
+"""
+Cache disque des réponses GET du backend (configurations).
+
+Entries are keyed by URL and hold the decoded JSON body, its ETag and the
+time it was fetched. An entry younger than `ttl` is used without any
+request. An older one is revalidated with If-None-Match: a 304 just
+refreshes its age. If the backend is unreachable, whatever entry exists
+is served instead of failing. The cache survives restarts in a JSON file
+written atomically.
+"""
+import json
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from paddle_chess_game.savegame import write_atomic
+
+
+class ConfigurationCache:
+    """URL -> {'data', 'etag', 'fetched_at'}; safe to use from several threads."""
+
+    def __init__(self, path: str, ttl: float = 300.0):
+        self.path = path
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._entries: Optional[Dict[str, Dict[str, Any]]] = None  # Read from disk on first use
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        if self._entries is None:
+            try:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    self._entries = json.load(f)
+            except FileNotFoundError:
+                self._entries = {}
+            except (OSError, ValueError) as e:
+                print(f"Cache de configuration illisible, ignoré: {e}")
+                self._entries = {}
+        return self._entries
+
+    def get(self, url: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            return self._load().get(url)
+
+    def is_fresh(self, entry: Dict[str, Any]) -> bool:
+        return time.time() - entry['fetched_at'] < self.ttl
+
+    def put(self, url: str, data: Any, etag: Optional[str]):
+        with self._lock:
+            self._load()[url] = {'data': data, 'etag': etag, 'fetched_at': time.time()}
+            self._save()
+
+    def touch(self, url: str):
+        """The server confirmed (304) that the entry is still current."""
+        with self._lock:
+            entry = self._load().get(url)
+            if entry is not None:
+                entry['fetched_at'] = time.time()
+                self._save()
+
+    def invalidate(self, url: str):
+        """Force a revalidation on the next read; the data stays for offline use."""
+        with self._lock:
+            entry = self._load().get(url)
+            if entry is not None:
+                entry['fetched_at'] = 0.0
+                self._save()
+
+    def _save(self):
+        try:
+            write_atomic(self.path, json.dumps(self._entries, separators=(',', ':')).encode('utf-8'))
+        except OSError as e:
+            print(f"Impossible d'écrire le cache de configuration: {e}")
@@ -1,40 +1,186 @@
 """
 Service pour gérer les configurations via l'API REST du serveur Java EE.
+
+Requests go through pooled keep-alive sessions (one per thread, since a
+requests.Session is not meant to be shared between threads), so back to
+back calls reuse the same TCP connection to the backend. Idempotent
+requests are retried with backoff on connection errors and 502/503/504;
+test_connection() is a single attempt, so the menu's probe answers within
+its own timeout.
+
+With a cache (cache_path), GETs are answered from a ConfigurationCache:
+fresh entries without a request, stale ones revalidated by ETag, and
+any cached entry when the backend is unreachable (offline play).
+
+UI code must not call the methods directly from the pygame thread: submit()
+runs them on the service's background executor and returns a Future.
 """
+import threading
 import requests
 import json
-from typing import Dict, List, Optional
+from concurrent.futures import Future, ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+from urllib.parse import quote
+from urllib3.util.retry import Retry
+
+from .config_cache import ConfigurationCache
+
+# Python (snake_case) -> server (camelCase) names, for the fields= projection
+SERVER_FIELD_NAMES = {
+    'id': 'id', 'name': 'name', 'created_at': 'createdAt',
+    'ball_speed': 'ballSpeed', 'ball_damage': 'ballDamage', 'board_width': 'boardWidth',
+    'starting_player': 'startingPlayer', 'roi_lives': 'roiLives', 'reine_lives': 'reineLives',
+    'fou_lives': 'fouLives', 'tour_lives': 'tourLives', 'chevalier_lives': 'chevalierLives',
+    'pion_lives': 'pionLives', 'roi_points': 'roiPoints', 'reine_points': 'reinePoints',
+    'fou_points': 'fouPoints', 'tour_points': 'tourPoints', 'chevalier_points': 'chevalierPoints',
+    'pion_points': 'pionPoints', 'special_bar_max': 'specialBarMax',
+    'special_ball_damage': 'specialBallDamage',
+}
 
 
 class ConfigurationService:
     """Service pour communiquer avec le backend Java EE via REST API."""
+
+    # Connections kept alive per thread; the game only talks to one backend host
+    POOL_SIZE = 4
+    # Largest page the backend accepts (GameConfigurationResource.MAX_PAGE_SIZE)
+    MAX_PAGE_SIZE = 500
+    # Every timeout below is per attempt: retried calls connect with a short timeout,
+    # and a read timeout is never retried. Worst case for a call with read timeout t:
+    # 3 * CONNECT_TIMEOUT + 2 * t (one gateway-error retry), instead of 4 * t.
+    CONNECT_TIMEOUT = 1.0
+    # Retries for connection errors and gateway errors (POST is never retried)
+    RETRIES = Retry(total=2, connect=2, read=0, status=1, backoff_factor=0.1,
+                    status_forcelist=(502, 503, 504),
+                    allowed_methods=frozenset({'GET', 'HEAD', 'PUT', 'DELETE'}),
+                    raise_on_status=False)
     
-    def __init__(self, base_url: str = "http://localhost:8080/pongechec/api"):
+    def __init__(self, base_url: str = "http://localhost:8080/pongechec/api",
+                 cache_path: Optional[str] = None, cache_ttl: float = 300.0):
         """
         Initialise le service de configuration.
         
         Args:
             base_url: URL de base de l'API REST (par défaut: localhost:8080)
+            cache_path: Fichier du cache des GET (None: pas de cache)
+            cache_ttl: Durée en secondes pendant laquelle le cache est utilisé sans requête
         """
         self.base_url = base_url
         self.endpoint = f"{base_url}/configurations"
+        self.cache = ConfigurationCache(cache_path, cache_ttl) if cache_path else None
+        self._converted = (None, [])  # (cached body, converted list) for the list endpoint
+        self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="config-service")
+        self._local = threading.local()
+        self._sessions: List[requests.Session] = []
+        self._sessions_lock = threading.Lock()
+
+    def _session(self, retries: bool = True) -> requests.Session:
+        """Session (connection pool) of the calling thread, created on first use.
+        retries=False gives a separate session that makes a single attempt."""
+        attribute = 'session' if retries else 'probe_session'
+        session = getattr(self._local, attribute, None)
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.POOL_SIZE,
+                                  max_retries=self.RETRIES if retries else 0)
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+            setattr(self._local, attribute, session)
+            with self._sessions_lock:
+                self._sessions.append(session)
+        return session
+
+    def _timeout(self, read: float):
+        """(connect, read) timeouts for one attempt of a retried request."""
+        return (min(self.CONNECT_TIMEOUT, read), read)
+
+    def submit(self, method, *args, **kwargs) -> Future:
+        """Run method(*args, **kwargs) (a method of this service, or a function calling
+        several) on the background executor; the Future holds its result."""
+        return self._executor.submit(method, *args, **kwargs)
+
+    def close(self):
+        """Arrête l'exécuteur et ferme les connexions ouvertes par tous les threads."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        with self._sessions_lock:
+            sessions, self._sessions = self._sessions, []
+        for session in sessions:
+            session.close()
+        self._local = threading.local()
     
+    def _get_json(self, url: str, timeout: float, revalidate: bool = False) -> Tuple[Any, bool]:
+        """GET `url` through the cache if there is one: (data, offline), offline being True
+        when this call fell back to the cache because the backend was unreachable.
+        Raises RequestException when the backend cannot answer and nothing is cached."""
+        entry = self.cache.get(url) if self.cache else None
+        if entry is not None and not revalidate and self.cache.is_fresh(entry):
+            return entry['data'], False
+        headers = {'If-None-Match': entry['etag']} if entry is not None and entry.get('etag') else {}
+        try:
+            response = self._session().get(url, headers=headers, timeout=self._timeout(timeout))
+            if response.status_code == 304 and entry is not None:
+                self.cache.touch(url)
+                return entry['data'], False
+            response.raise_for_status()
+            data = response.json()
+            if self.cache:
+                self.cache.put(url, data, response.headers.get('ETag'))
+            return data, False
+        except requests.exceptions.RequestException as e:
+            client_error = (isinstance(e, requests.exceptions.HTTPError) and e.response is not None
+                            and e.response.status_code < 500)
+            if entry is None or client_error:
+                raise
+            print(f"Backend injoignable, configuration en cache utilisée: {e}")
+            return entry['data'], True
+
     def get_all_configurations(self) -> List[Dict]:
         """
-        Récupère toutes les configurations depuis le serveur.
+        Récupère toutes les configurations depuis le serveur (ou le cache).
         
         Returns:
             Liste des configurations ou liste vide en cas d'erreur
         """
+        return self.fetch_all_configurations()[0]
+
+    def fetch_all_configurations(self) -> Tuple[List[Dict], bool]:
+        """
+        Comme get_all_configurations, en indiquant aussi si cet appel a été servi
+        depuis le cache faute de backend joignable.
+        
+        Returns:
+            (liste des configurations, hors ligne) ; ([], False) en cas d'erreur
+        """
         try:
-            response = requests.get(self.endpoint, timeout=5)
-            response.raise_for_status()
-            configs = response.json()
-            # Convertir chaque config du format serveur vers Python
-            return [self._convert_from_server_format(c) for c in configs]
+            configs, offline = self._get_json(self.endpoint, timeout=5)
         except requests.exceptions.RequestException as e:
             print(f"Erreur lors de la récupération des configurations: {e}")
-            return []
+            return [], False
+        # Convertir chaque config du format serveur vers Python (une fois par réponse)
+        source, converted = self._converted
+        if source is not configs:
+            converted = [self._convert_from_server_format(c) for c in configs]
+            self._converted = (configs, converted)
+        return [dict(c) for c in converted], offline
+
+    def _invalidate_cache(self, config_id: Optional[int] = None):
+        """After a write: the next GETs must revalidate with the server."""
+        if self.cache:
+            self.cache.invalidate(self.endpoint)
+            if config_id is not None:
+                self.cache.invalidate(f"{self.endpoint}/{config_id}")
+
+    def refresh_in_background(self):
+        """Revalide le cache en arrière-plan, pour que le prochain chargement soit immédiat."""
+        if self.cache is not None:
+            self.submit(self._refresh)
+
+    def _refresh(self):
+        try:
+            self._get_json(self.endpoint, timeout=5, revalidate=True)
+        except requests.exceptions.RequestException:
+            pass  # Reported when the menu actually loads
     
     def get_configuration(self, config_id: int) -> Optional[Dict]:
         """
@@ -47,9 +193,7 @@ class ConfigurationService:
             Configuration ou None en cas d'erreur
         """
         try:
-            response = requests.get(f"{self.endpoint}/{config_id}", timeout=5)
-            response.raise_for_status()
-            server_config = response.json()
+            server_config, _ = self._get_json(f"{self.endpoint}/{config_id}", timeout=5)
             return self._convert_from_server_format(server_config)
         except requests.exceptions.RequestException as e:
             print(f"Erreur lors de la récupération de la configuration {config_id}: {e}")
@@ -57,8 +201,8 @@ class ConfigurationService:
     
     def save_configuration(self, config: Dict, name: str = "Configuration Standard") -> Optional[Dict]:
         """
-        Sauvegarde la configuration. Si une configuration existe déjà, elle est mise à jour.
-        Sinon, une nouvelle est créée.
+        Sauvegarde la configuration sous ce nom : mise à jour si elle existe déjà,
+        création sinon (voir upsert_configuration).
         
         Args:
             config: Dictionnaire de configuration (format Python)
@@ -67,30 +211,36 @@ class ConfigurationService:
         Returns:
             Configuration sauvegardée ou None en cas d'erreur
         """
-        try:
-            # Vérifier s'il existe déjà une configuration
-            existing_configs = self.get_all_configurations()
-            
-            if existing_configs:
-                # Mise à jour de la première configuration trouvée
-                existing_id = existing_configs[0].get('id')
-                if existing_id:
-                    print(f"Mise à jour de la configuration existante (ID: {existing_id})")
-                    return self.update_configuration(existing_id, config, name)
+        return self.upsert_configuration(config, name)
+    
+    def upsert_configuration(self, config: Dict, name: str) -> Optional[Dict]:
+        """
+        Crée ou met à jour la configuration portant ce nom, en une seule requête
+        (PUT /configurations/by-name/{name}) dont la taille ne dépend pas du
+        nombre de configurations stockées.
+        
+        Args:
+            config: Dictionnaire de configuration (format Python)
+            name: Nom de la configuration
             
-            # Création d'une nouvelle configuration si aucune n'existe
-            print("Création d'une nouvelle configuration")
+        Returns:
+            Configuration sauvegardée ou None en cas d'erreur
+        """
+        try:
             server_format = self._convert_to_server_format(config)
             server_format['name'] = name
             
-            response = requests.post(
-                self.endpoint,
+            response = self._session().put(
+                f"{self.endpoint}/by-name/{quote(name, safe='')}",
                 json=server_format,
                 headers={'Content-Type': 'application/json'},
-                timeout=5
+                timeout=self._timeout(5)
             )
             response.raise_for_status()
             saved_config = response.json()
+            self._invalidate_cache(saved_config.get('id'))
+            if response.status_code == 201:
+                print(f"Configuration '{name}' créée (ID: {saved_config.get('id')})")
             return self._convert_from_server_format(saved_config)
         except requests.exceptions.RequestException as e:
             print(f"Erreur lors de la sauvegarde: {e}")
@@ -113,13 +263,14 @@ class ConfigurationService:
             if name:
                 server_format['name'] = name
             
-            response = requests.put(
+            response = self._session().put(
                 f"{self.endpoint}/{config_id}",
                 json=server_format,
                 headers={'Content-Type': 'application/json'},
-                timeout=5
+                timeout=self._timeout(5)
             )
             response.raise_for_status()
+            self._invalidate_cache(config_id)
             updated_config = response.json()
             return self._convert_from_server_format(updated_config)
         except requests.exceptions.RequestException as e:
@@ -137,13 +288,63 @@ class ConfigurationService:
             True si succès, False sinon
         """
         try:
-            response = requests.delete(f"{self.endpoint}/{config_id}", timeout=5)
+            response = self._session().delete(f"{self.endpoint}/{config_id}", timeout=self._timeout(5))
             response.raise_for_status()
+            self._invalidate_cache(config_id)
             return True
         except requests.exceptions.RequestException as e:
             print(f"Erreur lors de la suppression: {e}")
             return False
     
+    def iter_configurations(self, page_size: int = 100, name: Optional[str] = None,
+                            fields: Optional[Iterable[str]] = None) -> Iterator[Dict]:
+        """
+        Parcourt les configurations page par page (de la plus récente à la plus ancienne),
+        sans jamais garder plus d'une page en mémoire. La première page est disponible
+        dès la première réponse.
+        
+        Args:
+            page_size: Configurations demandées par requête (1 à 500)
+            name: Ne garder que les noms contenant ce texte
+            fields: Noms Python des champs à récupérer (par défaut: tous)
+            
+        Yields:
+            Configurations au format Python (seulement les champs demandés si fields est donné)
+            
+        Raises:
+            ValueError: page_size hors de 1..500, ou champ inconnu dans fields
+            requests.exceptions.RequestException: erreur réseau ou HTTP au milieu du
+                parcours (le parcours ne s'arrête normalement que sur nextCursor nul)
+        """
+        if not 1 <= page_size <= self.MAX_PAGE_SIZE:
+            raise ValueError(f"page_size doit être entre 1 et {self.MAX_PAGE_SIZE}: {page_size}")
+        params: Dict[str, Any] = {'limit': page_size}
+        if name:
+            params['name'] = name
+        if fields is not None:
+            fields = list(fields)
+            unknown = [f for f in fields if f not in SERVER_FIELD_NAMES]
+            if unknown:
+                raise ValueError(f"Champs inconnus: {', '.join(unknown)}")
+            params['fields'] = ",".join(SERVER_FIELD_NAMES[f] for f in fields)
+            python_names = {SERVER_FIELD_NAMES[f]: f for f in fields}
+        cursor = None
+        while True:
+            if cursor is not None:
+                params['cursor'] = cursor
+            # Errors propagate: a truncated listing must not look like a complete one
+            response = self._session().get(self.endpoint, params=params, timeout=self._timeout(5))
+            response.raise_for_status()
+            page = response.json()
+            for item in page['items']:
+                if fields is None:
+                    yield self._convert_from_server_format(item)
+                else:
+                    yield {python_names[key]: value for key, value in item.items()}
+            cursor = page.get('nextCursor')
+            if cursor is None:
+                return
+    
     def test_connection(self) -> bool:
         """
         Test la connexion au serveur.
@@ -152,7 +353,8 @@ class ConfigurationService:
             True si le serveur est accessible, False sinon
         """
         try:
-            response = requests.get(self.endpoint, timeout=2)
+            # Single attempt: a down backend is reported after 2 s, not after the retries
+            response = self._session(retries=False).get(self.endpoint, timeout=2)
             return response.status_code in [200, 404]  # 404 OK si pas de configs
         except:
             return False
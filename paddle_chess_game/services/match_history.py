@@ -0,0 +1,275 @@
+"""
+Service pour l'historique local des parties (SQLite).
+
+One row per finished match: config, players, winner, duration, final
+scores, replay file, plus the pieces each side lost by type. Inserts go
+through a queue to a single writer thread, which commits them in batches,
+so the game loop never touches the database.
+
+A trigger keeps running totals per config (config_stats) on every insert.
+The win-rate and average-length queries read those totals and don't scan
+matches, so they stay in the millisecond range however long the history is.
+"""
+import atexit
+import hashlib
+import json
+import os
+import queue
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from paddle_chess_game import settings
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS matches (
+    id INTEGER PRIMARY KEY,
+    played_at REAL NOT NULL,        -- End of the match (Unix time)
+    config_key TEXT NOT NULL,       -- config_key(config): same settings, same key
+    config_id INTEGER,              -- Server id when the config came from the backend
+    config_name TEXT,
+    player1 TEXT NOT NULL,
+    player2 TEXT NOT NULL,
+    winner INTEGER,                 -- 1, 2, or NULL if nobody won
+    duration REAL NOT NULL,         -- Seconds of play (pauses excluded)
+    score_p1 INTEGER NOT NULL,
+    score_p2 INTEGER NOT NULL,
+    replay_path TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_matches_played_at ON matches(played_at);
+CREATE INDEX IF NOT EXISTS idx_matches_config ON matches(config_key, played_at);
+CREATE INDEX IF NOT EXISTS idx_matches_winner ON matches(winner, played_at);
+CREATE INDEX IF NOT EXISTS idx_matches_replay ON matches(id) WHERE replay_path IS NOT NULL;
+
+CREATE TABLE IF NOT EXISTS pieces_lost (
+    match_id INTEGER NOT NULL REFERENCES matches(id),
+    player INTEGER NOT NULL,
+    piece_type TEXT NOT NULL,
+    count INTEGER NOT NULL,
+    PRIMARY KEY (match_id, player, piece_type)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS config_stats (
+    config_key TEXT PRIMARY KEY,
+    config_id INTEGER,
+    config_name TEXT,
+    matches INTEGER NOT NULL,
+    wins_p1 INTEGER NOT NULL,
+    wins_p2 INTEGER NOT NULL,
+    total_duration REAL NOT NULL
+);
+CREATE TRIGGER IF NOT EXISTS matches_config_stats AFTER INSERT ON matches BEGIN
+    INSERT INTO config_stats VALUES (
+        NEW.config_key, NEW.config_id, NEW.config_name, 1,
+        IFNULL(NEW.winner, 0) = 1, IFNULL(NEW.winner, 0) = 2, NEW.duration)
+    ON CONFLICT(config_key) DO UPDATE SET
+        config_id = IFNULL(excluded.config_id, config_id),
+        config_name = IFNULL(excluded.config_name, config_name),
+        matches = matches + 1,
+        wins_p1 = wins_p1 + excluded.wins_p1,
+        wins_p2 = wins_p2 + excluded.wins_p2,
+        total_duration = total_duration + excluded.total_duration;
+END;
+"""
+
+# Config entries that identify a stored configuration rather than change the game
+_CONFIG_METADATA = ('id', 'name', 'created_at')
+
+
+def config_key(config: Dict[str, Any]) -> str:
+    """Short stable digest of the gameplay settings of `config`."""
+    settings_only = {k: v for k, v in config.items() if k not in _CONFIG_METADATA}
+    encoded = json.dumps(settings_only, sort_keys=True, separators=(',', ':'))
+    return hashlib.sha1(encoded.encode('utf-8')).hexdigest()[:16]
+
+
+def match_summary(config: Dict[str, Any], state: Dict[str, Any], players: Tuple[str, str],
+                  duration: float, replay_path: Optional[str] = None) -> Dict[str, Any]:
+    """History record for a match ending in `state` (a get_game_state() dict)."""
+    lost: Dict[Tuple[int, str], int] = {}
+    for piece in state.get('pieces', []):
+        if not piece['is_alive']:
+            key = (piece['owner'], piece['type'])
+            lost[key] = lost.get(key, 0) + 1
+    return {
+        'played_at': time.time(),
+        'config_key': config_key(config),
+        'config_id': config.get('id'),
+        'config_name': config.get('name'),
+        'player1': players[0],
+        'player2': players[1],
+        'winner': state.get('winner_side'),
+        'duration': duration,
+        'score_p1': state.get('score_p1', 0),
+        'score_p2': state.get('score_p2', 0),
+        'replay_path': replay_path,
+        'pieces_lost': lost,
+    }
+
+
+class MatchHistory:
+    """SQLite match history: record() from any thread, queries from any thread."""
+
+    def __init__(self, path: str, max_replays: int = settings.MAX_REPLAYS, flush_interval: float = 0.5):
+        self.path = path
+        self.max_replays = max_replays
+        self.flush_interval = flush_interval
+        self._queue: "queue.SimpleQueue[Optional[Dict[str, Any]]]" = queue.SimpleQueue()
+        self._local = threading.local()  # One read connection per thread
+        self._ready = threading.Event()
+        self.thread: Optional[threading.Thread] = threading.Thread(target=self._run, name="match-history",
+                                                                   daemon=True)
+        self.thread.start()
+        atexit.register(self.close)
+
+    def record(self, match: Dict[str, Any]):
+        """Queue a match_summary() record; written by the history thread."""
+        self._queue.put(match)
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path, timeout=5.0)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def _run(self):
+        try:
+            conn = self._connect()
+            # WAL: readers on other threads never wait for a batch commit
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(SCHEMA)
+        except sqlite3.Error as e:
+            print(f"Match history unavailable: {e}")
+            self._ready.set()
+            return
+        self._ready.set()
+
+        running = True
+        while running:
+            batch = [self._queue.get()]
+            # Gather whatever else arrives shortly after, to commit it in one transaction
+            deadline = time.perf_counter() + self.flush_interval
+            while batch[-1] is not None:
+                remaining = deadline - time.perf_counter()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            if batch[-1] is None:
+                running = False
+                batch.pop()
+            if batch:
+                try:
+                    self._insert(conn, batch)
+                    self._prune_replays(conn)
+                except sqlite3.Error as e:
+                    print(f"Error writing match history: {e}")
+        conn.close()
+
+    @staticmethod
+    def _insert(conn: sqlite3.Connection, batch: List[Dict[str, Any]]):
+        with conn:
+            for match in batch:
+                cursor = conn.execute(
+                    "INSERT INTO matches (played_at, config_key, config_id, config_name, player1, player2, "
+                    "winner, duration, score_p1, score_p2, replay_path) "
+                    "VALUES (:played_at, :config_key, :config_id, :config_name, :player1, :player2, "
+                    ":winner, :duration, :score_p1, :score_p2, :replay_path)", match)
+                conn.executemany(
+                    "INSERT INTO pieces_lost (match_id, player, piece_type, count) VALUES (?, ?, ?, ?)",
+                    [(cursor.lastrowid, player, piece_type, count)
+                     for (player, piece_type), count in match['pieces_lost'].items()])
+
+    def _prune_replays(self, conn: sqlite3.Connection):
+        """Delete replay files beyond the newest max_replays and forget their paths."""
+        old = conn.execute("SELECT id, replay_path FROM matches WHERE replay_path IS NOT NULL "
+                           "ORDER BY id DESC LIMIT -1 OFFSET ?", (self.max_replays,)).fetchall()
+        if not old:
+            return
+        for row in old:
+            try:
+                os.remove(row['replay_path'])
+            except OSError:
+                pass
+        with conn:
+            conn.executemany("UPDATE matches SET replay_path = NULL WHERE id = ?", [(row['id'],) for row in old])
+
+    def _reader(self) -> sqlite3.Connection:
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            self._ready.wait(5.0)  # Schema created by the writer thread
+            conn = self._local.conn = self._connect()
+        return conn
+
+    def win_rates(self) -> List[Dict[str, Any]]:
+        """Per config: matches played, wins of each side, win rates and average length."""
+        rows = self._reader().execute("SELECT * FROM config_stats ORDER BY matches DESC").fetchall()
+        stats = []
+        for row in rows:
+            matches = row['matches']
+            stats.append({
+                'config_key': row['config_key'],
+                'config_id': row['config_id'],
+                'config_name': row['config_name'],
+                'matches': matches,
+                'wins_p1': row['wins_p1'],
+                'wins_p2': row['wins_p2'],
+                'win_rate_p1': row['wins_p1'] / matches,
+                'win_rate_p2': row['wins_p2'] / matches,
+                'average_duration': row['total_duration'] / matches,
+            })
+        return stats
+
+    def average_duration(self, config: Optional[str] = None) -> Optional[float]:
+        """Average match length in seconds, for one config key or over all matches."""
+        query = "SELECT SUM(total_duration), SUM(matches) FROM config_stats"
+        args: Tuple[Any, ...] = ()
+        if config is not None:
+            query += " WHERE config_key = ?"
+            args = (config,)
+        total, matches = self._reader().execute(query, args).fetchone()
+        return total / matches if matches else None
+
+    def recent(self, limit: int = 20, config: Optional[str] = None,
+               winner: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Newest matches first, optionally for one config key and/or winner."""
+        query = "SELECT * FROM matches"
+        conditions, args = [], []
+        if config is not None:
+            conditions.append("config_key = ?")
+            args.append(config)
+        if winner is not None:
+            conditions.append("winner = ?")
+            args.append(winner)
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        query += " ORDER BY played_at DESC LIMIT ?"
+        args.append(limit)
+        return [dict(row) for row in self._reader().execute(query, args)]
+
+    def pieces_lost(self, match_id: int) -> Dict[Tuple[int, str], int]:
+        rows = self._reader().execute("SELECT player, piece_type, count FROM pieces_lost WHERE match_id = ?",
+                                      (match_id,))
+        return {(row['player'], row['piece_type']): row['count'] for row in rows}
+
+    def close(self):
+        """Write what is still queued and stop the history thread."""
+        if self.thread is None:
+            return
+        self._queue.put(None)
+        self.thread.join(timeout=5.0)
+        self.thread = None
+
+
+_history: Optional[MatchHistory] = None
+
+
+def get_match_history() -> Optional[MatchHistory]:
+    """Process-wide history, opened on first use; None when MATCH_HISTORY_PATH is unset."""
+    global _history
+    if _history is None and settings.MATCH_HISTORY_PATH:
+        _history = MatchHistory(settings.MATCH_HISTORY_PATH)
+    return _history
@@ -10,6 +10,53 @@ CELL_SIZE = 70  # Size of each square cell in pixels (adjust this to change over
 SCREEN_WIDTH = BOARD_COLS * CELL_SIZE  # 8 * 60 = 480
 SCREEN_HEIGHT = BOARD_ROWS * CELL_SIZE + NAVBAR_HEIGHT
 FPS = 60
+# Tick rate while nothing animates (menus, pause, waiting screens); input wakes it up
+IDLE_FPS = 10
+
+# Rendering: redraw/present only changed regions (helps weak clients)
+DIRTY_RECT_RENDERING = False
+
+# Run physics on its own fixed-rate thread; the main thread only handles events
+# and draws the latest snapshot (local and host games)
+THREADED_SIMULATION = False
+
+# Window scaling: everything is drawn at SCREEN_WIDTH x SCREEN_HEIGHT and scaled once
+# per frame to the window. True lets SDL's renderer scale on the GPU (pygame.SCALED).
+GPU_SCALING = False
+
+# Saves: compact binary (marshal) savegame.sav, or JSON savegame.json
+SAVE_BINARY = True
+# All save slots and autosaves live in this archive; the newest MAX_AUTOSAVES autosaves are kept
+SAVE_ARCHIVE_PATH = "saves.pca"
+MAX_AUTOSAVES = 3
+AUTOSAVE_INTERVAL = 60.0  # Seconds of play between autosaves (0 disables)
+
+# Crash-recovery journal: per-tick deltas plus a checkpoint every JOURNAL_CHECKPOINT_TICKS,
+# fsynced in batches every JOURNAL_FLUSH_INTERVAL seconds, compacted past JOURNAL_MAX_BYTES
+JOURNAL_ENABLED = True
+JOURNAL_PATH = "recovery.journal"
+JOURNAL_CHECKPOINT_TICKS = 300
+JOURNAL_FLUSH_INTERVAL = 0.2
+JOURNAL_MAX_BYTES = 1024 * 1024
+
+# Finished matches are recorded in this SQLite file (None disables). When the journal is on,
+# each match is also streamed, uncompacted, to JOURNAL_PATH + ".replay" and kept in REPLAY_DIR
+# as its replay; only the newest MAX_REPLAYS are kept
+MATCH_HISTORY_PATH = "match_history.db"
+REPLAY_DIR = "replays"
+MAX_REPLAYS = 50
+
+# Backend configurations: GET responses cached on disk (ETag revalidated once older than
+# CONFIG_CACHE_TTL seconds, served as-is when the backend is unreachable)
+CONFIG_CACHE_PATH = "config_cache.json"
+CONFIG_CACHE_TTL = 300.0
+
+# Frame profiler (F2 shows per-phase timings): set a path ending in .csv or .jsonl
+# to also dump every frame's phase timings for offline analysis
+PROFILE_TRACE = None
+
+# Network transport: "tcp" (default) or "shm" (shared memory, host and client on the same machine)
+NETWORK_TRANSPORT = "tcp"
 
 # Colors
 WHITE = (255, 255, 255)
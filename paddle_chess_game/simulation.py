@@ -0,0 +1,97 @@
+"""
+Fixed-rate simulation thread, used when settings.THREADED_SIMULATION is on.
+
+Threading contract:
+- After start(), the simulation Game belongs to the simulation thread.
+  Nothing else reads or writes it; other threads reach it only through
+  command(), whose actions run on the simulation thread between ticks.
+- The simulation thread never calls pygame display, event, key or font
+  functions. Step functions get the key state sampled by the main thread
+  (set_keys), and only do Rect math on the simulation Game.
+- The main thread owns everything else in pygame (events, key state,
+  drawing, present) plus a separate view Game, which it only updates from
+  published snapshots through set_game_state().
+- Snapshots are fresh get_game_state() dicts (plus 'paused'), handed over
+  through a StateHandoff (newest wins). They are never mutated after publishing.
+"""
+import queue
+import threading
+import time
+import traceback
+from typing import Any, Callable, Optional
+
+from paddle_chess_game import settings
+from paddle_chess_game.network.handoff import StateHandoff
+
+
+class SimulationThread:
+    """Runs step(game, keys) at a fixed rate and publishes a snapshot after each tick."""
+
+    def __init__(self, game, step: Callable[[Any, Any], None], rate: int = settings.FPS, max_catch_up: int = 5):
+        self.game = game
+        self.step = step
+        self.interval = 1.0 / rate
+        self.max_catch_up = max_catch_up  # Ticks replayed at most after a stall
+        self.keys = None  # Latest key state from the main thread (reference swap, newest wins)
+        self.commands: "queue.SimpleQueue[Callable[[Any], None]]" = queue.SimpleQueue()
+        self.snapshots = StateHandoff()
+        self.ticks = 0
+        self.running = False
+        self.thread: Optional[threading.Thread] = None
+
+    def start(self):
+        self._publish()
+        self.running = True
+        self.thread = threading.Thread(target=self._run, name="simulation", daemon=True)
+        self.thread.start()
+
+    def set_keys(self, keys):
+        """Main thread: hand over the key state for the next ticks."""
+        self.keys = keys
+
+    def command(self, action: Callable[[Any], None]):
+        """Run action(game) on the simulation thread before the next tick."""
+        self.commands.put(action)
+
+    def latest_snapshot(self) -> Optional[dict]:
+        """Main thread: newest snapshot if one was published since the last call."""
+        return self.snapshots.take_new()
+
+    def _publish(self):
+        state = self.game.get_game_state()
+        state['paused'] = self.game.paused
+        self.snapshots.publish(state)
+
+    def _run(self):
+        next_tick = time.perf_counter()
+        try:
+            while self.running:
+                now = time.perf_counter()
+                if now < next_tick:
+                    time.sleep(next_tick - now)
+                    continue
+                if now - next_tick > self.max_catch_up * self.interval:
+                    # Stalled (debugger, suspended laptop): resync instead of fast-forwarding
+                    next_tick = now
+                self._tick()
+                next_tick += self.interval
+        except Exception as e:
+            print(f"Simulation thread stopped: {e}")
+            traceback.print_exc()
+            self.running = False
+
+    def _tick(self):
+        while True:
+            try:
+                action = self.commands.get_nowait()
+            except queue.Empty:
+                break
+            action(self.game)
+        self.step(self.game, self.keys)
+        self.ticks += 1
+        self._publish()
+
+    def stop(self):
+        self.running = False
+        if self.thread is not None and self.thread is not threading.current_thread():
+            self.thread.join(timeout=1.0)
@@ -0,0 +1,104 @@
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+import pygame
+
+from paddle_chess_game import settings
+from paddle_chess_game.savegame import AUTOSAVE_PREFIX
+from paddle_chess_game.utils import display
+from paddle_chess_game.utils.text import render_text
+
+NEW_SLOT = object()  # Row that creates a new slot (save mode)
+
+
+class SlotPicker:
+    """Modal list of save slots opened by the navbar Save/Load buttons.
+
+    handle_event() returns ("save", name), ("load", name), ("close", None)
+    or None while the picker stays open. A save with name None asks for a
+    new slot. Up to MAX_ROWS slots are shown at once; the mouse wheel and
+    the arrow / Page keys scroll through the rest.
+    """
+
+    ROW_HEIGHT = 44
+    MAX_ROWS = 8
+    WIDTH = 420
+
+    def __init__(self, mode: str, slots: List[Dict[str, Any]]):
+        self.mode = mode  # "save" or "load"
+        entries: List[Any] = [NEW_SLOT] if mode == "save" else []
+        # Autosaves can be loaded but not overwritten by hand
+        entries += [slot for slot in slots if mode == "load" or not slot.get('autosave')]
+        self.entries = entries
+        self.offset = 0  # Index of the first visible entry
+        self.visible = min(len(entries), self.MAX_ROWS)
+        self.title = "Sauvegarder dans..." if mode == "save" else "Charger une partie"
+
+        height = 60 + max(1, self.visible) * self.ROW_HEIGHT + 16
+        self.rect = pygame.Rect(0, 0, self.WIDTH, height)
+        self.rect.center = (settings.SCREEN_WIDTH // 2, settings.SCREEN_HEIGHT // 2)
+        self.row_rects = [pygame.Rect(self.rect.x + 10, self.rect.y + 60 + i * self.ROW_HEIGHT,
+                                      self.WIDTH - 20, self.ROW_HEIGHT - 6)
+                          for i in range(self.visible)]
+        self._labels = [self._row_labels(entry) for entry in self.entries]
+
+    @staticmethod
+    def _row_labels(entry) -> Tuple[str, str]:
+        if entry is NEW_SLOT:
+            return "+ Nouvelle sauvegarde", ""
+        name = entry['name']
+        if name.startswith(AUTOSAVE_PREFIX):
+            name = "Auto"
+        meta = entry.get('meta', {})
+        when = time.strftime('%d/%m %H:%M', time.localtime(entry['timestamp']))
+        return name, f"{when}   P1 {meta.get('score_p1', 0)} - P2 {meta.get('score_p2', 0)}"
+
+    def scroll(self, rows: int):
+        self.offset = max(0, min(self.offset + rows, len(self.entries) - self.visible))
+
+    def handle_event(self, event: pygame.event.Event) -> Optional[Tuple[str, Optional[str]]]:
+        if event.type == pygame.KEYDOWN:
+            if event.key == pygame.K_ESCAPE:
+                return "close", None
+            steps = {pygame.K_UP: -1, pygame.K_DOWN: 1,
+                     pygame.K_PAGEUP: -self.MAX_ROWS, pygame.K_PAGEDOWN: self.MAX_ROWS}
+            if event.key in steps:
+                self.scroll(steps[event.key])
+        elif event.type == pygame.MOUSEWHEEL:
+            self.scroll(-event.y)
+        elif event.type == pygame.MOUSEBUTTONDOWN and event.button in (1, 2, 3):
+            # Buttons 4/5 are the wheel, already handled as MOUSEWHEEL
+            pos = display.get_mouse_pos()
+            if not self.rect.collidepoint(pos):
+                return "close", None
+            for entry, row in zip(self.entries[self.offset:], self.row_rects):
+                if row.collidepoint(pos):
+                    return self.mode, None if entry is NEW_SLOT else entry['name']
+        return None
+
+    def draw(self, surface: pygame.Surface) -> pygame.Rect:
+        pygame.draw.rect(surface, settings.WHITE, self.rect, border_radius=8)
+        pygame.draw.rect(surface, settings.GREY, self.rect, 2, border_radius=8)
+        title = render_text(self.title, settings.BLACK, 32)
+        surface.blit(title, title.get_rect(midtop=(self.rect.centerx, self.rect.y + 16)))
+
+        if not self.entries:
+            empty = render_text("Aucune sauvegarde", settings.GREY, 24)
+            surface.blit(empty, empty.get_rect(midtop=(self.rect.centerx, self.rect.y + 70)))
+
+        mouse_pos = display.get_mouse_pos()
+        for row, (name, details) in zip(self.row_rects, self._labels[self.offset:]):
+            color = (225, 235, 245) if row.collidepoint(mouse_pos) else (240, 240, 240)
+            pygame.draw.rect(surface, color, row, border_radius=5)
+            name_text = render_text(name, settings.BLACK, 24)
+            surface.blit(name_text, (row.x + 10, row.centery - name_text.get_height() // 2))
+            if details:
+                details_text = render_text(details, settings.GREY, 20)
+                surface.blit(details_text, (row.right - details_text.get_width() - 10,
+                                            row.centery - details_text.get_height() // 2))
+
+        if len(self.entries) > self.visible:
+            position = f"{self.offset + 1}-{self.offset + self.visible} / {len(self.entries)}"
+            position_text = render_text(position, settings.GREY, 18)
+            surface.blit(position_text, position_text.get_rect(topright=(self.rect.right - 12, self.rect.y + 24)))
+        return self.rect.inflate(2, 2)
@@ -1,8 +1,13 @@
 import os
+from typing import Dict, Optional, Tuple
+
 import pygame
 
 _ASSETS_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "assets")
 
+PIECE_TYPES = ["roi", "reine", "fou", "tour", "chevalier", "pion"]
+OWNERS = [1, 2]
+
 
 def asset_path(*parts: str) -> str:
     return os.path.join(_ASSETS_DIR, *parts)
@@ -20,3 +25,67 @@ def load_image(rel_path: str) -> pygame.Surface | None:
         return img.convert_alpha()
     except Exception:
         return None
+
+
+# Source images, loaded once per (owner, type); None if no file exists
+_piece_sources: Dict[Tuple[int, str], Optional[pygame.Surface]] = {}
+
+
+def load_piece_image(owner: int, piece_type: str) -> pygame.Surface | None:
+    """Load a piece image once: assets/blanc|noir/<type>.png, then pieces/<type>_<owner>.png, then pieces/<type>.png."""
+    key = (owner, piece_type)
+    if key not in _piece_sources:
+        owner_dir = "blanc" if owner == 1 else "noir"
+        _piece_sources[key] = (
+            load_image(f"{owner_dir}/{piece_type}.png")
+            or load_image(f"pieces/{piece_type}_{owner}.png")
+            or load_image(f"pieces/{piece_type}.png")
+        )
+    return _piece_sources[key]
+
+
+class PieceAtlas:
+    """All piece images scaled once to one size and packed into a single Surface.
+
+    One row per owner, one column per type. Pieces keep only the atlas area
+    they use, and Board draws them all with a single Surface.blits call.
+    """
+
+    def __init__(self, size: Tuple[int, int]):
+        self.size = size
+        width, height = size
+        self.surface = pygame.Surface((width * len(PIECE_TYPES), height * len(OWNERS)), pygame.SRCALPHA)
+        self.areas: Dict[Tuple[int, str], pygame.Rect] = {}
+        for row, owner in enumerate(OWNERS):
+            for col, piece_type in enumerate(PIECE_TYPES):
+                img = load_piece_image(owner, piece_type)
+                if img is None:
+                    continue
+                area = pygame.Rect(col * width, row * height, width, height)
+                # Copy the pixels as they are: an alpha blend onto the transparent atlas
+                # would darken the anti-aliased edges (RGBA_MAX over zeros is a plain copy)
+                self.surface.blit(pygame.transform.smoothscale(img, size), area,
+                                  special_flags=pygame.BLEND_RGBA_MAX)
+                self.areas[(owner, piece_type)] = area
+        if pygame.display.get_surface() is not None:
+            self.surface = self.surface.convert_alpha()  # Display format for fast blits
+
+    def area(self, owner: int, piece_type: str) -> pygame.Rect | None:
+        return self.areas.get((owner, piece_type))
+
+    def image(self, owner: int, piece_type: str) -> pygame.Surface | None:
+        """Subsurface view of one piece (shares the atlas pixels, no copy)."""
+        area = self.area(owner, piece_type)
+        return self.surface.subsurface(area) if area is not None else None
+
+
+_atlases: Dict[Tuple[int, int], PieceAtlas] = {}
+
+
+def get_piece_atlas(size: Tuple[int, int]) -> PieceAtlas:
+    """Return the shared atlas for a target piece size, building it on first use."""
+    atlas = _atlases.get(size)
+    if atlas is None:
+        atlas = PieceAtlas(size)
+        _atlases[size] = atlas
+    return atlas
@@ -0,0 +1,104 @@
+from typing import Optional, Sequence, Tuple
+
+import pygame
+
+from paddle_chess_game import settings
+
+# Logical render target: the game always draws at SCREEN_WIDTH x SCREEN_HEIGHT
+_logical: Optional[pygame.Surface] = None
+# (window surface, window size, viewport rect, viewport subsurface), rebuilt on resize
+_viewport = None
+# Set when the viewport was rebuilt: the next present() shows the whole window
+_full_present = True
+
+
+def init_display(title: str = settings.TITLE) -> pygame.Surface:
+    """Open the resizable window and return the logical surface to draw on."""
+    global _logical, _viewport, _full_present
+    size = (settings.SCREEN_WIDTH, settings.SCREEN_HEIGHT)
+    if settings.GPU_SCALING:
+        # SDL scales the window texture itself and maps mouse coordinates
+        _logical = pygame.display.set_mode(size, pygame.SCALED | pygame.RESIZABLE)
+    else:
+        window = pygame.display.set_mode(size, pygame.RESIZABLE)
+        _logical = pygame.Surface(size).convert(window)
+    pygame.display.set_caption(title)
+    _viewport = None
+    _full_present = True
+    return _logical
+
+
+def get_surface() -> Optional[pygame.Surface]:
+    """The logical surface, or None before init_display()."""
+    return _logical
+
+
+def _scaled() -> bool:
+    return _logical is not None and _logical is not pygame.display.get_surface()
+
+
+def _get_viewport() -> Tuple[pygame.Rect, pygame.Surface]:
+    """Letterboxed area of the window the logical surface maps to (cached per window size)."""
+    global _viewport, _full_present
+    window = pygame.display.get_surface()
+    size = window.get_size()
+    if _viewport is not None and _viewport[0] is window and _viewport[1] == size:
+        return _viewport[2], _viewport[3]
+
+    logical_w, logical_h = _logical.get_size()
+    scale = min(size[0] / logical_w, size[1] / logical_h)
+    width, height = max(1, int(logical_w * scale)), max(1, int(logical_h * scale))
+    rect = pygame.Rect((size[0] - width) // 2, (size[1] - height) // 2, width, height)
+    window.fill(settings.BLACK)  # Letterbox bars, drawn once per resize
+    _viewport = (window, size, rect, window.subsurface(rect))
+    _full_present = True
+    return rect, _viewport[3]
+
+
+def present(rects: Optional[Sequence[pygame.Rect]] = None):
+    """Show the logical surface: copy or scale it to the window, then update.
+
+    `rects` (logical coordinates) limits the update to those regions when the
+    window is at the logical size; a scaled window is always presented whole.
+    """
+    global _full_present
+    if not _scaled():
+        if rects is None:
+            pygame.display.flip()
+        else:
+            pygame.display.update(rects)
+        return
+
+    rect, target = _get_viewport()
+    fresh, _full_present = _full_present, False
+    if rect.size == _logical.get_size():
+        if rects is None or fresh:
+            target.blit(_logical, (0, 0))
+            pygame.display.flip()
+        else:
+            for area in rects:
+                target.blit(_logical, area, area)
+            pygame.display.update([area.move(rect.topleft) for area in rects])
+        return
+
+    # One scale straight into the window, no intermediate surface
+    pygame.transform.scale(_logical, rect.size, target)
+    if fresh:
+        pygame.display.flip()
+    else:
+        pygame.display.update(rect)
+
+
+def to_logical(pos: Tuple[int, int]) -> Tuple[int, int]:
+    """Map a window position (mouse) to logical surface coordinates."""
+    if not _scaled():
+        return pos
+    rect, _ = _get_viewport()
+    logical_w, logical_h = _logical.get_size()
+    return ((pos[0] - rect.x) * logical_w // rect.width,
+            (pos[1] - rect.y) * logical_h // rect.height)
+
+
+def get_mouse_pos() -> Tuple[int, int]:
+    """pygame.mouse.get_pos() in logical coordinates."""
+    return to_logical(pygame.mouse.get_pos())
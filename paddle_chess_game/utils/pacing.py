@@ -0,0 +1,72 @@
+import time
+
+import pygame
+
+from paddle_chess_game import settings
+
+
+class FramePacer:
+    """Replaces clock.tick(settings.FPS) in the loops.
+
+    - Active: runs on a fixed timeline at `fps`. A loop that falls behind
+      (slow draw or present) gets render_due = False for up to `max_skip`
+      frames, so the simulation keeps its rate and only drawing is shed.
+    - Idle (tick(idle=True): menus, pause, game over, waiting screens):
+      blocks in pygame.event.wait for up to 1 / idle_fps seconds, so an idle
+      menu costs no CPU. An event wakes it early; that event and any queued
+      behind it are posted back in their original order for the loop's own
+      event.get(), and the pacer stays at full rate for `wake_time` seconds
+      (typing, hover).
+    """
+
+    def __init__(self, clock: pygame.time.Clock, fps: int = settings.FPS,
+                 idle_fps: int = settings.IDLE_FPS, max_skip: int = 3, wake_time: float = 0.5):
+        self.clock = clock
+        self.interval = 1.0 / fps
+        self.idle_timeout_ms = max(1, int(1000 / idle_fps))
+        self.max_skip = max_skip
+        self.wake_time = wake_time
+        self.next_frame = time.perf_counter()
+        self.awake_until = 0.0
+        self.render_due = True
+        self.skipped = 0  # Consecutive frames not drawn
+        self.frames_skipped = 0  # Total, for the profiler/debugging
+
+    def tick(self, idle: bool = False):
+        """Wait for the next frame and decide whether it should be drawn."""
+        now = time.perf_counter()
+        if idle and now >= self.awake_until:
+            self._wait_idle()
+            return
+
+        if now < self.next_frame:
+            time.sleep(self.next_frame - now)
+            now = time.perf_counter()
+        self.clock.tick()  # Keeps clock.get_fps() meaningful
+
+        late = now - self.next_frame
+        if late > self.max_skip * self.interval:
+            # Too far behind to catch up by skipping: restart the timeline
+            self.next_frame = now
+            late = 0.0
+        self.next_frame += self.interval
+
+        if late > self.interval and self.skipped < self.max_skip:
+            self.render_due = False
+            self.skipped += 1
+            self.frames_skipped += 1
+        else:
+            self.render_due = True
+            self.skipped = 0
+
+    def _wait_idle(self):
+        event = pygame.event.wait(self.idle_timeout_ms)
+        if event.type != pygame.NOEVENT:
+            # Re-queue the woken event ahead of whatever arrived behind it
+            for queued in [event] + pygame.event.get():
+                pygame.event.post(queued)
+            self.awake_until = time.perf_counter() + self.wake_time
+        self.clock.tick()
+        self.next_frame = time.perf_counter() + self.interval
+        self.render_due = True
+        self.skipped = 0
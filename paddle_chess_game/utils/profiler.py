@@ -0,0 +1,165 @@
+import atexit
+import json
+import time
+from collections import deque
+from typing import Deque, Dict, List, Optional, Tuple
+
+import pygame
+
+from paddle_chess_game import settings
+from paddle_chess_game.utils.text import render_text
+
+PERCENTILES = (50, 95, 99)
+
+
+class FrameProfiler:
+    """Per-phase frame timings with rolling percentiles, an overlay and an optional trace.
+
+    Loops call lap("update") right after each phase (the time since the
+    previous lap is charged to it) and end_frame() once per iteration.
+    While neither the overlay nor a trace is active, both return immediately.
+    """
+
+    def __init__(self, window: int = 300, trace_path: Optional[str] = None):
+        self.window = window  # Frames kept for the percentiles
+        self.show_overlay = False
+        self.samples: Dict[str, Deque[float]] = {}  # Phase -> durations in ms, newest last
+        self.current: Dict[str, float] = {}  # Phase -> seconds spent this frame
+        self.frame_start: Optional[float] = None
+        self.last_lap: Optional[float] = None
+        self.frame_index = 0
+        self.trace_file = None
+        self.trace_csv = False
+        self._lines: List[str] = []
+        self._lines_time = 0.0
+        if trace_path:
+            self.start_trace(trace_path)
+
+    @property
+    def enabled(self) -> bool:
+        return self.show_overlay or self.trace_file is not None
+
+    def lap(self, name: str):
+        """Charge the time since the previous lap (or frame start) to `name`."""
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        if self.last_lap is not None:
+            self._add(name, now - self.last_lap)
+        self.last_lap = now
+
+    def _add(self, name: str, seconds: float):
+        self.current[name] = self.current.get(name, 0.0) + seconds
+
+    def end_frame(self):
+        """Close the current frame: fold its phases into the window and the trace."""
+        if not self.enabled:
+            self.frame_start = self.last_lap = None
+            return
+        now = time.perf_counter()
+        if self.frame_start is not None:
+            # Whole iteration, including the clock.tick() sleep
+            self.current['frame'] = now - self.frame_start
+        self.frame_start = self.last_lap = now
+
+        for name, seconds in self.current.items():
+            history = self.samples.get(name)
+            if history is None:
+                history = self.samples[name] = deque(maxlen=self.window)
+            history.append(seconds * 1000.0)
+        if self.trace_file is not None:
+            self._write_trace(now)
+        self.current = {}
+        self.frame_index += 1
+
+    # Statistics
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """Phase -> {'p50', 'p95', 'p99', 'max'} in ms over the rolling window."""
+        out = {}
+        for name, history in self.samples.items():
+            if not history:
+                continue
+            ordered = sorted(history)
+            last = len(ordered) - 1
+            stats = {f'p{p}': ordered[min(last, int(len(ordered) * p / 100))] for p in PERCENTILES}
+            stats['max'] = ordered[-1]
+            out[name] = stats
+        return out
+
+    def reset(self):
+        self.samples.clear()
+        self.current = {}
+        self.frame_start = self.last_lap = None
+
+    # Overlay
+
+    def handle_event(self, event: pygame.event.Event):
+        """F2 toggles the overlay."""
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_F2:
+            self.show_overlay = not self.show_overlay
+            if not self.show_overlay and self.trace_file is None:
+                self.reset()
+
+    def overlay_lines(self) -> List[str]:
+        # Refreshed a few times per second: readable, and keeps the text cache small
+        now = time.perf_counter()
+        if now - self._lines_time >= 0.5 or not self._lines:
+            self._lines = [f"{'phase':<10}{'p50':>7}{'p95':>7}{'p99':>7}{'max':>7}"]
+            for name, s in self.summary().items():
+                self._lines.append(f"{name:<10}{s['p50']:>7.2f}{s['p95']:>7.2f}{s['p99']:>7.2f}{s['max']:>7.2f}")
+            self._lines_time = now
+        return self._lines
+
+    def draw_overlay(self, surface: pygame.Surface, pos: Optional[Tuple[int, int]] = None) -> Optional[pygame.Rect]:
+        """Draw the timings (ms) as a translucent panel and return its area."""
+        if not self.show_overlay:
+            return None
+        lines = [render_text(line, settings.WHITE, 18, "Consolas") for line in self.overlay_lines()]
+        width = max(line.get_width() for line in lines) + 12
+        height = sum(line.get_height() for line in lines) + 12
+        panel = pygame.Surface((width, height), pygame.SRCALPHA)
+        panel.fill((0, 0, 0, 170))
+        y = 6
+        for line in lines:
+            panel.blit(line, (6, y))
+            y += line.get_height()
+        if pos is None:
+            pos = (surface.get_width() - width - 10, settings.NAVBAR_HEIGHT + 10)
+        return surface.blit(panel, pos)
+
+    # Trace
+
+    def start_trace(self, path: str):
+        """Write every frame's phases to `path` (.csv: frame,time,phase,ms rows; else JSON lines)."""
+        self.stop_trace()
+        try:
+            self.trace_file = open(path, 'w', encoding='utf-8', newline='')
+        except OSError as e:
+            print(f"Could not open profiler trace {path}: {e}")
+            return
+        self.trace_csv = path.lower().endswith('.csv')
+        if self.trace_csv:
+            self.trace_file.write("frame,time,phase,ms\n")
+        print(f"Writing frame trace to {path}")
+
+    def _write_trace(self, now: float):
+        if self.trace_csv:
+            self.trace_file.writelines(f"{self.frame_index},{now:.6f},{name},{seconds * 1000.0:.4f}\n"
+                                       for name, seconds in self.current.items())
+        else:
+            phases = {name: round(seconds * 1000.0, 4) for name, seconds in self.current.items()}
+            self.trace_file.write(json.dumps({'frame': self.frame_index, 'time': round(now, 6), 'ms': phases}) + "\n")
+
+    def stop_trace(self):
+        if self.trace_file is not None:
+            self.trace_file.close()
+            self.trace_file = None
+
+
+_profiler = FrameProfiler(trace_path=settings.PROFILE_TRACE)
+atexit.register(_profiler.stop_trace)
+
+
+def get_profiler() -> FrameProfiler:
+    return _profiler
@@ -0,0 +1,68 @@
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+import pygame
+
+# Process-wide font registry: SysFont lookups are slow, so each font is built once
+_fonts: Dict[Tuple[Optional[str], int, bool], pygame.font.Font] = {}
+
+
+def get_font(name: Optional[str], size: int, bold: bool = False) -> pygame.font.Font:
+    """Return the shared Font for (name, size, bold), creating it on first use."""
+    key = (name, size, bold)
+    font = _fonts.get(key)
+    if font is None:
+        font = pygame.font.SysFont(name, size, bold=bold)
+        _fonts[key] = font
+    return font
+
+
+class TextCache:
+    """LRU cache of rendered text surfaces, bounded by an estimated byte budget."""
+
+    def __init__(self, max_bytes: int = 4 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.entries: "OrderedDict[tuple, pygame.Surface]" = OrderedDict()
+        self.used_bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _cost(surface: pygame.Surface) -> int:
+        return surface.get_width() * surface.get_height() * surface.get_bytesize()
+
+    def render(self, text: str, color, size: int, name: Optional[str] = None,
+               bold: bool = False, antialias: bool = True) -> pygame.Surface:
+        key = (name, size, bold, text, tuple(color), antialias)
+        surface = self.entries.get(key)
+        if surface is not None:
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        surface = get_font(name, size, bold).render(text, antialias, color)
+        self.entries[key] = surface
+        self.used_bytes += self._cost(surface)
+        # Evict least recently used, but always keep the surface just rendered
+        while self.used_bytes > self.max_bytes and len(self.entries) > 1:
+            _, evicted = self.entries.popitem(last=False)
+            self.used_bytes -= self._cost(evicted)
+        return surface
+
+    def clear(self):
+        self.entries.clear()
+        self.used_bytes = 0
+
+
+_text_cache = TextCache()
+
+
+def render_text(text: str, color, size: int, name: Optional[str] = None,
+                bold: bool = False, antialias: bool = True) -> pygame.Surface:
+    """Render text through the shared cache. The returned surface must not be modified."""
+    return _text_cache.render(text, color, size, name, bold, antialias)
+
+
+def get_text_cache() -> TextCache:
+    return _text_cache